@@ -1,75 +1,50 @@
-from flask import Flask, jsonify, request
+from flask import Flask, jsonify, request, g
 from flask_cors import CORS
 import pandas as pd
 import numpy as np
 from sklearn.preprocessing import StandardScaler
 from sklearn.cluster import KMeans
 from datetime import datetime
+import hmac
 import os
 from models import FDRate, get_db, engine, Base
-from sqlalchemy.orm import Session
+from rate_store import import_rates_csv
+from run_report import load_run_report
+from profiling import start_profile
 from sqlalchemy import func
-from config import DB_CONFIG
+from config import DB_CONFIG, ADMIN_TOKEN, PROFILING_CONFIG
 
 app = Flask(__name__)
 CORS(app)
 
-def import_latest_csv_to_db():
-    # Create tables if they don't exist
-    Base.metadata.create_all(bind=engine)
-    
-    # Get the latest CSV file
-    data_dir = 'data'
-    csv_files = [f for f in os.listdir(data_dir) if f.endswith('.csv')]
-    if not csv_files:
-        print("No CSV files found in data directory")
-        return False
-    
-    latest_file = max(csv_files, key=lambda x: os.path.getctime(os.path.join(data_dir, x)))
-    print(f"Importing data from {latest_file}")
-    
-    # Read CSV file
-    df = pd.read_csv(os.path.join(data_dir, latest_file))
-    
-    # Create database session
-    Session = Session(bind=engine)
-    session = Session()
-    
-    try:
-        # Convert DataFrame to list of dictionaries
-        records = df.to_dict('records')
-        
-        # Insert or update records
-        for record in records:
-            # Create FDRate instance
-            fd_rate = FDRate(
-                bank=record['bank'],
-                tenure_description=record['tenure_description'],
-                min_days=record['min_days'],
-                max_days=record['max_days'],
-                regular_rate=record['regular_rate'],
-                senior_rate=record['senior_rate'],
-                category=record['category'],
-                region=record.get('region'),
-                currency=record.get('currency'),
-                is_tax_saving=record.get('is_tax_saving', False),
-                is_special_rate=record.get('is_special_rate', False)
-            )
-            
-            # Merge (insert or update) the record
-            session.merge(fd_rate)
-        
-        # Commit the changes
-        session.commit()
-        print(f"Successfully imported {len(records)} records")
-        return True
-        
-    except Exception as e:
-        print(f"Error importing data: {str(e)}")
-        session.rollback()
-        return False
-    finally:
-        session.close()
+@app.before_request
+def start_request_profile():
+    # Opt-in: every request when PROFILE_REQUESTS is set, or an admin's request with ?profile=1.
+    # Without ADMIN_TOKEN nobody is an admin, so ?profile=1 is ignored rather than open to anyone.
+    if PROFILING_CONFIG['requests']:
+        g.profile = start_profile('request', request.endpoint)
+    elif request.args.get('profile') == '1':
+        if is_admin():
+            g.profile = start_profile('request', request.endpoint)
+        else:
+            print(f"Ignoring ?profile=1 on {request.path}: admin token missing or not configured")
+
+@app.after_request
+def stop_request_profile(response):
+    profile = g.pop('profile', None)
+    if profile:
+        path = profile.stop()
+        # Profile file names are only reported back to admins
+        if path and is_admin():
+            response.headers['X-Profile'] = os.path.basename(path)
+    return response
+
+@app.teardown_request
+def discard_request_profile(error):
+    # after_request doesn't run when the view raised
+    profile = g.pop('profile', None)
+    if profile:
+        profile.stop()
 
 @app.route('/api/fd-rates', methods=['GET'])
 def get_fd_rates():
@@ -205,26 +180,34 @@ def run_scraper():
     try:
         # Import scraper at runtime to avoid circular imports
         from scraper import run_all_scrapers
-        data = run_all_scrapers()
+
+        # Optional time budget in seconds; banks still running when it is spent are abandoned
+        options = request.get_json(silent=True) or {}
+        deadline = options.get('deadline')
+        if deadline is not None:
+            try:
+                deadline = float(deadline)
+            except (TypeError, ValueError):
+                deadline = 0
+            # Omit deadline for an unbounded run; 0 would otherwise silently mean the same
+            if not deadline > 0:
+                return jsonify({'success': False, 'message': 'deadline must be a positive number of seconds'}), 400
+        summary = run_all_scrapers(deadline=deadline)
+        bank_status = summary['bank_status']
         
-        if data:
-            # Import the scraped data
-            success = import_latest_csv_to_db()
-            if success:
-                return jsonify({
-                    'success': True,
-                    'message': f'Successfully scraped and imported {len(data)} records',
-                    'count': len(data)
-                })
-            else:
-                return jsonify({
-                    'success': False,
-                    'message': 'Failed to import scraped data'
-                }), 500
+        if summary['rows']:
+            # Each bank's rates were already written to the database as it finished
+            return jsonify({
+                'success': True,
+                'message': f"Successfully scraped and imported {summary['rows']} records",
+                'count': summary['rows'],
+                'bank_status': bank_status
+            })
         else:
             return jsonify({
                 'success': False,
-                'message': 'No data was scraped'
+                'message': 'No data was scraped',
+                'bank_status': bank_status
             })
     except Exception as e:
         return jsonify({
@@ -245,25 +228,46 @@ def import_csv():
         if not file.filename.endswith('.csv'):
             return jsonify({"error": "File must be a CSV"}), 400
             
-        # Save the file temporarily
-        temp_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "temp.csv")
-        file.save(temp_path)
-        
-        # Read and import the data
-        df = pd.read_csv(temp_path)
-        success = import_latest_csv_to_db()
-        
-        # Clean up
-        os.remove(temp_path)
-        
-        if success:
-            return jsonify({"message": "Data imported successfully"})
-        else:
-            return jsonify({"error": "Failed to import data"}), 500
+        # Stream the upload into the database in bounded chunks
+        Base.metadata.create_all(bind=engine)
+        try:
+            totals = import_rates_csv(file.stream)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        print(f"Imported {totals['rows']} CSV rows in {totals['seconds']:.2f}s: {totals['inserted']} inserted, "
+              f"{totals['updated']} updated, {totals['unchanged']} unchanged, {totals['rejected']} rejected")
+        return jsonify(dict(totals, message="Data imported successfully"))
             
     except Exception as e:
         print(f"Error importing CSV: {str(e)}")
         return jsonify({"error": str(e)}), 500
 
+def is_admin():
+    """Whether the request carries the admin token; never true when no token is configured"""
+    if not ADMIN_TOKEN:
+        return False
+    return hmac.compare_digest(request.headers.get('X-Admin-Token', ''), ADMIN_TOKEN)
+
+@app.route('/api/admin/run-report', methods=['GET'])
+def run_report():
+    if not ADMIN_TOKEN:
+        return jsonify({"error": "Admin endpoints are disabled; set ADMIN_TOKEN to enable them"}), 404
+    if not is_admin():
+        return jsonify({"error": "Admin token required"}), 403
+
+    # Latest run unless a date (YYYY-MM-DD) is given
+    date = request.args.get('date')
+    if date:
+        try:
+            date = datetime.strptime(date, '%Y-%m-%d').strftime('%Y-%m-%d')
+        except ValueError:
+            return jsonify({"error": "date must be YYYY-MM-DD"}), 400
+
+    report = load_run_report('data', date)
+    if report is None:
+        return jsonify({"error": "No run report found"}), 404
+    return jsonify(report)
+
 if __name__ == '__main__':
     app.run(debug=True, port=5000) 
\ No newline at end of file
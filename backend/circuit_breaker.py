@@ -0,0 +1,94 @@
+import logging
+import time
+from state_store import JsonStateStore, ProcessSingleton
+from config import CIRCUIT_BREAKER_CONFIG
+
+logger = logging.getLogger(__name__)
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+class CircuitBreaker(JsonStateStore):
+    """Per-bank circuit breaker persisted between runs.
+
+    A bank's circuit opens after ``failure_threshold`` consecutive failed
+    runs. While open the bank is not scraped and its last-known-good
+    records are served instead. Once ``cooldown_seconds`` have passed one
+    half-open probe run is allowed: success closes the circuit, failure
+    opens it for another cooldown.
+    """
+
+    description = 'circuit breaker state'
+
+    def __init__(self, path=None, failure_threshold=None, cooldown_seconds=None):
+        super().__init__(path or CIRCUIT_BREAKER_CONFIG['path'])
+        self.failure_threshold = failure_threshold or CIRCUIT_BREAKER_CONFIG['failure_threshold']
+        self.cooldown_seconds = cooldown_seconds if cooldown_seconds is not None else CIRCUIT_BREAKER_CONFIG['cooldown_seconds']
+
+    def _entry(self, bank):
+        return self._data.setdefault(bank, {
+            'state': CLOSED,
+            'failures': 0,
+            'opened_at': None,
+            'last_good_records': [],
+            'last_good_date': None
+        })
+
+    def state(self, bank):
+        with self._lock:
+            entry = self._data.get(bank)
+            return entry['state'] if entry else CLOSED
+
+    def allow(self, bank):
+        """Whether the bank should be scraped now; moves an open circuit past its cooldown to half-open"""
+        with self._lock:
+            entry = self._entry(bank)
+            if entry['state'] != OPEN:
+                return True
+            if time.time() - entry['opened_at'] < self.cooldown_seconds:
+                return False
+            entry['state'] = HALF_OPEN
+            self._save()
+            logger.info(f"Circuit for {bank} is half-open, probing")
+            return True
+
+    def last_good(self, bank):
+        """Copies of the bank's last-known-good records stamped with the date they were scraped"""
+        with self._lock:
+            entry = self._data.get(bank)
+            if not entry:
+                return []
+            return [dict(record, scraped_date=entry['last_good_date']) for record in entry['last_good_records']]
+
+    def record_success(self, bank, records, scraped_date):
+        with self._lock:
+            entry = self._entry(bank)
+            if entry['state'] != CLOSED:
+                logger.info(f"Circuit for {bank} closed")
+            entry.update(state=CLOSED, failures=0, opened_at=None,
+                         last_good_records=[dict(record) for record in records],
+                         last_good_date=scraped_date)
+            self._save()
+
+    def record_failure(self, bank):
+        with self._lock:
+            entry = self._entry(bank)
+            # A late failure from a scrape abandoned before the circuit opened mustn't restart the cooldown
+            if entry['state'] == OPEN:
+                return
+            entry['failures'] += 1
+            if entry['state'] == HALF_OPEN or entry['failures'] >= self.failure_threshold:
+                entry['state'] = OPEN
+                entry['opened_at'] = time.time()
+                logger.warning(f"Circuit for {bank} opened after {entry['failures']} failures, "
+                               f"skipping it for {self.cooldown_seconds}s")
+            self._save()
+
+_breaker = ProcessSingleton(CircuitBreaker)
+
+def get_circuit_breaker():
+    """Return the process-wide circuit breaker, or None when it is disabled"""
+    if not CIRCUIT_BREAKER_CONFIG['enabled']:
+        return None
+    return _breaker.get()
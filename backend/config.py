@@ -13,4 +13,118 @@ DB_CONFIG = {
 }
 
 # Database URL for SQLAlchemy
-DATABASE_URL = f"postgresql://{DB_CONFIG['user']}:{DB_CONFIG['password']}@{DB_CONFIG['host']}:{DB_CONFIG['port']}/{DB_CONFIG['database']}" 
\ No newline at end of file
+DATABASE_URL = os.getenv('DATABASE_URL', f"postgresql://{DB_CONFIG['user']}:{DB_CONFIG['password']}@{DB_CONFIG['host']}:{DB_CONFIG['port']}/{DB_CONFIG['database']}")
+
+# Rows per executemany batch when bulk-writing rates
+DB_WRITE_BATCH_SIZE = int(os.getenv('DB_WRITE_BATCH_SIZE', '1000'))
+
+# Rows read per chunk when importing an uploaded rates CSV
+IMPORT_CHUNK_ROWS = int(os.getenv('IMPORT_CHUNK_ROWS', '20000'))
+
+# Directory for scraper state (caches, run reports); CSV output still goes to ./data
+DATA_DIR = os.getenv('SCRAPER_DATA_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data'))
+
+# HTTP fetch layer used by the scrapers
+FETCH_CONFIG = {
+    'max_connections': int(os.getenv('FETCH_MAX_CONNECTIONS', '50')),
+    'max_connections_per_host': int(os.getenv('FETCH_MAX_CONNECTIONS_PER_HOST', '4')),
+    'dns_cache_ttl': int(os.getenv('FETCH_DNS_CACHE_TTL', '300')),
+    'keepalive_timeout': int(os.getenv('FETCH_KEEPALIVE_TIMEOUT', '30')),
+    # Adaptive per-host limit: starts here, grows on fast successes up to max_connections_per_host
+    # and halves on errors or responses slower than slow_response_seconds
+    'initial_connections_per_host': int(os.getenv('FETCH_INITIAL_CONNECTIONS_PER_HOST', '2')),
+    'slow_response_seconds': float(os.getenv('FETCH_SLOW_RESPONSE_SECONDS', '5'))
+}
+
+# Headless Chrome pool used by the Selenium scrapers
+SELENIUM_CONFIG = {
+    'pool_size': int(os.getenv('SELENIUM_POOL_SIZE', '2')),
+    'max_pages_per_driver': int(os.getenv('SELENIUM_MAX_PAGES_PER_DRIVER', '25')),
+    'page_load_strategy': os.getenv('SELENIUM_PAGE_LOAD_STRATEGY', 'eager'),
+    'block_resources': os.getenv('SELENIUM_BLOCK_RESOURCES', 'true').lower() == 'true',
+    'ready_mode': os.getenv('SELENIUM_READY_MODE', 'table'),
+    # Seconds a scrape waits for a free browser before giving up
+    'lease_timeout': float(os.getenv('SELENIUM_LEASE_TIMEOUT', '120'))
+}
+
+# Separately sized worker tiers so slow browser scrapes can't starve the cheap HTTP ones
+SCRAPER_TIERS_CONFIG = {
+    'http_workers': int(os.getenv('SCRAPER_HTTP_WORKERS', '8')),
+    'browser_workers': int(os.getenv('SCRAPER_BROWSER_WORKERS', str(SELENIUM_CONFIG['pool_size']))),
+    # Time budget for a whole run and for any one bank; 0 disables the limit
+    'deadline_seconds': float(os.getenv('SCRAPE_DEADLINE_SECONDS', '300')),
+    'bank_timeout_seconds': float(os.getenv('SCRAPE_BANK_TIMEOUT_SECONDS', '120'))
+}
+
+# Conditional-GET cache for bank rate pages
+HTTP_CACHE_CONFIG = {
+    'enabled': os.getenv('HTTP_CACHE_ENABLED', 'true').lower() == 'true',
+    'directory': os.getenv('HTTP_CACHE_DIR', os.path.join(DATA_DIR, 'http_cache'))
+}
+
+# Content-hash short-circuit for pages that come back unchanged without validators
+PAGE_HASH_CONFIG = {
+    'enabled': os.getenv('PAGE_HASH_ENABLED', 'true').lower() == 'true',
+    'path': os.getenv('PAGE_HASH_PATH', os.path.join(DATA_DIR, 'page_hashes.json'))
+}
+
+# Per-bank "winning locator" (URL, table and columns) learned from the last successful extraction
+TABLE_LOCATOR_CONFIG = {
+    'enabled': os.getenv('TABLE_LOCATOR_ENABLED', 'true').lower() == 'true',
+    'path': os.getenv('TABLE_LOCATOR_PATH', os.path.join(DATA_DIR, 'table_locators.json'))
+}
+
+# Gzipped, content-addressed archive of every fetched page with a manifest per run, for re-extraction
+PAGE_ARCHIVE_CONFIG = {
+    'enabled': os.getenv('PAGE_ARCHIVE_ENABLED', 'true').lower() == 'true',
+    'directory': os.getenv('PAGE_ARCHIVE_DIR', os.path.join(DATA_DIR, 'page_archive'))
+}
+
+# Offline record/replay of bank responses: "record" saves every fetched page and Selenium page
+# source as a fixture, "replay" serves them back without touching the network, "off" does neither
+REPLAY_CONFIG = {
+    'mode': os.getenv('SCRAPER_REPLAY', 'off').lower(),
+    'directory': os.getenv('SCRAPER_FIXTURES_DIR', os.path.join(DATA_DIR, 'fixtures')),
+    # Sleep for each response's recorded duration when replaying
+    'simulate_latency': os.getenv('SCRAPER_REPLAY_LATENCY', 'false').lower() == 'true'
+}
+
+# Token admin-only endpoints require in the X-Admin-Token header; they are disabled while it is unset
+ADMIN_TOKEN = os.getenv('ADMIN_TOKEN', '')
+
+# Opt-in sampling profiler for scraper runs and API requests; profiles of each kind are taken
+# at most once per min_interval_seconds and saved as collapsed stacks under directory
+PROFILING_CONFIG = {
+    'scraper': os.getenv('PROFILE_SCRAPER', 'false').lower() == 'true',
+    'requests': os.getenv('PROFILE_REQUESTS', 'false').lower() == 'true',
+    'directory': os.getenv('PROFILE_DIR', os.path.join(DATA_DIR, 'profiles')),
+    'interval_ms': float(os.getenv('PROFILE_INTERVAL_MS', '5')),
+    'min_interval_seconds': int(os.getenv('PROFILE_MIN_INTERVAL', '600'))
+}
+
+# Processes that parse pages and extract records while threads keep fetching; 0 parses in the fetching thread.
+# By default no more than the cores, the bank threads that can be parsing at once, or a small cap, since each
+# worker is a separate Python process that imports the parsing modules (about 30 MB and 0.1s each).
+PARSE_POOL_CONFIG = {
+    'processes': int(os.getenv('PARSE_PROCESSES', str(min(
+        os.cpu_count() or 1,
+        SCRAPER_TIERS_CONFIG['http_workers'] + SCRAPER_TIERS_CONFIG['browser_workers'],
+        4
+    ))))
+}
+
+# Per-bank circuit breaker: after failure_threshold failed runs a bank is skipped (serving its
+# last-known-good records as stale) until cooldown_seconds have passed and a probe run succeeds
+CIRCUIT_BREAKER_CONFIG = {
+    'enabled': os.getenv('CIRCUIT_BREAKER_ENABLED', 'true').lower() == 'true',
+    'path': os.getenv('CIRCUIT_BREAKER_PATH', os.path.join(DATA_DIR, 'circuit_breakers.json')),
+    'failure_threshold': int(os.getenv('CIRCUIT_BREAKER_FAILURES', '3')),
+    'cooldown_seconds': int(os.getenv('CIRCUIT_BREAKER_COOLDOWN', '3600'))
+}
+
+# BeautifulSoup backend for the table-only extractors (full-document ones use html.parser);
+# "partial" parses only table/heading subtrees where extraction allows it
+PARSER_CONFIG = {
+    'backend': os.getenv('HTML_PARSER', 'lxml'),
+    'partial': os.getenv('HTML_PARTIAL_PARSE', 'true').lower() == 'true'
+}
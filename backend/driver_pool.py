@@ -0,0 +1,188 @@
+import logging
+import os
+import queue
+import signal
+import threading
+import time
+from contextlib import contextmanager
+from selenium.common.exceptions import WebDriverException
+from state_store import ProcessSingleton
+from config import SELENIUM_CONFIG
+
+logger = logging.getLogger(__name__)
+
+class DriverPool:
+    """Bounded pool of long-lived WebDriver instances.
+
+    Drivers are created lazily up to ``size`` and handed out one caller at a
+    time. Each one is recycled after ``max_pages`` page loads or as soon as a
+    health check fails, so a crashed or bloated Chrome never gets reused.
+    """
+
+    def __init__(self, factory, size=None, max_pages=None, lease_timeout=None):
+        self.factory = factory
+        self.size = size or SELENIUM_CONFIG['pool_size']
+        self.max_pages = max_pages or SELENIUM_CONFIG['max_pages_per_driver']
+        self.lease_timeout = lease_timeout or SELENIUM_CONFIG['lease_timeout']
+        self._idle = queue.LifoQueue()  # Most recently used driver first, it is the warmest
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._page_counts = {}
+        self._leases = {}  # thread id -> driver it is currently holding
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def is_healthy(self, driver):
+        """Check that the browser session still responds"""
+        try:
+            driver.execute_script('return 1')
+            return True
+        except Exception:
+            return False
+
+    def _checkout(self):
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                driver = self.factory()
+                with self._lock:
+                    self._page_counts[id(driver)] = 0
+                return driver
+
+            if self.is_healthy(driver):
+                return driver
+            logger.warning("Discarding unresponsive pooled driver")
+            self._discard(driver)
+
+    def _checkin(self, driver):
+        with self._lock:
+            self._page_counts[id(driver)] = self._page_counts.get(id(driver), 0) + 1
+            pages = self._page_counts[id(driver)]
+
+        if self._closed or pages >= self.max_pages or not self.is_healthy(driver):
+            self._discard(driver)
+            return
+
+        try:
+            # Reuse the first tab for the next page and drop anything the site opened
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+            driver.delete_all_cookies()
+            driver.get('about:blank')
+        except WebDriverException as e:
+            logger.warning(f"Failed to reset pooled driver: {str(e)}")
+            self._discard(driver)
+            return
+
+        self._idle.put(driver)
+
+    def _discard(self, driver):
+        with self._lock:
+            self._page_counts.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    @contextmanager
+    def lease(self, timeout=None):
+        """Borrow a driver for the duration of a ``with`` block, waiting at most ``timeout`` seconds for one"""
+        timeout = self.lease_timeout if timeout is None else timeout
+        if not self._slots.acquire(timeout=timeout):
+            raise TimeoutError(f"No browser became available within {timeout}s")
+
+        driver = None
+        try:
+            driver = self._checkout()
+            with self._lock:
+                self._leases[threading.get_ident()] = driver
+            yield driver
+        except Exception:
+            if driver is not None:
+                if self.is_healthy(driver):
+                    self._checkin(driver)
+                else:
+                    self._discard(driver)
+            raise
+        else:
+            self._checkin(driver)
+        finally:
+            with self._lock:
+                self._leases.pop(threading.get_ident(), None)
+            self._slots.release()
+
+    def kill_leased(self, thread_id, quit_timeout=5):
+        """Kill the browser a thread is holding so a hung scrape fails fast; returns whether one was found.
+
+        The driver is asked to quit from a helper thread (a hung session may
+        never answer), then chromedriver and the Chrome processes it started
+        are killed. The lease then sees an unhealthy driver and discards it.
+        """
+        with self._lock:
+            driver = self._leases.get(thread_id)
+        if driver is None:
+            return False
+
+        quitter = threading.Thread(target=self._discard, args=(driver,), daemon=True)
+        quitter.start()
+        quitter.join(quit_timeout)
+        try:
+            service = driver.service
+            kill_process_tree(service.process, getattr(service, 'popen_kw', {}).get('start_new_session', False))
+        except Exception as e:
+            logger.warning(f"Failed to kill chromedriver: {str(e)}")
+        return True
+
+    def close(self):
+        """Quit every idle driver; leased drivers are quit when they are returned"""
+        self._closed = True
+        while True:
+            try:
+                self._discard(self._idle.get_nowait())
+            except queue.Empty:
+                break
+
+def kill_process_tree(process, own_group=False):
+    """Kill a chromedriver process and the browsers it started.
+
+    With own_group, chromedriver was started as the leader of its own
+    process group (see setup_selenium_driver), which Chrome and its
+    renderers inherit, so the whole group is killed and checked for
+    survivors. Otherwise only chromedriver itself can be killed.
+    """
+    if process is None:
+        return
+    if not (own_group and hasattr(os, 'killpg')):
+        if process.poll() is None:
+            process.kill()
+        return
+
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        return
+    process.wait(timeout=5)
+    # Killed browsers are reaped by init, which can take a moment
+    for _ in range(20):
+        try:
+            os.killpg(process.pid, 0)
+        except ProcessLookupError:
+            return
+        time.sleep(0.05)
+    logger.warning(f"Browser processes of chromedriver {process.pid} survived the kill")
+
+_pool = ProcessSingleton(DriverPool, close=DriverPool.close)
+
+def get_driver_pool(factory):
+    """Return the process-wide driver pool, creating it with ``factory`` on first use"""
+    return _pool.get(factory)
+
+def kill_thread_driver(thread_id):
+    """Kill the browser held by a thread, if the pool exists and the thread holds one"""
+    pool = _pool.peek()
+    if pool is None:
+        return False
+    return pool.kill_leased(thread_id)
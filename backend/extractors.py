@@ -0,0 +1,815 @@
+import logging
+import re
+import threading
+import time
+from bs4 import BeautifulSoup, SoupStrainer, FeatureNotFound
+from table_locators import table_fingerprint
+from table_matrix import TableMatrix
+from tenure import extract_tenure_days
+from config import PARSER_CONFIG
+
+logger = logging.getLogger(__name__)
+
+# Headings that announce an FD rate table
+RATE_HEADING_RE = re.compile(r'fixed deposit|fd|interest rate|deposit rate', re.I)
+HEADING_TAGS = ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']
+
+# Priority added to a table for each hint that it holds FD rates
+HEADING_SCORE = 2
+CLASS_SCORE = 1
+
+def _in_rate_container(table, class_keywords):
+    """Whether any div/section enclosing the table has a class containing one of the keywords"""
+    for parent in table.parents:
+        if parent.name in ('div', 'section'):
+            for css_class in parent.get('class') or []:
+                css_class = css_class.lower()
+                if any(keyword in css_class for keyword in class_keywords):
+                    return True
+    return False
+
+def find_relevant_tables(soup, class_keywords):
+    """Find tables that might contain FD rates, each once and most likely first.
+
+    Tables and headings are walked once in document order. The first table
+    after an FD rate heading and tables inside a div/section whose class
+    matches a keyword score higher; ties keep document order.
+    """
+    class_keywords = [keyword.lower() for keyword in class_keywords]
+    candidates = []
+    after_heading = False
+
+    for position, element in enumerate(soup.find_all(['table'] + HEADING_TAGS)):
+        if element.name != 'table':
+            if RATE_HEADING_RE.search(element.get_text()):
+                after_heading = True
+            continue
+
+        score = 0
+        if after_heading:
+            score += HEADING_SCORE
+            after_heading = False
+        if class_keywords and _in_rate_container(element, class_keywords):
+            score += CLASS_SCORE
+        candidates.append((-score, position, element))
+
+    candidates.sort(key=lambda candidate: candidate[:2])
+    return [table for _, _, table in candidates]
+
+def _resolve_parser(name):
+    """Fall back to the pure-Python parser when the configured one is not installed"""
+    try:
+        BeautifulSoup('', name)
+        return name
+    except FeatureNotFound:
+        logger.warning(f"HTML parser '{name}' is not available, falling back to html.parser")
+        return 'html.parser'
+
+HTML_PARSER = _resolve_parser(PARSER_CONFIG['backend'])
+
+# Extractors that walk the whole document (rate containers, headings, nested divs) keep the
+# parser they were written against; lxml repairs malformed markup into a different tree
+FULL_SOUP_PARSER = 'html.parser'
+
+# Extractors that only look at tables (and the headings before them) parse just these subtrees
+RATE_TABLE_STRAINER = SoupStrainer(['table', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+
+# Seconds the current thread has spent building soups, for the parse phase of the run report
+_parse_timer = threading.local()
+
+def make_soup(html_content, parse_only=None, parser=None):
+    """Build a soup with parser (the configured one by default), optionally keeping only the subtrees in parse_only"""
+    if not PARSER_CONFIG['partial']:
+        parse_only = None
+    start = time.perf_counter()
+    soup = BeautifulSoup(html_content, parser or HTML_PARSER, parse_only=parse_only)
+    _parse_timer.seconds = getattr(_parse_timer, 'seconds', 0.0) + time.perf_counter() - start
+    return soup
+
+def clean_rate_text(rate_text):
+    """Clean and validate rate text"""
+    if not rate_text or not isinstance(rate_text, str):
+        return None
+
+    # Remove percentage and whitespace
+    rate_text = rate_text.strip().replace('%', '')
+
+    # Try to convert to float
+    try:
+        rate = float(rate_text)
+        return rate if rate > 0 and rate < 100 else None
+    except ValueError:
+        return None
+
+def read_table_locator(matrix, locator):
+    """Read FD rate records from a table using a locator's header row and column indices"""
+    tenure_col = locator['tenure_column']
+    regular_col = locator['regular_column']
+    senior_col = locator['senior_column']
+    results = []
+
+    for cells in matrix.rows[locator['header_row'] + 1:]:
+        if tenure_col >= len(cells) or len(cells[tenure_col]) < 3:
+            continue
+        tenure = cells[tenure_col]
+
+        regular_rate = clean_rate_text(cells[regular_col]) if regular_col is not None and regular_col < len(cells) else None
+        senior_rate = clean_rate_text(cells[senior_col]) if senior_col is not None and senior_col < len(cells) else None
+        if regular_rate is None and locator['require_rate']:
+            continue
+
+        tenure_days = extract_tenure_days(tenure)
+        if tenure_days['min_days'] is not None and tenure_days['max_days'] is not None:
+            results.append({
+                'tenure_description': tenure,
+                'min_days': tenure_days['min_days'],
+                'max_days': tenure_days['max_days'],
+                'regular_rate': regular_rate,
+                'senior_rate': senior_rate,
+                'category': 'General'
+            })
+
+    return results
+
+def apply_table_locator(html_content, locator):
+    """Extract records with a cached locator, or return None when its table can't be validated.
+
+    The table at the cached index is used if its fingerprint still matches,
+    otherwise any table with that fingerprint (e.g. after a banner table was
+    added above it).
+    """
+    tables = make_soup(html_content, RATE_TABLE_STRAINER).find_all('table')
+    index = locator['table_index']
+    order = ([index] if index < len(tables) else []) + [i for i in range(len(tables)) if i != index]
+
+    for i in order:
+        matrix = TableMatrix.from_table(tables[i])
+        if len(matrix) > locator['header_row'] + 1 and \
+                table_fingerprint(matrix, locator['header_row'], locator['tenure_column']) == locator['fingerprint']:
+            return read_table_locator(matrix, locator) or None
+    return None
+
+def _columns_matching(cells, rate, exclude):
+    """Columns whose cleaned value equals rate, plus None (no column) when rate is missing"""
+    columns = [i for i, text in enumerate(cells) if i != exclude and clean_rate_text(text) == rate]
+    return columns + [None] if rate is None else columns
+
+def learn_table_locator(url, html_content, records):
+    """Find the table, header row and columns that reproduce records exactly.
+
+    Returns a URL-only locator when the records don't come from a single
+    table with fixed columns (several tables, per-row column guesses).
+    """
+    locator = {'url': url}
+    first = records[0]
+    tables = make_soup(html_content, RATE_TABLE_STRAINER).find_all('table')
+
+    for table_index, table in enumerate(tables):
+        matrix = TableMatrix.from_table(table)
+
+        for row_index, cells in enumerate(matrix.rows):
+            if first['tenure_description'] not in cells:
+                continue
+            tenure_col = cells.index(first['tenure_description'])
+
+            for regular_col in _columns_matching(cells, first['regular_rate'], tenure_col):
+                for senior_col in _columns_matching(cells, first['senior_rate'], tenure_col):
+                    for require_rate in (True, False):
+                        candidate = {
+                            'url': url,
+                            'table_index': table_index,
+                            'header_row': row_index - 1,
+                            'tenure_column': tenure_col,
+                            'regular_column': regular_col,
+                            'senior_column': senior_col,
+                            'require_rate': require_rate
+                        }
+                        if read_table_locator(matrix, candidate) == records:
+                            candidate['fingerprint'] = table_fingerprint(matrix, row_index - 1, tenure_col)
+                            return candidate
+
+    return locator
+
+def extract_records(extract, url, html_content, locator=None, learn=False):
+    """Parse a page and extract its records; runs in a parser process.
+
+    A cached locator is tried first. Otherwise the full extractor runs and,
+    if learn is set, a new locator is learned from its records. Returns
+    (records, learned_locator, timings), where learned_locator is None when
+    the cached locator matched or nothing was learned and timings splits
+    the time spent into parse (building soups) and extract (the rest).
+    """
+    start = time.perf_counter()
+    _parse_timer.seconds = 0.0
+
+    def timings():
+        parse = _parse_timer.seconds
+        return {'parse': parse, 'extract': max(0.0, time.perf_counter() - start - parse)}
+
+    if locator:
+        results = apply_table_locator(html_content, locator)
+        if results:
+            return results, None, timings()
+
+    results = extract(html_content)
+    learned = learn_table_locator(url, html_content, results) if results and learn else None
+    return results, learned, timings()
+
+def extract_icici_rates(html_content):
+    """Extract FD rates from an ICICI Bank page"""
+    soup = make_soup(html_content, RATE_TABLE_STRAINER)
+
+    # Look for the FD rates table
+    tables = soup.find_all('table')
+    print(f"Found {len(tables)} tables on ICICI Bank page")
+
+    results = []
+
+    for idx, table in enumerate(tables):
+        matrix = TableMatrix.from_table(table)
+
+        # Check if this table contains FD rates
+        headers = matrix.header_cells
+
+        if any('tenure' in h for h in headers) or any('period' in h for h in headers):
+            # Extract rows
+            for cells in matrix.rows[1:]:  # Skip header row
+                if len(cells) >= 2:
+                    tenure = cells[0]
+
+                    # Skip header or empty rows
+                    if len(tenure) < 3 or 'tenure' in tenure.lower():
+                        continue
+
+                    regular_rate = clean_rate_text(cells[1])
+
+                    # Check if senior citizen rate is available
+                    senior_rate = None
+                    if len(cells) >= 3:
+                        senior_rate = clean_rate_text(cells[2])
+
+                    # Extract min and max days from tenure
+                    tenure_days = extract_tenure_days(tenure)
+
+                    if tenure_days['min_days'] is not None and tenure_days['max_days'] is not None:
+                        fd_data = {
+                            'tenure_description': tenure,
+                            'min_days': tenure_days['min_days'],
+                            'max_days': tenure_days['max_days'],
+                            'regular_rate': regular_rate,
+                            'senior_rate': senior_rate,
+                            'category': 'General'
+                        }
+
+                        results.append(fd_data)
+
+    return results
+
+def extract_sbi_rates(html_content):
+    """Extract FD rates from an SBI page"""
+    soup = make_soup(html_content, RATE_TABLE_STRAINER)
+
+    # Look for tables that might contain FD rates
+    tables = soup.find_all('table')
+    print(f"Found {len(tables)} tables on SBI Bank page")
+
+    results = []
+
+    # First, look for tables with relevant classes or id attributes
+    # SBI often uses specific class names for their rate tables
+    fd_keywords = ['fd', 'fixed', 'deposit', 'interest', 'rate']
+    sbi_table_classes = ['deposit-table', 'table-interest', 'table-rates', 'table-bordered']
+
+    potential_tables = []
+    for idx, table in enumerate(tables):
+        # Check class and id attributes
+        table_class = ' '.join(table.get('class', [])).lower() if table.get('class') else ''
+        table_id = table.get('id', '').lower()
+
+        # Score the table based on how likely it is to contain FD rates
+        score = 0
+
+        # Check for SBI specific table classes
+        for cls in sbi_table_classes:
+            if cls in table_class:
+                score += 5  # Higher weight for known SBI classes
+
+        # Check for general FD keywords
+        for keyword in fd_keywords:
+            if keyword in table_class or keyword in table_id:
+                score += 3
+
+        # Check if the table has a caption or heading before it that mentions FD rates
+        caption = table.find('caption')
+        caption_text = caption.text.lower() if caption else ''
+
+        if caption_text:
+            for keyword in fd_keywords:
+                if keyword in caption_text:
+                    score += 2
+
+        # Check nearby headings for relevance
+        prev_headings = table.find_all_previous(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'], limit=3)
+        for heading in prev_headings:
+            heading_text = heading.text.lower()
+            for keyword in fd_keywords:
+                if keyword in heading_text:
+                    score += 2  # More weight for headings right before the table
+
+        # Try to find header row and check content
+        matrix = TableMatrix.from_table(table)
+        header_text = ''
+
+        for row_text in matrix.row_text[:2]:
+            header_text += ' ' + row_text
+
+        if any(term in header_text for term in ['tenure', 'period', 'term', 'duration']):
+            score += 3
+        if any(term in header_text for term in ['interest', 'rate', '%', 'percentage']):
+            score += 3
+
+        potential_tables.append((idx, matrix, score))
+
+    # Sort tables by score, highest first
+    potential_tables.sort(key=lambda x: x[2], reverse=True)
+
+    # Process tables in order of likely relevance
+    for idx, matrix, score in potential_tables:
+        if score < 2:  # Skip tables that don't seem relevant at all
+            continue
+
+        print(f"Analyzing table {idx+1} (relevance score: {score})")
+
+        # Try to find the header row first
+        header_row = None
+        rows = matrix.rows
+
+        for i, row_text in enumerate(matrix.row_text[:3]):  # Check first 3 rows for headers
+            if any(term in row_text for term in ['tenure', 'period', 'term', 'days', 'months']):
+                header_row = i
+                print(f"Found header row at index {i}: {matrix.lower[i]}")
+                break
+
+        if header_row is None:
+            if not rows:
+                continue
+            # If we couldn't identify a clear header row, assume it's the first row
+            header_row = 0
+            print(f"Using first row as header: {rows[0]}")
+
+        # Check the header row once to determine which columns might have rates
+        header_rate_columns = []
+        for i, cell_text in enumerate(matrix.lower[header_row][1:], 1):  # Skip first column (tenure)
+            if any(term in cell_text for term in ['rate', '%', 'interest', 'public']):
+                header_rate_columns.append(i)
+
+        # Now process the data rows
+        data_found = False
+        for cells in rows[header_row+1:]:  # Skip the header row
+            if len(cells) < 2:  # Need at least tenure and one rate
+                continue
+
+            # First column usually has the tenure description
+            tenure = cells[0]
+
+            # Skip rows that don't look like data rows
+            if len(tenure) < 3 or not any(c.isdigit() for c in tenure):
+                continue
+
+            # Try to determine which columns have rates
+            regular_rate = None
+            senior_rate = None
+            rate_columns = header_rate_columns
+
+            # If we couldn't determine rate columns, assume they're columns 1 and possibly 2
+            if not rate_columns:
+                rate_columns = [1]
+                if len(cells) >= 3:
+                    # Check if column 2 might be for senior citizens (usually higher rates)
+                    rate_2 = clean_rate_text(cells[2])
+                    rate_1 = clean_rate_text(cells[1])
+                    if rate_2 is not None and rate_1 is not None and rate_2 > rate_1:
+                        senior_rate = rate_2
+
+            # Extract regular rate from the first identified rate column
+            if rate_columns[0] < len(cells):
+                regular_rate = clean_rate_text(cells[rate_columns[0]])
+
+            # Try to find senior rate if not already found
+            if senior_rate is None and len(cells) >= 3:
+                # Look for higher rates in other columns
+                for i in range(1, min(4, len(cells))):  # Check first few columns only
+                    if i == rate_columns[0]:  # Skip already identified regular rate
+                        continue
+
+                    rate_val = clean_rate_text(cells[i])
+                    if rate_val is not None and regular_rate is not None and rate_val > regular_rate:
+                        senior_rate = rate_val
+                        break
+
+            # If we couldn't find any valid rates, skip this row
+            if regular_rate is None:
+                continue
+
+            # We found some rate data
+            data_found = True
+
+            # Extract min and max days from tenure
+            tenure_days = extract_tenure_days(tenure)
+
+            if tenure_days['min_days'] is not None and tenure_days['max_days'] is not None:
+                fd_data = {
+                    'tenure_description': tenure,
+                    'min_days': tenure_days['min_days'],
+                    'max_days': tenure_days['max_days'],
+                    'regular_rate': regular_rate,
+                    'senior_rate': senior_rate,
+                    'category': 'General'
+                }
+                results.append(fd_data)
+
+        # If we found valid data in this table, we might be done
+        if data_found and len(results) >= 3:
+            print(f"Successfully extracted {len(results)} FD rates from table {idx+1}")
+            return results
+
+    # If we got here with some results but not enough from any single table,
+    # return what we have if it seems like enough
+    if results and len(results) >= 3:
+        print(f"Collected {len(results)} SBI Bank FD rates across tables")
+        return results
+
+    return []
+
+def extract_kotak_rates(html_content):
+    """Extract FD rates from a Kotak Mahindra Bank page"""
+    soup = make_soup(html_content, RATE_TABLE_STRAINER)
+
+    # Look for the FD rates table
+    tables = soup.find_all('table')
+    print(f"Found {len(tables)} tables on Kotak Mahindra Bank page")
+
+    results = []
+
+    for idx, table in enumerate(tables):
+        print(f"Analyzing table {idx+1}")
+        matrix = TableMatrix.from_table(table)
+        headers = []
+        if matrix.rows:
+            headers = matrix.lower[0]
+            print(f"Table {idx+1} headers: {headers}")
+
+        # Check if this table contains FD rates
+        if any('tenure' in h for h in headers) or any('period' in h for h in headers) or any('tenor' in h for h in headers):
+            print(f"Found potential FD rates table at index {idx}")
+
+            # Try to identify which column has the regular rate and which has senior rate
+            regular_col = None
+            senior_col = None
+
+            for i, h in enumerate(headers):
+                if 'regular' in h or 'general' in h or 'public' in h or 'non senior' in h:
+                    regular_col = i
+                elif 'senior' in h:
+                    senior_col = i
+
+            if regular_col is None and len(headers) >= 2:
+                regular_col = 1
+
+            if senior_col is None and len(headers) >= 3:
+                senior_col = 2
+
+            # Extract rows
+            for cells in matrix.rows[1:]:  # Skip header row
+                if len(cells) >= 2:
+                    tenure = cells[0]
+                    print(f"Processing tenure: {tenure}")
+
+                    # Skip header or empty rows
+                    if len(tenure) < 3 or 'tenure' in tenure.lower() or 'tenors' in tenure.lower():
+                        continue
+
+                    regular_rate = None
+                    if regular_col is not None and regular_col < len(cells):
+                        regular_rate = clean_rate_text(cells[regular_col])
+                        print(f"Regular rate: {regular_rate}")
+
+                    senior_rate = None
+                    if senior_col is not None and senior_col < len(cells):
+                        senior_rate = clean_rate_text(cells[senior_col])
+                        print(f"Senior rate: {senior_rate}")
+
+                    # Extract min and max days from tenure
+                    tenure_days = extract_tenure_days(tenure)
+
+                    if tenure_days['min_days'] is not None and tenure_days['max_days'] is not None:
+                        fd_data = {
+                            'tenure_description': tenure,
+                            'min_days': tenure_days['min_days'],
+                            'max_days': tenure_days['max_days'],
+                            'regular_rate': regular_rate,
+                            'senior_rate': senior_rate,
+                            'category': 'General'
+                        }
+
+                        results.append(fd_data)
+
+    return results
+
+def extract_axis_rates(html_content):
+    """Extract FD rates from an Axis Bank page"""
+    soup = make_soup(html_content, parser=FULL_SOUP_PARSER)
+
+    # Look for tables with FD rates
+    tables = soup.find_all('table')
+    print(f"Found {len(tables)} tables on Axis Bank page")
+
+    results = []
+
+    # Look for tables with relevant classes or ids
+    fd_keywords = ['fd', 'fixed', 'deposit', 'interest', 'rate']
+
+    # First pass: look for tables that have clear indicators of being FD rate tables
+    potential_tables = []
+    for idx, table in enumerate(tables):
+        # Check class and id attributes
+        table_class = ' '.join(table.get('class', [])).lower()
+        table_id = table.get('id', '').lower()
+
+        # Check if the table has a caption that mentions FD rates
+        caption = table.find('caption')
+        caption_text = caption.text.lower() if caption else ''
+
+        # Check the text content around the table for keywords
+        prev_elem = table.find_previous()
+        prev_text = prev_elem.text.lower() if prev_elem else ''
+
+        # Score the table based on how likely it is to contain FD rates
+        score = 0
+        for keyword in fd_keywords:
+            if keyword in table_class or keyword in table_id:
+                score += 3
+            if keyword in caption_text:
+                score += 2
+            if keyword in prev_text:
+                score += 1
+
+        # Additional check for Axis Bank - look for tables with specific headers
+        matrix = TableMatrix.from_table(table)
+        if matrix.rows:
+            headers_text = matrix.row_text[0]
+            if any(term in headers_text for term in ['tenure', 'period', 'duration', 'term']):
+                score += 3
+            if any(term in headers_text for term in ['rate', 'interest', '%']):
+                score += 3
+
+        potential_tables.append((idx, matrix, score))
+
+    # Sort tables by score, highest first
+    potential_tables.sort(key=lambda x: x[2], reverse=True)
+
+    # Process tables in order of likely relevance
+    for idx, matrix, score in potential_tables:
+        if score < 1:  # Skip tables that don't seem relevant
+            continue
+
+        print(f"Analyzing table {idx+1} (relevance score: {score})")
+
+        # Extract headers
+        if matrix.rows:
+            print(f"Table {idx+1} headers: {matrix.lower[0]}")
+
+        # Look for rows that might contain FD rate data
+        valid_data_found = False
+        for cells in matrix.rows[1:]:  # Skip header row
+            if len(cells) < 2:  # Need at least tenure and rate
+                continue
+
+            # Extract potential tenure from first column
+            tenure = cells[0]
+
+            # Skip rows that don't look like data rows
+            if len(tenure) < 3 or not any(c.isdigit() for c in tenure):
+                continue
+
+            print(f"Processing row with tenure: {tenure}")
+
+            # Try to extract rates from other columns
+            # For Axis, sometimes regular rate is 2nd col, sometimes it's in other columns
+            regular_rate = None
+            senior_rate = None
+
+            # Check all columns for potential rates
+            for i, rate_text in enumerate(cells[1:], 1):  # Start from index 1
+                rate_value = clean_rate_text(rate_text)
+
+                if rate_value is not None:
+                    # If we haven't found a regular rate yet, this is it
+                    if regular_rate is None:
+                        regular_rate = rate_value
+                        print(f"Regular rate found in column {i+1}: {regular_rate}")
+                    # If we already have a regular rate and this is higher, it might be senior rate
+                    elif rate_value > regular_rate and senior_rate is None:
+                        senior_rate = rate_value
+                        print(f"Senior rate found in column {i+1}: {senior_rate}")
+
+            # If we couldn't find rates, skip this row
+            if regular_rate is None:
+                continue
+
+            # If we get here, we found some rate data
+            valid_data_found = True
+
+            # Extract min and max days from tenure
+            tenure_days = extract_tenure_days(tenure)
+
+            if tenure_days['min_days'] is not None and tenure_days['max_days'] is not None:
+                fd_data = {
+                    'tenure_description': tenure,
+                    'min_days': tenure_days['min_days'],
+                    'max_days': tenure_days['max_days'],
+                    'regular_rate': regular_rate,
+                    'senior_rate': senior_rate,
+                    'category': 'General'
+                }
+                results.append(fd_data)
+
+        # If we found valid data in this table, we might be done
+        if valid_data_found:
+            print(f"Found {len(results)} valid FD rates in table {idx+1}")
+            if len(results) >= 3:  # If we found at least 3 rates, consider this a success
+                return results
+
+    # If we found some results but not enough, return what we have
+    if results and len(results) >= 2:
+        print(f"Collected {len(results)} Axis Bank FD rates from tables")
+        return results
+
+    return []
+
+def extract_heading_tables(html_content, div_classes, regular_terms):
+    """Extract FD rates from every candidate table, most likely rate tables first"""
+    soup = make_soup(html_content, parser=FULL_SOUP_PARSER)
+
+    tables = find_relevant_tables(soup, div_classes)
+    print(f"Found {len(tables)} potential tables")
+
+    results = []
+
+    for table in tables:
+        matrix = TableMatrix.from_table(table)
+
+        # Check if table contains rate information
+        headers = matrix.lower[0] if matrix.rows else []
+        header_text = matrix.row_text[0] if matrix.rows else ''
+
+        if any(term in header_text for term in
+              ['tenure', 'period', 'term', 'duration', 'days', 'months', 'years']):
+
+            # Look for rate columns based on headers
+            header_rate_col = None
+            header_senior_col = None
+
+            for i, header in enumerate(headers):
+                if any(term in header for term in regular_terms):
+                    header_rate_col = i
+                elif 'senior' in header:
+                    header_senior_col = i
+
+            for cells in matrix.rows[1:]:  # Skip header
+                if len(cells) >= 2:
+                    tenure = cells[0]
+
+                    # Skip non-data rows
+                    if len(tenure) < 3 or not any(c.isdigit() for c in tenure):
+                        continue
+
+                    # Try to find rate columns
+                    regular_rate = None
+                    senior_rate = None
+                    rate_col = header_rate_col
+                    senior_col = header_senior_col
+
+                    # If couldn't find specific columns, use default positions
+                    if rate_col is None:
+                        rate_col = 1
+                    if senior_col is None and len(cells) >= 3:
+                        senior_col = 2
+
+                    # Extract rates
+                    if rate_col < len(cells):
+                        regular_rate = clean_rate_text(cells[rate_col])
+
+                    if senior_col is not None and senior_col < len(cells):
+                        senior_rate = clean_rate_text(cells[senior_col])
+
+                    # Extract tenure days
+                    tenure_days = extract_tenure_days(tenure)
+
+                    if tenure_days['min_days'] is not None and tenure_days['max_days'] is not None:
+                        fd_data = {
+                            'tenure_description': tenure,
+                            'min_days': tenure_days['min_days'],
+                            'max_days': tenure_days['max_days'],
+                            'regular_rate': regular_rate,
+                            'senior_rate': senior_rate,
+                            'category': 'General'
+                        }
+                        results.append(fd_data)
+
+    return results
+
+def extract_bom_rates(html_content):
+    """Extract FD rates from a Bank of Maharashtra page"""
+    soup = make_soup(html_content, RATE_TABLE_STRAINER)
+    results = []
+
+    for table in soup.find_all('table'):
+        if process_bom_table(table, results):
+            return results
+
+    return results
+
+def extract_indian_bank_rates(html_content):
+    """Extract FD rates from an Indian Bank page"""
+    soup = make_soup(html_content, parser=FULL_SOUP_PARSER)
+    results = []
+
+    tables = find_relevant_tables(soup, ['deposit-rates', 'interest-table'])
+
+    for table in tables:
+        if process_indian_bank_table(table, results):
+            return results
+
+    return results
+
+# Table processing functions
+def process_boi_table(table, results):
+    """Process Bank of India table"""
+    return process_generic_table(table, results)
+
+def process_bom_table(table, results):
+    """Process Bank of Maharashtra table"""
+    return process_generic_table(table, results)
+
+def process_canara_tables(soup):
+    """Process Canara Bank tables"""
+    results = []
+    tables = soup.find_all('table')
+   
+    for table in tables:
+        process_generic_table(table, results)
+   
+    return results
+
+def process_indian_bank_table(table, results):
+    """Process Indian Bank table"""
+    return process_generic_table(table, results)
+
+def process_iob_table(table, results):
+    """Process Indian Overseas Bank table"""
+    return process_generic_table(table, results)
+
+def process_psb_table(table, results):
+    """Process Punjab & Sind Bank table"""
+    return process_generic_table(table, results)
+
+def process_uco_table(table, results):
+    """Process UCO Bank table"""
+    return process_generic_table(table, results)
+
+def process_union_table(table, results):
+    """Process Union Bank table"""
+    return process_generic_table(table, results)
+
+def process_generic_table(table, results):
+    """Generic table processing function"""
+    matrix = TableMatrix.from_table(table)
+
+    if any(term in matrix.text for term in ['tenure', 'period', 'rate']):
+        data_found = False
+        for cells in matrix.rows[1:]:  # Skip header
+            if len(cells) >= 2:
+                tenure = cells[0]
+
+                if len(tenure) < 3 or not any(c.isdigit() for c in tenure):
+                    continue
+
+                regular_rate = clean_rate_text(cells[1])
+                senior_rate = clean_rate_text(cells[2]) if len(cells) > 2 else None
+
+                tenure_days = extract_tenure_days(tenure)
+
+                if tenure_days['min_days'] is not None and tenure_days['max_days'] is not None:
+                    results.append({
+                        'tenure_description': tenure,
+                        'min_days': tenure_days['min_days'],
+                        'max_days': tenure_days['max_days'],
+                        'regular_rate': regular_rate,
+                        'senior_rate': senior_rate,
+                        'category': 'General'
+                    })
+                    data_found = True
+
+        return data_found
+    return False
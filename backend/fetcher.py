@@ -0,0 +1,253 @@
+import asyncio
+import threading
+import logging
+import time
+from urllib.parse import urlsplit
+import requests
+import aiohttp
+from config import FETCH_CONFIG
+from http_cache import get_http_cache
+from replay import get_fixture_store
+from state_store import ProcessSingleton
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Encoding': 'gzip, deflate'
+}
+
+class FetchError(requests.RequestException):
+    """Raised when a page could not be fetched"""
+
+class FetchResponse:
+    """Minimal response object mirroring the parts of requests.Response the scrapers use"""
+
+    def __init__(self, url, status_code, headers, content, encoding=None, not_modified=False, timings=None):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.encoding = encoding
+        # True when the server answered 304 and content came from the HTTP cache
+        self.not_modified = not_modified
+        # Seconds spent on dns, connect, wait (to the response headers) and download, plus bytes read
+        self.timings = timings or {}
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding or 'utf-8', errors='replace')
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise FetchError(f"{self.status_code} Error for url: {self.url}")
+
+class HostLimiter:
+    """Adaptive concurrency limit for one host (additive increase, multiplicative decrease).
+
+    After ``limit`` consecutive fast successes the limit grows by one, up to
+    ``max_limit``; an error, a 429/5xx or a slow response halves it. Only
+    used from the fetcher's event loop.
+    """
+
+    def __init__(self, host, limit, max_limit, slow_seconds):
+        self.host = host
+        self.max_limit = max_limit
+        self.limit = max(1, min(limit, max_limit))
+        self.slow_seconds = slow_seconds
+        self.active = 0
+        self._successes = 0
+        self._condition = asyncio.Condition()
+
+    async def acquire(self):
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.active < self.limit)
+            self.active += 1
+
+    async def release(self, latency, ok):
+        """Free a slot and adapt the limit; ok is None when the request was cancelled"""
+        async with self._condition:
+            self.active -= 1
+            if ok is None:
+                pass
+            elif not ok or latency > self.slow_seconds:
+                self._successes = 0
+                if self.limit > 1:
+                    self.limit = max(1, self.limit // 2)
+                    logger.info(f"Backing off {self.host} to {self.limit} concurrent requests")
+            else:
+                self._successes += 1
+                if self._successes >= self.limit and self.limit < self.max_limit:
+                    self._successes = 0
+                    self.limit += 1
+                    logger.info(f"Raising {self.host} to {self.limit} concurrent requests")
+            self._condition.notify_all()
+
+def _trace_config():
+    """aiohttp trace hooks that time DNS and connection setup into the request's timings dict"""
+    def started(phase):
+        async def hook(session, context, params):
+            context.trace_request_ctx[f"_{phase}_start"] = time.perf_counter()
+        return hook
+
+    def ended(phase):
+        async def hook(session, context, params):
+            timings = context.trace_request_ctx
+            start = timings.pop(f"_{phase}_start", None)
+            if start is not None:
+                timings[phase] = timings.get(phase, 0.0) + time.perf_counter() - start
+        return hook
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_dns_resolvehost_start.append(started('dns'))
+    trace_config.on_dns_resolvehost_end.append(ended('dns'))
+    trace_config.on_connection_create_start.append(started('connect'))
+    trace_config.on_connection_create_end.append(ended('connect'))
+    return trace_config
+
+class AsyncFetcher:
+    """Shared asyncio HTTP client with pooled keep-alive connections.
+
+    The event loop runs in a daemon thread so the synchronous scrapers can
+    submit requests from any worker thread and share one connection pool.
+    When an HttpCache is configured, requests are made conditional on the
+    cached ETag / Last-Modified and a 304 is answered from the cached body.
+    Requests to each host also go through a HostLimiter that adapts to
+    the latency and errors seen from that host. In record/replay mode
+    responses are saved to, or answered from, the fixture store.
+    """
+
+    def __init__(self, limit=None, limit_per_host=None, cache=None):
+        self.limit = limit or FETCH_CONFIG['max_connections']
+        self.limit_per_host = limit_per_host or FETCH_CONFIG['max_connections_per_host']
+        self.cache = cache if cache is not None else get_http_cache()
+        self.fixtures = get_fixture_store()
+        self._host_limiters = {}
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name='fetcher-loop', daemon=True)
+        self._thread.start()
+        self._session = asyncio.run_coroutine_threadsafe(self._create_session(), self._loop).result()
+
+    async def _create_session(self):
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            ttl_dns_cache=FETCH_CONFIG['dns_cache_ttl'],
+            keepalive_timeout=FETCH_CONFIG['keepalive_timeout']
+        )
+        return aiohttp.ClientSession(connector=connector, headers=DEFAULT_HEADERS, auto_decompress=True,
+                                     trace_configs=[_trace_config()])
+
+    def _host_limiter(self, url):
+        host = urlsplit(url).netloc
+        limiter = self._host_limiters.get(host)
+        if limiter is None:
+            limiter = self._host_limiters[host] = HostLimiter(
+                host, FETCH_CONFIG['initial_connections_per_host'], self.limit_per_host,
+                FETCH_CONFIG['slow_response_seconds'])
+        return limiter
+
+    def host_limits(self):
+        """Current adaptive concurrency limit per host"""
+        return {host: limiter.limit for host, limiter in self._host_limiters.items()}
+
+    async def _fetch(self, url, headers=None, timeout=20, conditional=None):
+        limiter = self._host_limiter(url)
+        await limiter.acquire()
+        start = time.perf_counter()
+        ok = None  # No feedback if the fetch is cancelled
+        try:
+            response = await self._request(url, headers, timeout, conditional)
+            ok = response.status_code != 429 and response.status_code < 500
+            if self.fixtures and self.fixtures.recording:
+                await asyncio.get_running_loop().run_in_executor(
+                    None, self.fixtures.save, 'http', url, response.content, response.status_code,
+                    response.headers, response.encoding, time.perf_counter() - start)
+            return response
+        except FetchError:
+            ok = False
+            raise
+        finally:
+            await limiter.release(time.perf_counter() - start, ok)
+
+    async def _request(self, url, headers=None, timeout=20, conditional=None):
+        loop = asyncio.get_running_loop()
+        request_headers = dict(headers or {})
+        request_headers.update(conditional or {})
+
+        timings = {}
+        start = time.perf_counter()
+        try:
+            async with self._session.get(url, headers=request_headers, trace_request_ctx=timings,
+                                         timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                # Connection setup is its own phase, so wait is only the time to the response headers
+                headers_at = time.perf_counter()
+                timings['wait'] = headers_at - start - timings.get('connect', 0.0)
+                content = await response.read()
+                timings['download'] = time.perf_counter() - headers_at
+                timings['bytes'] = len(content)
+                response_headers = dict(response.headers)
+
+                if response.status == 304 and conditional:
+                    cached_body = await loop.run_in_executor(None, self.cache.body, url)
+                    if cached_body is not None:
+                        meta = self.cache.load(url) or {}
+                        return FetchResponse(url, 200, response_headers, cached_body,
+                                             meta.get('encoding'), not_modified=True, timings=timings)
+
+                if response.status == 200 and self.cache:
+                    await loop.run_in_executor(None, self.cache.store_response, url,
+                                               response_headers, content, response.charset)
+
+                return FetchResponse(str(response.url), response.status, response_headers,
+                                     content, response.charset, timings=timings)
+        except asyncio.TimeoutError:
+            raise FetchError(f"Timed out after {timeout}s fetching {url}")
+        except aiohttp.ClientError as e:
+            raise FetchError(f"Error fetching {url}: {str(e)}")
+
+    async def _replay(self, url):
+        start = time.perf_counter()
+        entry = await asyncio.get_running_loop().run_in_executor(None, self.fixtures.load, 'http', url)
+        if entry is None:
+            raise FetchError(f"No fixture recorded for {url}")
+        delay = self.fixtures.delay(entry)
+        if delay:
+            await asyncio.sleep(delay)
+        # The recording keeps one duration per response, so it all counts as waiting for the server
+        timings = {'wait': time.perf_counter() - start, 'download': 0.0, 'bytes': len(entry['content'])}
+        return FetchResponse(url, entry['status'], entry['headers'], entry['content'], entry['encoding'],
+                             timings=timings)
+
+    def submit(self, url, headers=None, timeout=20):
+        """Schedule a fetch and return a concurrent.futures.Future for its response"""
+        if self.fixtures and self.fixtures.replaying:
+            return asyncio.run_coroutine_threadsafe(self._replay(url), self._loop)
+        conditional = self.cache.validators(url) if self.cache else None
+        return asyncio.run_coroutine_threadsafe(self._fetch(url, headers, timeout, conditional), self._loop)
+
+    def fetch(self, url, headers=None, timeout=20):
+        """Fetch a single URL, blocking the calling thread until it completes"""
+        return self.submit(url, headers, timeout).result()
+
+    def fetch_many(self, urls, headers=None, timeout=20):
+        """Start fetching all URLs concurrently; returns futures in the order given"""
+        return [self.submit(url, headers, timeout) for url in urls]
+
+    def close(self):
+        asyncio.run_coroutine_threadsafe(self._session.close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+
+_fetcher = ProcessSingleton(AsyncFetcher, close=AsyncFetcher.close)
+
+def get_fetcher():
+    """Return the process-wide fetcher, creating it on first use"""
+    return _fetcher.get()
+
+def fetch(url, headers=None, timeout=20):
+    return get_fetcher().fetch(url, headers=headers, timeout=timeout)
+
+def fetch_many(urls, headers=None, timeout=20):
+    return get_fetcher().fetch_many(urls, headers=headers, timeout=timeout)
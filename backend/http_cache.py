@@ -0,0 +1,114 @@
+import gzip
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime
+from state_store import ProcessSingleton, write_atomic
+from config import HTTP_CACHE_CONFIG
+
+logger = logging.getLogger(__name__)
+
+class HttpCache:
+    """On-disk cache of bank pages keyed by URL.
+
+    For every URL it keeps the last response body (gzipped), its ETag and
+    Last-Modified validators and the FD records extracted from that body, so
+    a 304 Not Modified can be answered without downloading or parsing again.
+    The records are tagged with the extractor version that produced them
+    and are only reused by the same version.
+    """
+
+    def __init__(self, directory=None):
+        self.directory = directory or HTTP_CACHE_CONFIG['directory']
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _paths(self, url):
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()[:32]
+        return (os.path.join(self.directory, f"{key}.json"),
+                os.path.join(self.directory, f"{key}.html.gz"))
+
+    def load(self, url):
+        """Return the cached metadata for a URL, or None"""
+        meta_path, _ = self._paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _save(self, url, meta):
+        meta_path, _ = self._paths(url)
+        write_atomic(meta_path, json.dumps(meta).encode('utf-8'))
+
+    def validators(self, url):
+        """Conditional request headers for a URL we have a cached body for"""
+        meta = self.load(url)
+        _, body_path = self._paths(url)
+        if not meta or not os.path.exists(body_path):
+            return {}
+
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+
+    def body(self, url):
+        """Return the cached body for a URL, or None"""
+        _, body_path = self._paths(url)
+        try:
+            with gzip.open(body_path, 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def store_response(self, url, headers, content, encoding=None):
+        """Store a fresh 200 response; records from an older body are dropped"""
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+
+        _, body_path = self._paths(url)
+        try:
+            write_atomic(body_path, gzip.compress(content))
+            self._save(url, {
+                'url': url,
+                'etag': etag,
+                'last_modified': last_modified,
+                'encoding': encoding,
+                'fetched_at': datetime.utcnow().isoformat(),
+                'records': None,
+                'extractor_version': None
+            })
+        except OSError as e:
+            logger.warning(f"Failed to cache response for {url}: {str(e)}")
+
+    def store_records(self, url, records, version):
+        """Remember the records extracted from the currently cached body by the given extractor version"""
+        meta = self.load(url)
+        if not meta:
+            return
+        meta['records'] = records
+        meta['extractor_version'] = version
+        try:
+            self._save(url, meta)
+        except OSError as e:
+            logger.warning(f"Failed to cache records for {url}: {str(e)}")
+
+    def records(self, url, version):
+        """Records extracted from the cached body by this extractor version, or None if there are none"""
+        meta = self.load(url)
+        if not meta or meta.get('extractor_version') != version:
+            return None
+        return meta.get('records')
+
+_cache = ProcessSingleton(HttpCache)
+
+def get_http_cache():
+    """Return the process-wide HTTP cache, or None when caching is disabled"""
+    if not HTTP_CACHE_CONFIG['enabled']:
+        return None
+    return _cache.get()
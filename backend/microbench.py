@@ -0,0 +1,201 @@
+import argparse
+import csv
+import glob
+import json
+import os
+import platform
+import sys
+import timeit
+import tracemalloc
+from datetime import datetime
+from extractors import clean_rate_text, find_relevant_tables, make_soup, process_generic_table
+from tenure import extract_tenure_days, parse_tenure
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_PATH = os.path.join(BASE_DIR, 'data', 'microbench_baseline.json')
+CORPUS_PATTERNS = [os.path.join(BASE_DIR, 'data', 'fd_rates_*.csv'),
+                   os.path.join(BASE_DIR, '..', 'data', 'fd_rates_*.csv')]
+
+# Rows per synthetic rate table
+TABLE_SIZES = [10, 100, 1000, 10000]
+
+# Allowed slowdown (or growth in allocations) relative to the baseline before a case is flagged
+DEFAULT_THRESHOLD = 0.25
+
+# Cell texts clean_rate_text has to reject
+INVALID_RATES = ['', '-', 'N/A', 'NA', '0', '0.00%', '105%', 'Rate (%)', 'w.e.f. 01.04.2025']
+
+def load_corpus(patterns=None):
+    """Unique tenure descriptions and rate cell texts from the archived fd_rates CSVs"""
+    tenures, rates = {}, {}
+    paths = sorted({path for pattern in patterns or CORPUS_PATTERNS for path in glob.glob(pattern)})
+    for path in paths:
+        with open(path, newline='', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                if row.get('tenure_description'):
+                    tenures[row['tenure_description']] = None
+                for column in ('regular_rate', 'senior_rate'):
+                    if row.get(column):
+                        # Rates are stored as numbers but arrive as cell text like "7.25%" or " 7.25 % "
+                        rates[f"{row[column]}%"] = None
+                        rates[f" {row[column]} % "] = None
+    return list(tenures), list(rates) + INVALID_RATES
+
+def rate_table_html(tenures, rows):
+    """An FD rate table with rows rows, cycling through the corpus tenures"""
+    lines = ['<table><tr><th>Tenure</th><th>Regular Rate</th><th>Senior Citizen Rate</th></tr>']
+    for i in range(rows):
+        rate = 5 + (i % 300) / 100
+        lines.append(f"<tr><td>{tenures[i % len(tenures)]}</td><td>{rate:.2f}%</td><td>{rate + 0.5:.2f}%</td></tr>")
+    lines.append('</table>')
+    return '\n'.join(lines)
+
+def rate_page_html(tenures, rows):
+    """A page with navigation and footer tables around two rate tables of rows rows each"""
+    other_table = '<table><tr><td>Home</td><td>Loans</td><td>Cards</td></tr></table>'
+    return '\n'.join([
+        '<html><body>', other_table,
+        '<div class="content"><h2>Savings Account</h2>', other_table, '</div>',
+        '<div class="fd-rates"><h2>Fixed Deposit Interest Rates</h2>', rate_table_html(tenures, rows), '</div>',
+        '<h3>Senior Citizen FD Rates</h3>', rate_table_html(tenures, rows),
+        '<footer>', other_table, '</footer></body></html>'
+    ])
+
+def build_cases(tenures, rates, sizes=None):
+    """Benchmark cases as (name, function, operations per call); setup such as parsing happens here"""
+    cases = []
+
+    def clean_rates():
+        return [clean_rate_text(text) for text in rates]
+    cases.append(('clean_rate_text', clean_rates, len(rates)))
+
+    def extract_tenures():
+        # The parse cache would hide the grammar's cost, so every pass starts cold
+        parse_tenure.cache_clear()
+        return [extract_tenure_days(tenure) for tenure in tenures]
+    cases.append(('extract_tenure_days', extract_tenures, len(tenures)))
+
+    for rows in sizes or TABLE_SIZES:
+        soup = make_soup(rate_page_html(tenures, rows))
+        cases.append((f"find_relevant_tables[rows={rows}]",
+                      lambda soup=soup: find_relevant_tables(soup, ['rate', 'deposit']), 1))
+
+        table = make_soup(rate_table_html(tenures, rows)).find('table')
+
+        def process_table(table=table):
+            results = []
+            process_generic_table(table, results)
+            return results
+        cases.append((f"process_generic_table[rows={rows}]", process_table, 1))
+
+    return cases
+
+def measure(fn, ops_per_call, repeat=5):
+    """ops/sec (best of repeat timed rounds), plus blocks still allocated and peak KiB for one call"""
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number))
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        result = fn()
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+        blocks = sum(stat.count_diff for stat in after.compare_to(before, 'filename'))
+        del result
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'ops_per_sec': round(number * ops_per_call / best, 1),
+        'alloc_blocks': max(blocks, 0),
+        'peak_kib': round(peak / 1024, 1)
+    }
+
+def compare(result, baseline, threshold):
+    """Regressions of one case against its baseline entry, as short labels"""
+    if not baseline:
+        return []
+    flags = []
+    if result['ops_per_sec'] < baseline['ops_per_sec'] * (1 - threshold):
+        flags.append('SLOWER')
+    if result['alloc_blocks'] > baseline['alloc_blocks'] * (1 + threshold) + 10:
+        flags.append('MORE BLOCKS')
+    if result['peak_kib'] > baseline['peak_kib'] * (1 + threshold) + 1:
+        flags.append('MORE MEMORY')
+    return flags
+
+def load_baseline(path=BASELINE_PATH):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def save_baseline(results, path=BASELINE_PATH):
+    baseline = {
+        'recorded_at': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'cases': results
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(baseline, f, indent=1)
+        f.write('\n')
+    print(f"Saved baseline for {len(results)} cases to {path}")
+
+def run_benchmarks(name_filter=None, threshold=DEFAULT_THRESHOLD, baseline=None, sizes=None):
+    """Run the cases, print ops/sec and allocations against the baseline and return (results, regressions)"""
+    tenures, rates = load_corpus()
+    if not tenures:
+        raise RuntimeError('no fd_rates CSVs found for the corpus')
+    print(f"Corpus: {len(tenures)} tenure descriptions, {len(rates)} rate texts")
+
+    cases = build_cases(tenures, rates, sizes)
+    baseline_cases = (baseline or {}).get('cases', {})
+    results = {}
+    regressions = {}
+
+    print(f"{'case':<38}{'ops/sec':>14}{'baseline':>14}{'change':>9}{'blocks':>9}{'peak KiB':>10}")
+    for name, fn, ops_per_call in cases:
+        if name_filter and name_filter not in name:
+            continue
+        result = results[name] = measure(fn, ops_per_call)
+        base = baseline_cases.get(name)
+        flags = compare(result, base, threshold)
+        if flags:
+            regressions[name] = flags
+
+        base_ops = f"{base['ops_per_sec']:,.0f}" if base else '-'
+        change = f"{result['ops_per_sec'] / base['ops_per_sec'] - 1:+.0%}" if base else ''
+        print(f"{name:<38}{result['ops_per_sec']:>14,.0f}{base_ops:>14}{change:>9}"
+              f"{result['alloc_blocks']:>9}{result['peak_kib']:>10}  {' '.join(flags)}")
+
+    return results, regressions
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Micro-benchmarks for the scraper hot functions, checked against a stored baseline')
+    parser.add_argument('--filter', help='only run cases whose name contains this text')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f'allowed slowdown or allocation growth as a fraction (default: {DEFAULT_THRESHOLD})')
+    parser.add_argument('--save-baseline', action='store_true', help=f'store the results as the new baseline ({BASELINE_PATH})')
+    parser.add_argument('--sizes', type=int, nargs='+', help=f'synthetic table sizes in rows (default: {TABLE_SIZES})')
+    args = parser.parse_args()
+
+    baseline = load_baseline()
+    if baseline and not args.save_baseline:
+        print(f"Baseline from {baseline['recorded_at']} (Python {baseline['python']}, {baseline['machine']})")
+
+    results, regressions = run_benchmarks(args.filter, args.threshold, baseline, args.sizes)
+
+    if args.save_baseline:
+        # A filtered run only replaces the cases it ran
+        cases = dict((baseline or {}).get('cases', {}), **results)
+        save_baseline(cases)
+    elif regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}: {', '.join(regressions)}")
+        sys.exit(1)
+    elif baseline:
+        print(f"\nNo regressions beyond {args.threshold:.0%}")
@@ -0,0 +1,85 @@
+import argparse
+import glob
+import os
+import time
+import numpy as np
+import pandas as pd
+from tenure import parse_tenure
+
+RATE_COLUMNS = ['regular_rate', 'senior_rate']
+
+def normalize_rates(rates):
+    """Vectorized clean_rate_text: strip '%', parse floats, keep only 0 < rate < 100"""
+    if pd.api.types.is_numeric_dtype(rates):
+        values = rates.astype(float)
+    else:
+        text = rates.astype('string').str.strip().str.replace('%', '', regex=False).str.strip()
+        values = pd.to_numeric(text, errors='coerce').astype(float)
+    return values.where((values > 0) & (values < 100))
+
+def normalize_tenures(descriptions):
+    """Vectorized extract_tenure_days, returning a frame with min_days and max_days.
+
+    Descriptions are lowercased and whitespace-collapsed as whole columns,
+    then factorized so the tenure grammar runs once per distinct
+    description and the results are scattered back with NumPy indexing.
+    """
+    text = (descriptions.astype('string')
+            .str.lower()
+            .str.replace(r'\s+', ' ', regex=True)
+            .str.strip())
+    codes, uniques = pd.factorize(text)
+
+    parsed = [parse_tenure(description) for description in uniques]
+    # Trailing NaN slot so missing descriptions (code -1) map to NaN
+    min_days = np.array([p[0] if p[0] is not None else np.nan for p in parsed] + [np.nan], dtype=float)
+    max_days = np.array([p[1] if p[1] is not None else np.nan for p in parsed] + [np.nan], dtype=float)
+
+    return pd.DataFrame({
+        'min_days': pd.Series(min_days[codes], index=descriptions.index).astype('Int64'),
+        'max_days': pd.Series(max_days[codes], index=descriptions.index).astype('Int64')
+    })
+
+def normalize_frame(df):
+    """Recompute min_days, max_days, regular_rate and senior_rate for a whole frame of scraped rates"""
+    df = df.copy()
+    if 'tenure_description' in df.columns:
+        tenures = normalize_tenures(df['tenure_description'])
+        df['min_days'] = tenures['min_days']
+        df['max_days'] = tenures['max_days']
+    for column in RATE_COLUMNS:
+        if column in df.columns:
+            df[column] = normalize_rates(df[column])
+    return df
+
+def normalize_csv_files(paths, output_dir=None):
+    """Re-normalize archived fd_rates CSVs, writing to output_dir (or in place when it is None)"""
+    total_rows = 0
+    for path in paths:
+        df = normalize_frame(pd.read_csv(path))
+        target = os.path.join(output_dir, os.path.basename(path)) if output_dir else path
+        df.to_csv(target, index=False)
+        total_rows += len(df)
+        print(f"Normalized {len(df)} rows: {path} -> {target}")
+    return total_rows
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Re-normalize tenure and rate columns of archived FD rate CSVs')
+    parser.add_argument('paths', nargs='*', help='CSV files or glob patterns (default: data/fd_rates_*.csv)')
+    parser.add_argument('--output-dir', default=os.path.join('data', 'normalized'),
+                        help='directory for the normalized files (default: data/normalized)')
+    parser.add_argument('--in-place', action='store_true', help='overwrite the input files')
+    args = parser.parse_args()
+
+    patterns = args.paths or [os.path.join('data', 'fd_rates_*.csv')]
+    paths = sorted({path for pattern in patterns for path in glob.glob(pattern)})
+    if not paths:
+        parser.error('no CSV files matched')
+
+    output_dir = None if args.in_place else args.output_dir
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    start = time.perf_counter()
+    rows = normalize_csv_files(paths, output_dir)
+    print(f"Normalized {rows} rows from {len(paths)} files in {time.perf_counter() - start:.2f}s")
@@ -0,0 +1,114 @@
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from state_store import ProcessSingleton, write_atomic
+from config import PAGE_ARCHIVE_CONFIG
+
+logger = logging.getLogger(__name__)
+
+class PageArchive:
+    """Content-addressed store of every page a run fetched, with a manifest per run.
+
+    Page bodies are gzipped under pages/<first two hex digits>/<sha256>.html.gz,
+    so a page that didn't change between runs is stored once. Each run's
+    manifest (runs/<run id>.json) lists the pages it fetched in order with
+    the bank, URL, content hash and the extractor that was applied, which
+    is enough to extract the run again without the network.
+    """
+
+    def __init__(self, directory=None):
+        self.directory = directory or PAGE_ARCHIVE_CONFIG['directory']
+        self._lock = threading.Lock()
+        self._run_id = None
+        self._entries = []
+        os.makedirs(os.path.join(self.directory, 'pages'), exist_ok=True)
+        os.makedirs(os.path.join(self.directory, 'runs'), exist_ok=True)
+
+    def _page_path(self, digest):
+        return os.path.join(self.directory, 'pages', digest[:2], f"{digest}.html.gz")
+
+    def _manifest_path(self, run_id):
+        return os.path.join(self.directory, 'runs', f"{run_id}.json")
+
+    def begin_run(self):
+        """Start a new run manifest and return its id"""
+        run_id = datetime.now().strftime('%Y-%m-%dT%H%M%S')
+        with self._lock:
+            self._run_id = run_id
+            self._entries = []
+            self._write_manifest()
+        return run_id
+
+    def end_run(self):
+        with self._lock:
+            self._run_id = None
+            self._entries = []
+
+    def _write_manifest(self):
+        manifest = {'run_id': self._run_id, 'pages': self._entries}
+        write_atomic(self._manifest_path(self._run_id), json.dumps(manifest, indent=1).encode('utf-8'))
+
+    def store_page(self, html_content):
+        """Store a page body if it isn't archived yet and return its hash"""
+        data = html_content.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._page_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            write_atomic(path, gzip.compress(data))
+        return digest
+
+    def record(self, bank, page, url, html_content, extractor, records):
+        """Archive a fetched page and add it to the current run's manifest; a no-op outside a run"""
+        if self._run_id is None:
+            return None
+        try:
+            digest = self.store_page(html_content)
+            with self._lock:
+                if self._run_id is None:
+                    return None
+                self._entries.append({
+                    'bank': bank,
+                    'page': page,
+                    'url': url,
+                    'sha256': digest,
+                    'extractor': extractor,
+                    'records': records,
+                    'fetched_at': datetime.utcnow().isoformat()
+                })
+                self._write_manifest()
+            return digest
+        except OSError as e:
+            logger.warning(f"Failed to archive page {url}: {str(e)}")
+            return None
+
+    def runs(self):
+        """Ids of the archived runs, oldest first"""
+        names = os.listdir(os.path.join(self.directory, 'runs'))
+        return sorted(name[:-len('.json')] for name in names if name.endswith('.json'))
+
+    def manifest(self, run_id):
+        """The manifest of an archived run; "latest" picks the most recent one"""
+        if run_id == 'latest':
+            runs = self.runs()
+            if not runs:
+                raise FileNotFoundError(f"No archived runs in {self.directory}")
+            run_id = runs[-1]
+        with open(self._manifest_path(run_id), 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def load_page(self, digest):
+        with open(self._page_path(digest), 'rb') as f:
+            return gzip.decompress(f.read()).decode('utf-8')
+
+_archive = ProcessSingleton(PageArchive)
+
+def get_page_archive():
+    """Return the process-wide page archive, or None when archiving is disabled"""
+    if not PAGE_ARCHIVE_CONFIG['enabled']:
+        return None
+    return _archive.get()
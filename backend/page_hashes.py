@@ -0,0 +1,66 @@
+import hashlib
+import re
+from datetime import datetime
+from state_store import JsonStateStore, ProcessSingleton
+from config import PAGE_HASH_CONFIG
+
+# Parts of a page that change on every request without the rate tables changing
+VOLATILE_PATTERNS = [
+    (re.compile(r'<script\b[^>]*>.*?</script>', re.I | re.S), '<script></script>'),
+    (re.compile(r'<!--.*?-->', re.S), ''),
+    (re.compile(r'<input\b[^>]*type=["\']?hidden["\']?[^>]*>', re.I), ''),
+    (re.compile(r'<meta\b[^>]*(?:csrf|token|nonce)[^>]*>', re.I), ''),
+    (re.compile(r'\s(?:nonce|integrity|data-csrf[\w-]*)="[^"]*"', re.I), ''),
+    (re.compile(r'([?&])(?:v|ver|version|t|ts|_|cb|cachebuster)=[\w.-]+', re.I), r'\1'),
+    (re.compile(r'\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:Z|[+-]\d{2}:?\d{2})?'), ''),
+    (re.compile(r'\b1\d{9,12}\b'), ''),
+    (re.compile(r'\s+'), ' ')
+]
+
+def normalize_page(html_content):
+    """Strip tokens, timestamps and inline scripts that vary between identical pages"""
+    for pattern, replacement in VOLATILE_PATTERNS:
+        html_content = pattern.sub(replacement, html_content)
+    return html_content.strip()
+
+def page_hash(html_content):
+    """Hash of a page's normalized content"""
+    return hashlib.sha256(normalize_page(html_content).encode('utf-8')).hexdigest()
+
+class PageHashStore(JsonStateStore):
+    """Per-URL hash of the last page that extracted successfully, with its records.
+
+    Entries also carry the version of the extractor that produced the
+    records, so a changed extractor re-extracts unchanged pages.
+    """
+
+    description = 'page hashes'
+
+    def __init__(self, path=None):
+        super().__init__(path or PAGE_HASH_CONFIG['path'])
+
+    def lookup(self, url, digest, version):
+        """Records stored for this URL if its last page had the same hash and extractor version, else None"""
+        with self._lock:
+            entry = self._data.get(url)
+        if entry and entry['hash'] == digest and entry.get('extractor_version') == version:
+            return [dict(record) for record in entry['records']]
+        return None
+
+    def store(self, url, digest, records, version):
+        with self._lock:
+            self._data[url] = {
+                'hash': digest,
+                'extractor_version': version,
+                'records': [dict(record) for record in records],
+                'updated_at': datetime.utcnow().isoformat()
+            }
+            self._save()
+
+_store = ProcessSingleton(PageHashStore)
+
+def get_page_hash_store():
+    """Return the process-wide page hash store, or None when the short-circuit is disabled"""
+    if not PAGE_HASH_CONFIG['enabled']:
+        return None
+    return _store.get()
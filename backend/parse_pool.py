@@ -0,0 +1,65 @@
+import logging
+import multiprocessing
+import sys
+import threading
+import types
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from state_store import ProcessSingleton
+from config import PARSE_POOL_CONFIG
+
+logger = logging.getLogger(__name__)
+
+def _wait_for_workers(barrier):
+    # A new worker isn't idle (and so isn't reused) until all its siblings have been spawned
+    try:
+        barrier.wait(timeout=60)
+    except threading.BrokenBarrierError:
+        pass
+
+def _start_workers(processes):
+    """A spawned pool whose workers are all started without re-running the parent's main script.
+
+    Spawned children import the parent's __main__ (app.py or scraper.py,
+    with Flask, sklearn, selenium and SQLAlchemy) before they can take
+    work. While the workers start, __main__ is swapped for an empty module
+    so they only import what unpickling their tasks needs (extractors).
+    """
+    context = multiprocessing.get_context('spawn')
+    barrier = context.Barrier(processes)
+    pool = ProcessPoolExecutor(max_workers=processes, mp_context=context,
+                               initializer=_wait_for_workers, initargs=(barrier,))
+    main_module = sys.modules['__main__']
+    sys.modules['__main__'] = types.ModuleType('__main__')
+    try:
+        # Each submit spawns a worker, since none becomes idle before the barrier opens
+        for _ in range(processes):
+            pool.submit(int)
+    finally:
+        sys.modules['__main__'] = main_module
+    return pool
+
+# Spawned rather than forked: the parent has fetcher and driver threads running
+_pool = ProcessSingleton(_start_workers, close=lambda pool: pool.shutdown(cancel_futures=True))
+
+def get_parse_pool():
+    """Return the process-wide parser pool, or None when parsing runs in the calling thread"""
+    if PARSE_POOL_CONFIG['processes'] < 1:
+        return None
+    return _pool.get(PARSE_POOL_CONFIG['processes'])
+
+def run_parse(fn, *args):
+    """Run a CPU-bound parse function in the parser pool and wait for its result.
+
+    Falls back to running it in the calling thread if the pool is disabled
+    or a worker process died.
+    """
+    pool = get_parse_pool()
+    if pool is None:
+        return fn(*args)
+    try:
+        return pool.submit(fn, *args).result()
+    except BrokenProcessPool:
+        logger.warning("Parser process pool broke, parsing in the calling thread")
+        _pool.reset(pool)
+        return fn(*args)
@@ -0,0 +1,125 @@
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from config import PROFILING_CONFIG
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_active = None
+_last_started = {}  # kind -> monotonic time the last profile of that kind started
+
+def _frame_label(frame):
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})".replace(';', ',')
+
+class StackSampler:
+    """Sampling profiler that records the stacks of all threads at a fixed interval.
+
+    Stacks are counted in collapsed form (root;...;leaf with the thread name
+    as root), the input format of flamegraph.pl, inferno and speedscope.
+    Work done in the parser processes isn't seen; run with PARSE_PROCESSES=0
+    to profile parsing inline.
+    """
+
+    def __init__(self, interval=None):
+        self.interval = interval or PROFILING_CONFIG['interval_ms'] / 1000
+        self.stacks = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='profiler', daemon=True)
+
+    def start(self):
+        self._started = time.perf_counter()
+        self._thread.start()
+        return self
+
+    def _run(self):
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(_frame_label(frame))
+                    frame = frame.f_back
+                stack.append(names.get(thread_id, f"thread-{thread_id}").replace(';', ','))
+                self.stacks[';'.join(reversed(stack))] += 1
+            self.samples += 1
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        self.seconds = time.perf_counter() - self._started
+        return self
+
+    def save(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+        return path
+
+class Profile:
+    """A running profile of one scraper run or request; stop() writes it to the profiles directory"""
+
+    def __init__(self, kind, label):
+        self.kind = kind
+        self.label = re.sub(r'[^\w.-]+', '_', label or 'unknown')
+        self.sampler = StackSampler().start()
+
+    def stop(self):
+        global _active
+        self.sampler.stop()
+        with _lock:
+            if _active is self:
+                _active = None
+
+        directory = PROFILING_CONFIG['directory']
+        timestamp = datetime.now().strftime('%Y-%m-%dT%H%M%S')
+        path = os.path.join(directory, f"{self.kind}_{self.label}_{timestamp}.folded")
+        try:
+            os.makedirs(directory, exist_ok=True)
+            self.sampler.save(path)
+        except OSError as e:
+            logger.warning(f"Failed to save profile: {str(e)}")
+            return None
+        print(f"Saved profile of {self.kind} {self.label} ({self.sampler.samples} samples over "
+              f"{self.sampler.seconds:.1f}s) to {path}")
+        return path
+
+def start_profile(kind, label):
+    """Start profiling unless another profile is running or this kind was profiled too recently.
+
+    Returns the Profile to stop(), or None when profiling was refused.
+    """
+    global _active
+    now = time.monotonic()
+    with _lock:
+        if _active is not None:
+            logger.info(f"Not profiling {kind} {label}: another profile is running")
+            return None
+        last = _last_started.get(kind)
+        if last is not None and now - last < PROFILING_CONFIG['min_interval_seconds']:
+            logger.info(f"Not profiling {kind} {label}: last profile started {now - last:.0f}s ago")
+            return None
+        _last_started[kind] = now
+        _active = Profile(kind, label)
+        return _active
+
+@contextmanager
+def profiled(kind, label):
+    """Profile the enclosed block if start_profile allows it"""
+    profile = start_profile(kind, label)
+    try:
+        yield profile
+    finally:
+        if profile:
+            profile.stop()
@@ -0,0 +1,296 @@
+import argparse
+import logging
+import time
+from datetime import datetime
+import pandas as pd
+from sqlalchemy import or_, select
+from sqlalchemy.dialects import postgresql, sqlite
+from models import FDRate, Base, engine as default_engine
+from tenure import normalize_tenure
+from config import DB_WRITE_BATCH_SIZE, IMPORT_CHUNK_ROWS
+
+logger = logging.getLogger(__name__)
+
+# fd_rates columns a scraped or imported frame may carry
+RATE_TABLE_COLUMNS = ['bank', 'tenure_description', 'min_days', 'max_days', 'regular_rate', 'senior_rate',
+                      'category', 'scraped_date', 'region', 'currency', 'is_tax_saving', 'is_special_rate']
+KEY_COLUMNS = ['bank', 'tenure_description']
+
+# Values for optional columns a frame doesn't have or leaves empty
+COLUMN_DEFAULTS = {'category': 'General', 'is_tax_saving': False, 'is_special_rate': False}
+
+# Expected types of the columns an imported CSV may carry
+INTEGER_COLUMNS = ['min_days', 'max_days']
+FLOAT_COLUMNS = ['regular_rate', 'senior_rate']
+BOOLEAN_COLUMNS = ['is_tax_saving', 'is_special_rate']
+BOOLEAN_VALUES = {'true': True, '1': True, 'yes': True, 'false': False, '0': False, 'no': False}
+
+# Stored values compared when diffing a bank's new rates against the database
+CHANGE_COLUMNS = ['min_days', 'max_days', 'regular_rate', 'senior_rate', 'category']
+
+UPSERT_DIALECTS = {'postgresql': postgresql.insert, 'sqlite': sqlite.insert}
+
+# Bind parameters allowed in one statement (SQLite's conservative default)
+MAX_BIND_PARAMETERS = {'postgresql': 32767, 'sqlite': 999}
+
+def rate_rows(df):
+    """Turn a frame of rates into fd_rates row dicts of plain Python values.
+
+    Rows without a bank or tenure are dropped, and for a repeated
+    (bank, tenure_description) the last row wins, like INSERT OR REPLACE.
+    """
+    df = df.reindex(columns=[column for column in RATE_TABLE_COLUMNS if column in df.columns])
+    df = df.dropna(subset=[column for column in KEY_COLUMNS if column in df.columns])
+    df = df.drop_duplicates(subset=KEY_COLUMNS, keep='last')
+
+    for column, default in COLUMN_DEFAULTS.items():
+        df[column] = df[column].fillna(default) if column in df.columns else default
+    scraped_date = df['scraped_date'] if 'scraped_date' in df.columns else pd.Series(pd.NaT, index=df.index)
+    df['scraped_date'] = pd.to_datetime(scraped_date, errors='coerce').fillna(pd.Timestamp(datetime.utcnow()))
+
+    # object columns with None for missing values; tolist() yields Python scalars drivers can bind
+    columns = {}
+    for column in df.columns:
+        values = df[column].astype(object).where(df[column].notna(), None).tolist()
+        if column == 'scraped_date':
+            values = [value.to_pydatetime() if value is not None else None for value in values]
+        columns[column] = values
+    return [dict(zip(columns, values)) for values in zip(*columns.values())]
+
+def upsert_statement(dialect_name, columns):
+    """INSERT ... ON CONFLICT (bank, tenure_description) DO UPDATE for the engine's dialect.
+
+    Only the given columns are updated, and a conflicting row is only
+    touched when one of its values (other than scraped_date) differs.
+    """
+    if dialect_name not in UPSERT_DIALECTS:
+        raise ValueError(f"Bulk upsert is not supported for {dialect_name} databases")
+    table = FDRate.__table__
+    stmt = UPSERT_DIALECTS[dialect_name](table)
+    # Columns the rows don't carry keep their stored values
+    updates = {column: stmt.excluded[column] for column in columns if column not in KEY_COLUMNS}
+    changed = or_(*[table.c[column].is_distinct_from(stmt.excluded[column])
+                    for column in updates if column != 'scraped_date'])
+    return stmt.on_conflict_do_update(index_elements=KEY_COLUMNS, set_=updates, where=changed)
+
+def _batch_size(engine, batch_size):
+    # Each row's key is up to two bind parameters in the lookup query
+    max_parameters = MAX_BIND_PARAMETERS.get(engine.dialect.name, 32767)
+    return max(1, min(batch_size, max_parameters // len(KEY_COLUMNS)))
+
+def write_rates(df, engine=None, batch_size=None):
+    """Upsert a frame of rates into fd_rates in one transaction, touching only new or changed rows.
+
+    Per batch of up to batch_size rows, the stored values for the batch's
+    keys are read with one query and only rows that are new or differ
+    (ignoring scraped_date) are sent, as one executemany of
+    INSERT ... ON CONFLICT DO UPDATE. Returns a dict with the inserted,
+    updated and unchanged row counts and the seconds taken.
+    """
+    engine = engine or default_engine
+    start_time = time.perf_counter()
+    counts = {'inserted': 0, 'updated': 0, 'unchanged': 0}
+    rows = rate_rows(df)
+    if not rows:
+        return dict(counts, seconds=time.perf_counter() - start_time)
+
+    table = FDRate.__table__
+    columns = list(rows[0].keys())
+    compared = [column for column in columns if column not in KEY_COLUMNS and column != 'scraped_date']
+    stmt = upsert_statement(engine.dialect.name, columns)
+    lookup = select(table.c.bank, table.c.tenure_description, *[table.c[column] for column in compared])
+    batch_size = _batch_size(engine, batch_size or DB_WRITE_BATCH_SIZE)
+
+    with engine.begin() as conn:
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            keys = [(row['bank'], row['tenure_description']) for row in batch]
+            # Two plain IN lists can use the (bank, tenure_description) index everywhere, a row-value
+            # IN can't on SQLite; the few extra rows from the cross product are simply never looked up
+            stored = {tuple(values[:2]): tuple(values[2:]) for values in conn.execute(
+                lookup.where(table.c.bank.in_({key[0] for key in keys}),
+                             table.c.tenure_description.in_({key[1] for key in keys})))}
+
+            changed_rows = []
+            for key, row in zip(keys, batch):
+                values = stored.get(key)
+                if values is None:
+                    counts['inserted'] += 1
+                elif values != tuple(row[column] for column in compared):
+                    counts['updated'] += 1
+                else:
+                    counts['unchanged'] += 1
+                    continue
+                changed_rows.append(row)
+
+            if changed_rows:
+                conn.execute(stmt, changed_rows)
+
+    return dict(counts, seconds=time.perf_counter() - start_time)
+
+def validate_rate_chunk(chunk):
+    """Check one chunk of a rates CSV read as strings, returning (typed frame, rejected row count).
+
+    Raises ValueError if the key columns are missing. Rows without a key or
+    with a value that doesn't parse as its column's type are rejected.
+    """
+    missing = [column for column in KEY_COLUMNS if column not in chunk.columns]
+    if missing:
+        raise ValueError(f"CSV is missing required columns: {', '.join(missing)}")
+
+    chunk = chunk.reindex(columns=[column for column in RATE_TABLE_COLUMNS if column in chunk.columns])
+    for column in KEY_COLUMNS:
+        chunk[column] = chunk[column].str.strip()
+    valid = chunk[KEY_COLUMNS].notna().all(axis=1) & (chunk[KEY_COLUMNS] != '').all(axis=1)
+
+    for column in INTEGER_COLUMNS + FLOAT_COLUMNS + BOOLEAN_COLUMNS + ['scraped_date']:
+        if column not in chunk.columns:
+            continue
+        raw = chunk[column]
+        if column in BOOLEAN_COLUMNS:
+            parsed = raw.str.strip().str.lower().map(BOOLEAN_VALUES)
+        elif column == 'scraped_date':
+            parsed = pd.to_datetime(raw, errors='coerce')
+        else:
+            parsed = pd.to_numeric(raw.str.strip().str.rstrip('%'), errors='coerce')
+            if column in INTEGER_COLUMNS:
+                valid &= parsed.isna() | (parsed == parsed.round())
+                parsed = parsed.round().astype('Int64')
+        # A value that was there but didn't parse makes the row invalid
+        valid &= raw.isna() | parsed.notna()
+        chunk[column] = parsed
+
+    return chunk[valid], int((~valid).sum())
+
+def import_rates_csv(source, chunk_size=None, engine=None):
+    """Stream a rates CSV into fd_rates chunk by chunk, so memory stays flat however big the file is.
+
+    source is a path or file object. Each chunk is type-checked with
+    validate_rate_chunk and upserted with write_rates. Returns the total
+    rows read and rejected, the inserted, updated and unchanged counts and
+    the seconds taken.
+    """
+    start_time = time.perf_counter()
+    totals = {'rows': 0, 'rejected': 0, 'inserted': 0, 'updated': 0, 'unchanged': 0}
+
+    reader = pd.read_csv(source, dtype=str, chunksize=chunk_size or IMPORT_CHUNK_ROWS)
+    for number, chunk in enumerate(reader, 1):
+        valid, rejected = validate_rate_chunk(chunk)
+        counts = write_rates(valid, engine)
+        totals['rows'] += len(chunk)
+        totals['rejected'] += rejected
+        for key in ('inserted', 'updated', 'unchanged'):
+            totals[key] += counts[key]
+        logger.info(f"Imported chunk {number}: {totals['rows']} rows so far ({totals['rejected']} rejected)")
+
+    totals['seconds'] = time.perf_counter() - start_time
+    return totals
+
+def diff_bank_rates(bank, df, engine=None, remove_missing=True):
+    """Diff a bank's newly scraped rates against its stored rows, keyed by normalized tenure.
+
+    Returns a change set dict: ``changes`` lists one dict per added,
+    removed or changed tenure with the old and new CHANGE_COLUMNS values,
+    ``upserts`` holds the row dicts to write and ``deletes`` the stored
+    tenure descriptions to remove. Stored tenures missing from df are only
+    reported as removed when remove_missing is set (a complete, fresh scrape).
+    """
+    engine = engine or default_engine
+    table = FDRate.__table__
+    new_rows = {normalize_tenure(row['tenure_description']): row for row in rate_rows(df.assign(bank=bank))}
+
+    with engine.connect() as conn:
+        stored_rows = {normalize_tenure(row['tenure_description']): dict(row) for row in conn.execute(
+            select(table.c.tenure_description, *[table.c[column] for column in CHANGE_COLUMNS])
+            .where(table.c.bank == bank)).mappings()}
+
+    change_set = {'changes': [], 'upserts': [], 'deletes': []}
+
+    def record(change, old, new):
+        entry = {'change': change, 'bank': bank,
+                 'tenure_description': (new or old)['tenure_description'],
+                 'old_tenure_description': old['tenure_description'] if old else None}
+        for column in CHANGE_COLUMNS:
+            entry[f"old_{column}"] = old.get(column) if old else None
+            entry[f"new_{column}"] = new.get(column) if new else None
+        change_set['changes'].append(entry)
+
+    for key, row in new_rows.items():
+        old = stored_rows.get(key)
+        if old is None:
+            record('added', None, row)
+        elif old['tenure_description'] != row['tenure_description'] or \
+                any(old[column] != row.get(column) for column in CHANGE_COLUMNS if column in row):
+            record('changed', old, row)
+            if old['tenure_description'] != row['tenure_description']:
+                change_set['deletes'].append(old['tenure_description'])
+        else:
+            continue
+        change_set['upserts'].append(row)
+
+    if remove_missing:
+        for key, old in stored_rows.items():
+            if key not in new_rows:
+                record('removed', old, None)
+                change_set['deletes'].append(old['tenure_description'])
+
+    return change_set
+
+def apply_rate_changes(bank, change_set, engine=None):
+    """Write a change set in one transaction; a change set without changes costs no writes"""
+    engine = engine or default_engine
+    if not change_set['upserts'] and not change_set['deletes']:
+        return 0
+
+    table = FDRate.__table__
+    with engine.begin() as conn:
+        if change_set['deletes']:
+            conn.execute(table.delete().where(table.c.bank == bank,
+                                              table.c.tenure_description.in_(change_set['deletes'])))
+        if change_set['upserts']:
+            conn.execute(upsert_statement(engine.dialect.name, change_set['upserts'][0].keys()),
+                         change_set['upserts'])
+    return len(change_set['upserts']) + len(change_set['deletes'])
+
+def create_tables(engine=None):
+    Base.metadata.create_all(bind=engine or default_engine)
+
+def benchmark(rows=100000, engine=None):
+    """Time importing rows synthetic rates twice: all new, then with a quarter of the rates changed"""
+    engine = engine or default_engine
+    create_tables(engine)
+    run_id = datetime.utcnow().strftime('%Y%m%d%H%M%S')
+    df = pd.DataFrame({
+        'bank': [f"Benchmark Bank {run_id} {i % 100}" for i in range(rows)],
+        'tenure_description': [f"{i // 100 + 1} days" for i in range(rows)],
+        'min_days': [i // 100 + 1 for i in range(rows)],
+        'max_days': [i // 100 + 1 for i in range(rows)],
+        'regular_rate': [5 + (i % 300) / 100 for i in range(rows)],
+        'senior_rate': [5.5 + (i % 300) / 100 for i in range(rows)],
+        'category': 'General',
+        'scraped_date': datetime.utcnow().strftime('%Y-%m-%d')
+    })
+
+    first = write_rates(df, engine)
+    print(f"Initial import of {rows} rows: {first['seconds']:.2f}s "
+          f"({first['inserted']} inserted, {first['updated']} updated, {first['unchanged']} unchanged)")
+
+    df.loc[df.index % 4 == 0, 'regular_rate'] += 0.25
+    second = write_rates(df, engine)
+    print(f"Re-import with 25% changed: {second['seconds']:.2f}s "
+          f"({second['inserted']} inserted, {second['updated']} updated, {second['unchanged']} unchanged)")
+
+    with engine.begin() as conn:
+        conn.execute(FDRate.__table__.delete().where(FDRate.__table__.c.bank.like(f"Benchmark Bank {run_id} %")))
+    return first, second
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Bulk FD rate writer')
+    parser.add_argument('--bench', type=int, nargs='?', const=100000, metavar='ROWS',
+                        help='time importing ROWS synthetic rates (default 100000) into DATABASE_URL')
+    args = parser.parse_args()
+
+    if args.bench:
+        benchmark(args.bench)
+    else:
+        parser.print_help()
@@ -0,0 +1,223 @@
+import argparse
+import gzip
+import hashlib
+import json
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from state_store import JsonStateStore, ProcessSingleton, write_atomic
+from config import REPLAY_CONFIG
+
+logger = logging.getLogger(__name__)
+
+# Kinds of fixture: a plain HTTP response or the page source Selenium rendered
+FIXTURE_KINDS = ('http', 'browser')
+
+class FixtureStore(JsonStateStore):
+    """Recorded bank responses keyed by kind ("http" or "browser") and URL.
+
+    Bodies are gzipped next to an index.json holding each response's
+    status, headers, encoding and how long it originally took. In "record"
+    mode the fetcher and scrape_with_selenium save what
+    they get; in "replay" mode they answer from here and a URL that was
+    never recorded fails like an unreachable site.
+    """
+
+    description = 'fixture index'
+    indent = 1
+
+    def __init__(self, directory=None, mode=None, simulate_latency=None):
+        self.directory = directory or REPLAY_CONFIG['directory']
+        self.mode = mode or REPLAY_CONFIG['mode']
+        self.simulate_latency = REPLAY_CONFIG['simulate_latency'] if simulate_latency is None else simulate_latency
+        super().__init__(os.path.join(self.directory, 'index.json'))
+
+    @property
+    def recording(self):
+        return self.mode == 'record'
+
+    @property
+    def replaying(self):
+        return self.mode == 'replay'
+
+    def _key(self, kind, url):
+        return f"{kind} {url}"
+
+    def entries(self):
+        with self._lock:
+            return list(self._data.values())
+
+    def has(self, kind, url):
+        with self._lock:
+            return self._key(kind, url) in self._data
+
+    def save(self, kind, url, content, status=200, headers=None, encoding=None, elapsed=0.0):
+        """Record a response body (bytes or str) for a URL, replacing any earlier recording"""
+        if isinstance(content, str):
+            content, encoding = content.encode('utf-8'), 'utf-8'
+        key = self._key(kind, url)
+        filename = f"{hashlib.sha256(key.encode('utf-8')).hexdigest()[:32]}.html.gz"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            write_atomic(os.path.join(self.directory, filename), gzip.compress(content))
+            with self._lock:
+                self._data[key] = {
+                    'kind': kind,
+                    'url': url,
+                    'file': filename,
+                    'status': status,
+                    'headers': dict(headers or {}),
+                    'encoding': encoding,
+                    'elapsed': round(elapsed, 3),
+                    'recorded_at': datetime.utcnow().isoformat()
+                }
+                self._save()
+        except OSError as e:
+            logger.warning(f"Failed to record fixture for {url}: {str(e)}")
+
+    def load(self, kind, url):
+        """The recorded entry for a URL with its body under 'content', or None"""
+        with self._lock:
+            entry = self._data.get(self._key(kind, url))
+        if entry is None:
+            return None
+        try:
+            with open(os.path.join(self.directory, entry['file']), 'rb') as f:
+                return dict(entry, content=gzip.decompress(f.read()))
+        except OSError:
+            return None
+
+    def delay(self, entry):
+        """Seconds to wait before answering with entry"""
+        return entry['elapsed'] if self.simulate_latency else 0
+
+    def page_source(self, url):
+        """Replay the page source Selenium rendered for a URL, or None"""
+        entry = self.load('browser', url)
+        if entry is None:
+            logger.warning(f"No browser fixture recorded for {url}")
+            return None
+        time.sleep(self.delay(entry))
+        return entry['content'].decode(entry['encoding'] or 'utf-8', errors='replace')
+
+_store = ProcessSingleton(FixtureStore)
+
+def get_fixture_store():
+    """Return the process-wide fixture store, or None when record/replay is off"""
+    if REPLAY_CONFIG['mode'] not in ('record', 'replay'):
+        return None
+    return _store.get()
+
+def bank_phase_times(report):
+    """Per-bank pages and fetch, browser, parse and extract seconds from a saved run report"""
+    banks = {}
+    for bank, entry in report['banks'].items():
+        phases = entry['phases']
+        banks[bank] = {
+            'pages': entry['pages'],
+            # connect already includes dns
+            'fetch': phases['connect'] + phases['wait'] + phases['download'],
+            'browser': phases['browser'],
+            'parse': phases['parse'],
+            'extract': phases['extract']
+        }
+    return banks
+
+def _bench_run(result_path):
+    """One benchmark iteration: run_all_scrapers on replayed fixtures, with the per-bank phases its run report recorded"""
+    import scraper
+    from run_report import load_run_report
+
+    start = time.perf_counter()
+    summary = scraper.run_all_scrapers()
+    wall_time = time.perf_counter() - start
+    report = load_run_report('data')
+    if report is None:
+        raise RuntimeError('run_all_scrapers saved no run report')
+    result = {
+        'wall_time': wall_time,
+        'rows': summary['rows'],
+        'bank_status': summary['bank_status'],
+        'banks': bank_phase_times(report)
+    }
+    with open(result_path, 'w', encoding='utf-8') as f:
+        json.dump(result, f)
+
+def benchmark(runs=3, simulate_latency=False, output=None, verbose=False):
+    """Time run_all_scrapers end to end and each bank's phases on recorded fixtures, without network access.
+
+    Every run is a fresh process replaying the fixtures against a
+    throwaway data directory and SQLite database, so nothing real is
+    touched. The first run starts with empty caches; later runs reuse the
+    page hashes and table locators the earlier ones left behind.
+    """
+    fixtures_dir = os.path.abspath(REPLAY_CONFIG['directory'])
+    if not FixtureStore(fixtures_dir, mode='replay').entries():
+        raise RuntimeError(f"No fixtures in {fixtures_dir}; record some with SCRAPER_REPLAY=record python scraper.py")
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix='scraper-bench-') as work_dir:
+        env = dict(os.environ,
+                   SCRAPER_REPLAY='replay',
+                   SCRAPER_FIXTURES_DIR=fixtures_dir,
+                   SCRAPER_REPLAY_LATENCY='true' if simulate_latency else 'false',
+                   SCRAPER_DATA_DIR=os.path.join(work_dir, 'state'),
+                   DATABASE_URL=f"sqlite:///{os.path.join(work_dir, 'bench.db')}")
+
+        for run in range(runs):
+            result_path = os.path.join(work_dir, f"run_{run}.json")
+            process = subprocess.run([sys.executable, os.path.abspath(__file__), '--bench-run', result_path],
+                                     env=env, cwd=work_dir, capture_output=not verbose, text=True)
+            if process.returncode != 0:
+                raise RuntimeError(f"Benchmark run {run + 1} failed:\n{(process.stderr or '')[-2000:]}")
+            with open(result_path, 'r', encoding='utf-8') as f:
+                results.append(json.load(f))
+
+    for run, result in enumerate(results):
+        succeeded = sum(1 for status in result['bank_status'].values() if status == 'success')
+        label = 'cold' if run == 0 else 'warm'
+        print(f"Run {run + 1} ({label}): {result['wall_time']:.2f}s, {result['rows']} rows, "
+              f"{succeeded}/{len(result['bank_status'])} banks succeeded")
+
+    print(f"\n{'Bank':<28}{'pages':>6}{'fetch':>10}{'browser':>10}{'parse':>10}{'extract':>10}   (median seconds over {runs} runs)")
+    for bank in results[0]['banks']:
+        samples = [result['banks'][bank] for result in results if bank in result['banks']]
+        row = {phase: statistics.median(sample[phase] for sample in samples) for phase in ('fetch', 'browser', 'parse', 'extract')}
+        print(f"{bank:<28}{samples[0]['pages']:>6}{row['fetch']:>10.3f}{row['browser']:>10.3f}"
+              f"{row['parse']:>10.3f}{row['extract']:>10.3f}")
+
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=1)
+        print(f"\nWrote results to {output}")
+    return results
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Offline scraper benchmark on recorded fixtures (record them with SCRAPER_REPLAY=record python scraper.py)')
+    parser.add_argument('--bench', action='store_true', help='run the end-to-end benchmark')
+    parser.add_argument('--runs', type=int, default=3, help='benchmark runs (default: 3)')
+    parser.add_argument('--latency', action='store_true', help='replay each response after its recorded duration')
+    parser.add_argument('--output', help='write the raw results as JSON to this file')
+    parser.add_argument('--verbose', action='store_true', help="show the scraper's own output")
+    parser.add_argument('--list', action='store_true', help='list the recorded fixtures')
+    parser.add_argument('--bench-run', metavar='RESULT_PATH', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.bench_run:
+        _bench_run(args.bench_run)
+    elif args.bench:
+        try:
+            benchmark(args.runs, args.latency, args.output, args.verbose)
+        except RuntimeError as e:
+            parser.error(str(e))
+    elif args.list:
+        for entry in sorted(FixtureStore(mode='replay').entries(), key=lambda e: (e['kind'], e['url'])):
+            print(f"{entry['kind']:<8}{entry['status']:>4}  {entry['elapsed']:>7.2f}s  {entry['url']}")
+    else:
+        parser.print_help()
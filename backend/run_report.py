@@ -0,0 +1,108 @@
+import glob
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from state_store import write_atomic
+
+# Timed phases of a bank scrape, in seconds summed over its pages
+PHASES = ['dns', 'connect', 'wait', 'download', 'browser', 'parse', 'extract']
+# Counters summed over a bank's pages and records
+COUNTERS = ['pages', 'bytes', 'rows_kept', 'rows_dropped']
+
+REPORT_PREFIX = 'run_report_'
+
+class RunReport:
+    """Per-bank phase timings and counters of one scraper run, saved as JSON next to the CSVs.
+
+    Bank threads add spans with add() while they scrape; the run fills in
+    each bank's status, wall time and changes with update(). connect (which
+    includes dns), wait (time to the response headers) and download come
+    from the HTTP fetcher, browser from Selenium, parse and extract from
+    the parser.
+    """
+
+    def __init__(self):
+        self.started_at = datetime.now()
+        self.finished_at = None
+        self._start = time.perf_counter()
+        self.wall_time = None
+        self._lock = threading.Lock()
+        self._banks = {}
+
+    def _bank(self, bank):
+        entry = self._banks.get(bank)
+        if entry is None:
+            entry = self._banks[bank] = {
+                'status': None,
+                'extraction': None,
+                'seconds': None,
+                'phases': {phase: 0.0 for phase in PHASES},
+                **{counter: 0 for counter in COUNTERS}
+            }
+        return entry
+
+    def add(self, bank, **values):
+        """Add phase seconds and counter values to a bank's totals"""
+        with self._lock:
+            entry = self._bank(bank)
+            for name, value in values.items():
+                if not value:
+                    continue
+                if name in PHASES:
+                    entry['phases'][name] += value
+                else:
+                    entry[name] += value
+
+    def update(self, bank, **fields):
+        """Set fields such as status, extraction, seconds or changes for a bank"""
+        with self._lock:
+            self._bank(bank).update(fields)
+
+    def finish(self):
+        self.finished_at = datetime.now()
+        self.wall_time = time.perf_counter() - self._start
+
+    def to_dict(self):
+        with self._lock:
+            banks = json.loads(json.dumps(self._banks))
+
+        for entry in banks.values():
+            entry['phases'] = {phase: round(seconds, 3) for phase, seconds in entry['phases'].items()}
+            busiest = max(entry['phases'], key=entry['phases'].get)
+            entry['slowest_phase'] = busiest if entry['phases'][busiest] > 0 else None
+
+        timed = [bank for bank, entry in banks.items() if entry['seconds'] is not None]
+        return {
+            'started_at': self.started_at.isoformat(timespec='seconds'),
+            'finished_at': self.finished_at.isoformat(timespec='seconds') if self.finished_at else None,
+            'wall_time': round(self.wall_time, 3) if self.wall_time is not None else None,
+            'slowest_bank': max(timed, key=lambda bank: banks[bank]['seconds']) if timed else None,
+            'totals': {
+                'phases': {phase: round(sum(entry['phases'][phase] for entry in banks.values()), 3) for phase in PHASES},
+                **{counter: sum(entry[counter] for entry in banks.values()) for counter in COUNTERS}
+            },
+            'banks': banks
+        }
+
+    def save(self, directory, date):
+        """Write the report to <directory>/run_report_<date>.json and return its path"""
+        path = os.path.join(directory, f"{REPORT_PREFIX}{date}.json")
+        write_atomic(path, json.dumps(self.to_dict(), indent=1).encode('utf-8'))
+        return path
+
+def load_run_report(directory, date=None):
+    """The saved report for a date (YYYY-MM-DD), or the most recent one; None if there is none"""
+    if date:
+        path = os.path.join(directory, f"{REPORT_PREFIX}{date}.json")
+    else:
+        paths = sorted(glob.glob(os.path.join(directory, f"{REPORT_PREFIX}*.json")))
+        if not paths:
+            return None
+        path = paths[-1]
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
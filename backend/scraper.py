@@ -1,23 +1,42 @@
 # This is the Scrapper Code v0.5
+import argparse
 import pandas as pd
 import time
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import requests
-from bs4 import BeautifulSoup
-import re
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from functools import lru_cache, partial
+import random
+import hashlib
+import json
 import matplotlib.pyplot as plt
 import seaborn as sns
 import os
 import sys
 import logging
+import threading
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
-import sqlite3
+from fetcher import fetch, fetch_many
+from driver_pool import get_driver_pool, kill_thread_driver
+from http_cache import get_http_cache
+from page_hashes import get_page_hash_store, page_hash
+from table_locators import get_table_locator_store
+from parse_pool import run_parse
+from extractors import (extract_records, extract_icici_rates, extract_sbi_rates, extract_kotak_rates,
+                        extract_axis_rates, extract_heading_tables, extract_bom_rates, extract_indian_bank_rates)
+from circuit_breaker import get_circuit_breaker
+from page_archive import get_page_archive
+from replay import get_fixture_store
+from run_report import RunReport
+from profiling import profiled
+from normalize import normalize_frame
+from rate_store import create_tables, diff_bank_rates, apply_rate_changes
+from config import SELENIUM_CONFIG, SCRAPER_TIERS_CONFIG, PARSE_POOL_CONFIG, PROFILING_CONFIG
 
 # Set up logging
 logging.basicConfig(
@@ -26,6 +45,18 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Resources that never carry rate data; blocked when SELENIUM_CONFIG['block_resources'] is set
+BLOCKED_RESOURCE_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot', '*.css'
+]
+
+# Scripts returning a value that stops changing once the page has settled (None while not ready)
+READINESS_SCRIPTS = {
+    'table': "return document.readyState === 'loading' ? null : (document.querySelectorAll('table tr').length || null);",
+    'network_idle': "return document.readyState === 'complete' ? performance.getEntriesByType('resource').length : null;"
+}
+
 def setup_selenium_driver():
     """Setup Chrome WebDriver with appropriate options"""
     chrome_options = Options()
@@ -41,293 +72,373 @@ def setup_selenium_driver():
    
     # Add user agent
     chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
+
+    # "eager" returns from driver.get() at DOMContentLoaded instead of waiting for every subresource
+    chrome_options.page_load_strategy = SELENIUM_CONFIG['page_load_strategy']
+    if SELENIUM_CONFIG['block_resources']:
+        chrome_options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.managed_default_content_settings.fonts': 2
+        })
    
-    driver = webdriver.Chrome(options=chrome_options)
+    # chromedriver leads its own process group so a timed-out scrape can kill it together with Chrome
+    service = Service(popen_kw={'start_new_session': True}) if os.name == 'posix' else Service()
+    driver = webdriver.Chrome(service=service, options=chrome_options)
     driver.set_page_load_timeout(60)  # Reduced timeout from 180 to 60 seconds
-    driver.implicitly_wait(10)  # Reduced implicit wait from 20 to 10 seconds
+    # Explicit readiness waits replace the implicit wait, which would stall every empty lookup
+    driver.implicitly_wait(0)
+
+    if SELENIUM_CONFIG['block_resources']:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_RESOURCE_PATTERNS})
+
     return driver
 
-def scrape_with_selenium(url, wait_for_element=None, wait_timeout=20, max_retries=2):
-    """Generic function to scrape using Selenium with retry mechanism"""
+def wait_for_page_ready(driver, mode='table', timeout=20, poll_interval=0.25, stable_polls=2):
+    """Wait until the page has settled, returning False if the ceiling is reached first"""
+    # "table": the number of table rows stops changing; "network_idle": the load has
+    # completed and no new resource requests show up for stable_polls polls
+    script = READINESS_SCRIPTS[mode]
+    state = {'value': None, 'stable': 0}
+
+    def settled(d):
+        value = d.execute_script(script)
+        if value is not None and value == state['value']:
+            state['stable'] += 1
+        else:
+            state['value'] = value
+            state['stable'] = 0
+        return state['stable'] >= stable_polls
+
+    try:
+        WebDriverWait(driver, max(timeout, 0), poll_frequency=poll_interval).until(settled)
+        return True
+    except TimeoutException:
+        return False
+
+def scrape_with_selenium(url, wait_for_element=None, wait_timeout=20, max_retries=2, ready_mode=None):
+    """Generic function to scrape using a pooled Selenium driver with retry mechanism"""
+    # When replaying fixtures the recorded page source is returned instead
+    fixtures = get_fixture_store()
+    if fixtures and fixtures.replaying:
+        start = time.perf_counter()
+        page_source = fixtures.page_source(url)
+        elapsed = time.perf_counter() - start
+        if page_source is None:
+            _record_phases(browser=elapsed)
+        else:
+            _record_phases(pages=1, browser=elapsed, bytes=len(page_source.encode('utf-8')))
+        return page_source
+
+    # "table" or "network_idle"
+    ready_mode = ready_mode or SELENIUM_CONFIG['ready_mode']
     retry_count = 0
     last_exception = None
    
     while retry_count < max_retries:
-        driver = None
+        _check_cancelled()
+        start = None
         try:
-            driver = setup_selenium_driver()
-            driver.get(url)
-           
-            if wait_for_element:
-                try:
-                    WebDriverWait(driver, wait_timeout).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, wait_for_element))
-                    )
-                except TimeoutException:
-                    # If specific element not found, check if page has any content
-                    if len(driver.page_source) < 100:  # Arbitrary small size
-                        raise TimeoutException("Page appears to be empty")
-           
-            # Add a small delay to ensure dynamic content loads
-            time.sleep(1)  # Reduced from 2 seconds to 1 second
-           
-            return driver.page_source
+            with get_driver_pool(setup_selenium_driver).lease(SELENIUM_CONFIG['lease_timeout']) as driver:
+                start = time.perf_counter()
+                driver.get(url)
+                # wait_timeout is the ceiling for the whole readiness wait of one attempt
+                deadline = time.monotonic() + wait_timeout
+               
+                if wait_for_element:
+                    try:
+                        WebDriverWait(driver, wait_timeout).until(
+                            EC.presence_of_element_located((By.CSS_SELECTOR, wait_for_element))
+                        )
+                    except TimeoutException:
+                        # If specific element not found, check if page has any content
+                        if len(driver.page_source) < 100:  # Arbitrary small size
+                            raise TimeoutException("Page appears to be empty")
+               
+                # Return as soon as the content has settled rather than after a fixed delay
+                if not wait_for_page_ready(driver, ready_mode, deadline - time.monotonic()):
+                    logger.info(f"Page {url} did not settle within {wait_timeout}s, using current content")
+               
+                page_source = driver.page_source
+                elapsed = time.perf_counter() - start
+                _record_phases(pages=1, browser=elapsed, bytes=len(page_source.encode('utf-8')))
+                if fixtures and fixtures.recording:
+                    fixtures.save('browser', url, page_source, elapsed=elapsed)
+                return page_source
            
         except Exception as e:
+            if start is not None:
+                _record_phases(browser=time.perf_counter() - start)
+            # A killed browser is no reason to retry with a new one
+            _check_cancelled()
             last_exception = e
             retry_count += 1
             logger.warning(f"Attempt {retry_count} failed for URL {url}: {str(e)}")
-            time.sleep(retry_count * 1)  # Reduced backoff time
-           
-        finally:
-            if driver:
-                try:
-                    driver.quit()
-                except:
-                    pass
+            if retry_count < max_retries:
+                # Exponential backoff with jitter, no sleep after the final attempt
+                time.sleep(min(0.5 * 2 ** retry_count, 8) * random.uniform(0.5, 1))
    
     if last_exception:
         logger.error(f"All {max_retries} attempts failed for URL {url}: {str(last_exception)}")
     return None
 
-def find_relevant_tables(soup, class_keywords):
-    """Find tables that might contain FD rates"""
-    tables = []
-   
-    # Direct table search
-    tables.extend(soup.find_all('table'))
-   
-    # Search in specific div classes
-    for keyword in class_keywords:
-        for div in soup.find_all(['div', 'section'], class_=lambda x: x and keyword in x.lower()):
-            tables.extend(div.find_all('table'))
-   
-    # Search near relevant headings
-    for heading in soup.find_all(['h1', 'h2', 'h3', 'h4'],
-                               string=re.compile(r'fixed deposit|fd|interest rate', re.I)):
-        next_table = heading.find_next('table')
-        if next_table:
-            tables.append(next_table)
-   
-    return tables
-
-def extract_tenure_days(tenure_text):
-    """Extract minimum and maximum days from tenure description"""
-
-    if not tenure_text or not isinstance(tenure_text, str):
-        return {'min_days': None, 'max_days': None}
-
-    result = {'min_days': None, 'max_days': None}
-
-    # Clean up the text
-    tenure_text = tenure_text.lower().strip()
-
-    # Try to extract days directly
-    days_pattern = r'(\d+)\s*days?\s*(?:to|up to|-|and up to|and|less than)\s*(\d+)\s*days?'
-    days_match = re.search(days_pattern, tenure_text, re.IGNORECASE)
-
-    if days_match:
-        result['min_days'] = int(days_match.group(1))
-        result['max_days'] = int(days_match.group(2))
-        return result
-
-    # Try to extract years and convert to days
-    years_pattern = r'(\d+)\s*years?\s*(?:\d+\s*days?)?\s*(?:to|up to|-|and up to|and|less than)\s*(\d+)\s*years?'
-    years_match = re.search(years_pattern, tenure_text, re.IGNORECASE)
-
-    if years_match:
-        result['min_days'] = int(years_match.group(1)) * 365
-        result['max_days'] = int(years_match.group(2)) * 365
-        return result
-
-    # Try to extract months and convert to days
-    months_pattern = r'(\d+)\s*months?\s*(?:to|up to|-|and up to|and|less than)?\s*(?:to|up to|-|and up to|and|less than)?\s*(\d+)\s*months?'
-    months_match = re.search(months_pattern, tenure_text, re.IGNORECASE)
-
-    if months_match:
-        result['min_days'] = int(months_match.group(1)) * 30
-        result['max_days'] = int(months_match.group(2)) * 30
-        return result
-
-    # Try to extract mixed units (e.g., "1 year to 2 years")
-    mixed_pattern = r'(\d+)\s*(day|month|year)s?\s*(?:to|up to|-|and up to|and|less than)\s*(\d+)\s*(day|month|year)s?'
-    mixed_match = re.search(mixed_pattern, tenure_text, re.IGNORECASE)
-
-    if mixed_match:
-        min_value = int(mixed_match.group(1))
-        min_unit = mixed_match.group(2).lower()
-        max_value = int(mixed_match.group(3))
-        max_unit = mixed_match.group(4).lower()
-
-        # Convert to days
-        if min_unit == 'day':
-            result['min_days'] = min_value
-        elif min_unit == 'month':
-            result['min_days'] = min_value * 30
-        elif min_unit == 'year':
-            result['min_days'] = min_value * 365
-
-        if max_unit == 'day':
-            result['max_days'] = max_value
-        elif max_unit == 'month':
-            result['max_days'] = max_value * 30
-        elif max_unit == 'year':
-            result['max_days'] = max_value * 365
-
-        return result
-
-    # Single value patterns
-    single_days_pattern = r'(\d+)\s*days?'
-    single_days_match = re.search(single_days_pattern, tenure_text, re.IGNORECASE)
-
-    if single_days_match:
-        days = int(single_days_match.group(1))
-        result['min_days'] = days
-        result['max_days'] = days
-        return result
-
-    single_months_pattern = r'(\d+)\s*months?'
-    single_months_match = re.search(single_months_pattern, tenure_text, re.IGNORECASE)
-
-    if single_months_match:
-        months = int(single_months_match.group(1))
-        result['min_days'] = months * 30
-        result['max_days'] = months * 30
-        return result
-
-    single_years_pattern = r'(\d+)\s*years?'
-    single_years_match = re.search(single_years_pattern, tenure_text, re.IGNORECASE)
-
-    if single_years_match:
-        years = int(single_years_match.group(1))
-        result['min_days'] = years * 365
-        result['max_days'] = years * 365
-        return result
-
-    # Pattern for "less than X days"
-    less_than_days_pattern = r'less than (\d+)\s*days?'
-    less_than_days_match = re.search(less_than_days_pattern, tenure_text, re.IGNORECASE)
-
-    if less_than_days_match:
-        days = int(less_than_days_match.group(1))
-        result['min_days'] = 1
-        result['max_days'] = days - 1
-        return result
-
-    # Pattern for "more than X days"
-    more_than_days_pattern = r'more than (\d+)\s*days?'
-    more_than_days_match = re.search(more_than_days_pattern, tenure_text, re.IGNORECASE)
-
-    if more_than_days_match:
-        days = int(more_than_days_match.group(1))
-        result['min_days'] = days + 1
-        result['max_days'] = days + 365  # Assume one year more
-        return result
-
-    # If everything else fails but contains numbers, make a guess
-    numbers = re.findall(r'\d+', tenure_text)
-    if len(numbers) >= 2:
-        result['min_days'] = int(numbers[0])
-        result['max_days'] = int(numbers[1])
-        return result
-    elif len(numbers) == 1:
-        # Just one number found, use it for both min and max
-        result['min_days'] = int(numbers[0])
-        result['max_days'] = int(numbers[0])
-        return result
-
-    return result
-
-def clean_rate_text(rate_text):
-    """Clean and validate rate text"""
-    if not rate_text or not isinstance(rate_text, str):
-        return None
-
-    # Remove percentage and whitespace
-    rate_text = rate_text.strip().replace('%', '')
-
-    # Try to convert to float
+# How the current thread's bank data was obtained ("unchanged" or "re-extracted") and for which bank
+_extraction_state = threading.local()
+
+def _note_extraction(status):
+    _extraction_state.status = status
+
+def _record_phases(**values):
+    """Add phase seconds and counters to the current bank's entry in the run report"""
+    report = getattr(_extraction_state, 'report', None)
+    if report and getattr(_extraction_state, 'bank', None):
+        report.add(_extraction_state.bank, **values)
+
+def _record_fetch(response):
+    _record_phases(pages=1, **response.timings)
+
+class ScrapeCancelled(Exception):
+    """Raised in a bank thread the watchdog has abandoned"""
+
+# Bank threads the watchdog has abandoned; their scrapers stop at the next check
+_cancelled_threads = set()
+_cancelled_lock = threading.Lock()
+
+def cancel_thread(thread_id):
+    with _cancelled_lock:
+        _cancelled_threads.add(thread_id)
+
+def _clear_cancelled():
+    with _cancelled_lock:
+        _cancelled_threads.discard(threading.get_ident())
+
+def _is_cancelled():
+    return threading.get_ident() in _cancelled_threads
+
+def _check_cancelled():
+    if _is_cancelled():
+        raise ScrapeCancelled("Scrape abandoned after timing out")
+
+def _stale_records(breaker, bank):
+    records = breaker.last_good(bank)
+    if records:
+        print(f"Serving {len(records)} stale FD rates for {bank} from {records[0]['scraped_date']}")
+    return records, 'stale'
+
+def run_bank_scraper(scraper, bank=None):
+    """Run one bank scraper and return its records along with how they were obtained"""
+    # When bank is given it goes through the circuit breaker: a bank whose circuit is open isn't
+    # scraped, and a bank that fails falls back to its last-known-good records, both as "stale"
+    breaker = get_circuit_breaker() if bank else None
+    if breaker and not breaker.allow(bank):
+        print(f"Circuit open for {bank}, skipping scrape")
+        return _stale_records(breaker, bank)
+
+    _extraction_state.status = None
+    _extraction_state.bank = bank
     try:
-        rate = float(rate_text)
-        return rate if rate > 0 and rate < 100 else None
-    except ValueError:
-        return None
+        records = scraper()
+    except Exception:
+        if breaker:
+            breaker.record_failure(bank)
+            records, status = _stale_records(breaker, bank)
+            if records:
+                return records, status
+        raise
+
+    if breaker:
+        if records:
+            breaker.record_success(bank, records, datetime.today().strftime('%Y-%m-%d'))
+        else:
+            breaker.record_failure(bank)
+            return _stale_records(breaker, bank)
+    return records, _extraction_state.status
+
+def extractor_spec(extract):
+    """JSON description of an extractor (a module function or a partial of one) for the page archive"""
+    if isinstance(extract, partial):
+        return {'function': extract.func.__name__, 'kwargs': dict(extract.keywords)}
+    return {'function': extract.__name__, 'kwargs': {}}
+
+def extractor_from_spec(spec):
+    extract = globals().get(spec['function'])
+    if not (spec['function'].startswith('extract_') and callable(extract)):
+        raise ValueError(f"Unknown extractor {spec['function']!r}")
+    return partial(extract, **spec['kwargs']) if spec['kwargs'] else extract
+
+# Modules besides the extractor's own whose code decides what a page extracts to
+EXTRACTION_MODULES = ['table_matrix', 'tenure']
+
+@lru_cache(maxsize=None)
+def _module_digest(module_name):
+    with open(sys.modules[module_name].__file__, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def extractor_version(extract):
+    """Hash of an extractor's spec and the code it runs; records cached under another version are stale"""
+    function = extract.func if isinstance(extract, partial) else extract
+    parts = [json.dumps(extractor_spec(extract), sort_keys=True)]
+    parts += [_module_digest(name) for name in [function.__module__] + EXTRACTION_MODULES]
+    return hashlib.sha256('|'.join(parts).encode('utf-8')).hexdigest()[:16]
+
+def archive_page(bank_name, url, html_content, extract, records):
+    """Add a fetched page to the current run's page archive"""
+    archive = get_page_archive()
+    if archive:
+        bank = getattr(_extraction_state, 'bank', None) or bank_name
+        archive.record(bank, bank_name, url, html_content, extractor_spec(extract), len(records))
+
+def extract_page(bank_name, url, html_content, extract):
+    """Extract records from a page, reusing the last run's records when the page and extractor are unchanged"""
+    store = get_page_hash_store()
+    locators = get_table_locator_store()
+    digest = version = None
+
+    if store:
+        digest = page_hash(html_content)
+        version = extractor_version(extract)
+        cached_records = store.lookup(url, digest, version)
+        if cached_records:
+            print(f"{bank_name} page unchanged, reusing {len(cached_records)} FD rates from the last run")
+            _note_extraction('unchanged')
+            archive_page(bank_name, url, html_content, extract, cached_records)
+            return cached_records
+
+    # The parser pool tries the bank's learned table locator and only runs the full
+    # extractor (learning a new locator) when that fails validation
+    locator = locators.get(bank_name) if locators else None
+    if not (locator and locator['url'] == url and 'table_index' in locator):
+        locator = None
+
+    results, learned, timings = run_parse(extract_records, extract, url, html_content, locator, bool(locators))
+    _record_phases(**timings)
+
+    if locator and results and learned is None:
+        print(f"{bank_name} table locator matched, extracted {len(results)} FD rates from table {locator['table_index']+1}")
+    elif locator:
+        print(f"{bank_name} table locator failed validation, ran full table discovery")
+    if learned:
+        locators.store(bank_name, learned)
+
+    if results:
+        _note_extraction('re-extracted')
+        if store:
+            store.store(url, digest, results, version)
+    archive_page(bank_name, url, html_content, extract, results)
+    return results
 
+def _known_url_first(bank_name, urls):
+    """Move the URL that last yielded data for this bank to the front of urls"""
+    locators = get_table_locator_store()
+    known_url = locators.url(bank_name) if locators else None
+    if known_url in urls:
+        return [known_url] + [url for url in urls if url != known_url]
+    return list(urls)
 
+def _scrape_static_batch(bank_name, urls, headers, extract, timeout):
+    """Fetch urls concurrently and return records from the first one that yields data, or []"""
+    futures = fetch_many(urls, headers=headers, timeout=timeout)
+    cache = get_http_cache()
+
+    try:
+        for url, future in zip(urls, futures):
+            _check_cancelled()
+            try:
+                print(f"Trying {bank_name} URL: {url}")
+                response = future.result()
+                _record_fetch(response)
+                response.raise_for_status()
+
+                # On 304 Not Modified the records this extractor version took from the cached body are reused
+                if response.not_modified and cache:
+                    cached_records = cache.records(url, extractor_version(extract))
+                    if cached_records:
+                        print(f"{bank_name} page not modified, reusing {len(cached_records)} cached FD rates")
+                        _note_extraction('unchanged')
+                        archive_page(bank_name, url, response.text, extract, cached_records)
+                        return cached_records
+
+                results = extract_page(bank_name, url, response.text, extract)
+                if results:
+                    if cache:
+                        cache.store_records(url, results, extractor_version(extract))
+                    return results
+
+            except ScrapeCancelled:
+                raise
+            except Exception as e:
+                print(f"Error with {bank_name} URL {url}: {str(e)}")
+    finally:
+        # Fallback pages we no longer need don't have to finish downloading
+        for future in futures:
+            future.cancel()
+
+    return []
+
+def scrape_static_urls(bank_name, urls, headers, extract, timeout=20):
+    """Return records from the first candidate URL that yields data"""
+    # The URL that worked last run is fetched alone first; the remaining candidates are
+    # only fetched (concurrently) if it fails
+    locators = get_table_locator_store()
+    known_url = locators.url(bank_name) if locators else None
+    if known_url in urls and len(urls) > 1:
+        batches = [[known_url], [url for url in urls if url != known_url]]
+    else:
+        batches = [urls]
+
+    for batch in batches:
+        _check_cancelled()
+        results = _scrape_static_batch(bank_name, batch, headers, extract, timeout)
+        if results:
+            return results
+
+    print(f"Failed to scrape {bank_name}: All URLs failed or no data found.")
+    return []
+
+def scrape_dynamic_urls(bank_name, urls, extract, wait_for_element=None, wait_timeout=20, fallback_headers=None):
+    """Render candidate URLs with Selenium one by one and return records from the first one that yields data"""
+    print(f"Starting {bank_name} scraping...")
+
+    for url in _known_url_first(bank_name, urls):
+        _check_cancelled()
+        try:
+            print(f"Trying {bank_name} URL: {url}")
+            html_content = scrape_with_selenium(url, wait_for_element=wait_for_element, wait_timeout=wait_timeout)
+
+            if not html_content and fallback_headers:
+                # If Selenium fails, try with direct request
+                response = fetch(url, headers=fallback_headers, timeout=30)
+                _record_fetch(response)
+                html_content = response.text
+
+            if not html_content:
+                continue
+
+            results = extract_page(bank_name, url, html_content, extract)
+            if results:
+                print(f"Successfully extracted {len(results)} FD rates from {bank_name}")
+                return results
+
+        except ScrapeCancelled:
+            raise
+        except Exception as e:
+            print(f"Error with {bank_name} URL {url}: {str(e)}")
+
+    print(f"Failed to scrape {bank_name} from all URLs")
+    return []
 
 def scrape_icici():
     """Scrape FD rates from ICICI Bank"""
 
-    url = "https://www.icicibank.com/personal-banking/deposits/fixed-deposit/fd-interest-rates"
+    urls = ["https://www.icicibank.com/personal-banking/deposits/fixed-deposit/fd-interest-rates"]
 
-    try:
-        # Send request with headers to mimic browser
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8'
-        }
-        print(f"Fetching ICICI Bank FD rates from {url}")
-        response = requests.get(url, headers=headers, timeout=20)
-        response.raise_for_status()
-
-        soup = BeautifulSoup(response.text, 'html.parser')
-
-        # Look for the FD rates table
-        tables = soup.find_all('table')
-        print(f"Found {len(tables)} tables on ICICI Bank page")
-
-        results = []
-
-        for idx, table in enumerate(tables):
-            # Check if this table contains FD rates
-            headers = [th.text.strip().lower() for th in table.find_all('th')]
-
-            if any('tenure' in h for h in headers) or any('period' in h for h in headers):
-                # Extract rows
-                rows = table.find_all('tr')[1:]  # Skip header row
-
-                for row in rows:
-                    cells = row.find_all(['td', 'th'])
-                    if len(cells) >= 2:
-                        tenure = cells[0].text.strip()
-
-                        # Skip header or empty rows
-                        if len(tenure) < 3 or 'tenure' in tenure.lower():
-                            continue
-
-                        regular_rate = None
-                        if len(cells) >= 2:
-                            regular_rate = clean_rate_text(cells[1].text.strip())
-
-                        # Check if senior citizen rate is available
-                        senior_rate = None
-                        if len(cells) >= 3:
-                            senior_rate = clean_rate_text(cells[2].text.strip())
-
-                        # Extract min and max days from tenure
-                        tenure_days = extract_tenure_days(tenure)
-
-                        if tenure_days['min_days'] is not None and tenure_days['max_days'] is not None:
-                            fd_data = {
-                                'tenure_description': tenure,
-                                'min_days': tenure_days['min_days'],
-                                'max_days': tenure_days['max_days'],
-                                'regular_rate': regular_rate,
-                                'senior_rate': senior_rate,
-                                'category': 'General'
-                            }
-
-                            results.append(fd_data)
-
-        if not results:
-            print("Failed to scrape ICICI Bank: Could not find FD rate data.")
-            return []
-
-        return results
+    # Send request with headers to mimic browser
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8'
+    }
 
-    except Exception as e:
-        print(f"Failed to scrape ICICI Bank: {str(e)}")
-        return []
+    return scrape_static_urls('ICICI Bank', urls, headers, extract_icici_rates, timeout=20)
 
 def scrape_sbi():
     """Scrape FD rates from SBI"""
@@ -344,300 +455,20 @@ def scrape_sbi():
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8'
     }
 
-    for url in urls:
-        try:
-            print(f"Trying SBI Bank URL: {url}")
-            response = requests.get(url, headers=headers, timeout=20)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, 'html.parser')
-
-            # Look for tables that might contain FD rates
-            tables = soup.find_all('table')
-            print(f"Found {len(tables)} tables on SBI Bank page from {url}")
-
-            results = []
-
-            # First, look for tables with relevant classes or id attributes
-            # SBI often uses specific class names for their rate tables
-            fd_keywords = ['fd', 'fixed', 'deposit', 'interest', 'rate']
-            sbi_table_classes = ['deposit-table', 'table-interest', 'table-rates', 'table-bordered']
-
-            potential_tables = []
-            for idx, table in enumerate(tables):
-                # Check class and id attributes
-                table_class = ' '.join(table.get('class', [])).lower() if table.get('class') else ''
-                table_id = table.get('id', '').lower()
-
-                # Score the table based on how likely it is to contain FD rates
-                score = 0
-
-                # Check for SBI specific table classes
-                for cls in sbi_table_classes:
-                    if cls in table_class:
-                        score += 5  # Higher weight for known SBI classes
-
-                # Check for general FD keywords
-                for keyword in fd_keywords:
-                    if keyword in table_class or keyword in table_id:
-                        score += 3
-
-                # Check if the table has a caption or heading before it that mentions FD rates
-                caption = table.find('caption')
-                caption_text = caption.text.lower() if caption else ''
-
-                if caption_text:
-                    for keyword in fd_keywords:
-                        if keyword in caption_text:
-                            score += 2
-
-                # Check nearby headings for relevance
-                prev_headings = table.find_all_previous(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'], limit=3)
-                for heading in prev_headings:
-                    heading_text = heading.text.lower()
-                    for keyword in fd_keywords:
-                        if keyword in heading_text:
-                            score += 2  # More weight for headings right before the table
-
-                # Try to find header row and check content
-                header_rows = table.find_all('tr', limit=2)
-                header_text = ''
-
-                for row in header_rows:
-                    cells = row.find_all(['th', 'td'])
-                    row_text = ' '.join([cell.text.strip().lower() for cell in cells])
-                    header_text += ' ' + row_text
-
-                if any(term in header_text for term in ['tenure', 'period', 'term', 'duration']):
-                    score += 3
-                if any(term in header_text for term in ['interest', 'rate', '%', 'percentage']):
-                    score += 3
-
-                potential_tables.append((idx, table, score))
-
-            # Sort tables by score, highest first
-            potential_tables.sort(key=lambda x: x[2], reverse=True)
-
-            # Process tables in order of likely relevance
-            for idx, table, score in potential_tables:
-                if score < 2:  # Skip tables that don't seem relevant at all
-                    continue
-
-                print(f"Analyzing table {idx+1} (relevance score: {score})")
-
-                # Try to find the header row first
-                header_row = None
-                rows = table.find_all('tr')
-
-                for i, row in enumerate(rows[:3]):  # Check first 3 rows for headers
-                    cells = row.find_all(['th', 'td'])
-                    cell_texts = [cell.text.strip().lower() for cell in cells]
-
-                    if any(term in ' '.join(cell_texts) for term in ['tenure', 'period', 'term', 'days', 'months']):
-                        header_row = i
-                        print(f"Found header row at index {i}: {cell_texts}")
-                        break
-
-                if header_row is None and len(rows) > 0:
-                    # If we couldn't identify a clear header row, assume it's the first row
-                    header_row = 0
-                    cells = rows[0].find_all(['th', 'td'])
-                    print(f"Using first row as header: {[cell.text.strip() for cell in cells]}")
-
-                # Now process the data rows
-                data_found = False
-                for row in rows[header_row+1:]:  # Skip the header row
-                    cells = row.find_all(['td', 'th'])
-
-                    if len(cells) < 2:  # Need at least tenure and one rate
-                        continue
-
-                    # First column usually has the tenure description
-                    tenure = cells[0].text.strip()
-
-                    # Skip rows that don't look like data rows
-                    if len(tenure) < 3 or not any(c.isdigit() for c in tenure):
-                        continue
-
-                    # Try to determine which columns have rates
-                    regular_rate = None
-                    senior_rate = None
-
-                    # Check the header row to determine which columns might have rates
-                    rate_columns = []
-                    if header_row is not None and header_row < len(rows):
-                        header_cells = rows[header_row].find_all(['th', 'td'])
-                        for i, cell in enumerate(header_cells[1:], 1):  # Skip first column (tenure)
-                            cell_text = cell.text.strip().lower()
-                            if any(term in cell_text for term in ['rate', '%', 'interest', 'public']):
-                                rate_columns.append(i)
-                            elif 'senior' in cell_text:
-                                senior_column = i
-
-                    # If we couldn't determine rate columns, assume they're columns 1 and possibly 2
-                    if not rate_columns and len(cells) >= 2:
-                        rate_columns = [1]
-                        if len(cells) >= 3:
-                            # Check if column 2 might be for senior citizens (usually higher rates)
-                            rate_2 = clean_rate_text(cells[2].text.strip())
-                            rate_1 = clean_rate_text(cells[1].text.strip())
-                            if rate_2 is not None and rate_1 is not None and rate_2 > rate_1:
-                                senior_rate = rate_2
-
-                    # Extract regular rate from the first identified rate column
-                    if rate_columns and rate_columns[0] < len(cells):
-                        regular_rate = clean_rate_text(cells[rate_columns[0]].text.strip())
-
-                    # Try to find senior rate if not already found
-                    if senior_rate is None and len(cells) >= 3:
-                        # Look for higher rates in other columns
-                        for i in range(1, min(4, len(cells))):  # Check first few columns only
-                            if i == rate_columns[0]:  # Skip already identified regular rate
-                                continue
-
-                            rate_val = clean_rate_text(cells[i].text.strip())
-                            if rate_val is not None and regular_rate is not None and rate_val > regular_rate:
-                                senior_rate = rate_val
-                                break
-
-                    # If we couldn't find any valid rates, skip this row
-                    if regular_rate is None:
-                        continue
-
-                    # We found some rate data
-                    data_found = True
-
-                    # Extract min and max days from tenure
-                    tenure_days = extract_tenure_days(tenure)
-
-                    if tenure_days['min_days'] is not None and tenure_days['max_days'] is not None:
-                        fd_data = {
-                            'tenure_description': tenure,
-                            'min_days': tenure_days['min_days'],
-                            'max_days': tenure_days['max_days'],
-                            'regular_rate': regular_rate,
-                            'senior_rate': senior_rate,
-                            'category': 'General'
-                        }
-                        results.append(fd_data)
-
-                # If we found valid data in this table, we might be done
-                if data_found and len(results) >= 3:
-                    print(f"Successfully extracted {len(results)} FD rates from table {idx+1}")
-                    return results
-
-            # If we got here with some results but not enough from any single table,
-            # return what we have if it seems like enough
-            if results and len(results) >= 3:
-                print(f"Collected {len(results)} SBI Bank FD rates across tables")
-                return results
-
-        except requests.RequestException as e:
-            print(f"Error with SBI Bank URL {url}: {str(e)}")
-
-    # If all URLs failed or no data found, return empty list
-    print("Failed to scrape SBI Bank: All URLs failed or no data found.")
-    return []
+    return scrape_static_urls('SBI Bank', urls, headers, extract_sbi_rates, timeout=20)
 
 def scrape_kotak():
     """Scrape FD rates from Kotak Mahindra Bank"""
 
-    url = "https://www.kotak.com/en/personal-banking/deposits/fixed-deposit/fixed-deposit-interest-rate.html"
+    urls = ["https://www.kotak.com/en/personal-banking/deposits/fixed-deposit/fixed-deposit-interest-rate.html"]
 
-    try:
-        # Send request with headers to mimic browser
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8'
-        }
-        print(f"Fetching Kotak Mahindra Bank FD rates from {url}")
-        response = requests.get(url, headers=headers, timeout=20)
-        response.raise_for_status()
-
-        soup = BeautifulSoup(response.text, 'html.parser')
-
-        # Look for the FD rates table
-        tables = soup.find_all('table')
-        print(f"Found {len(tables)} tables on Kotak Mahindra Bank page")
-
-        results = []
-
-        for idx, table in enumerate(tables):
-            print(f"Analyzing table {idx+1}")
-            headers = []
-            header_row = table.find('tr')
-            if header_row:
-                headers = [th.text.strip().lower() for th in header_row.find_all(['th', 'td'])]
-                print(f"Table {idx+1} headers: {headers}")
-
-            # Check if this table contains FD rates
-            if any('tenure' in h for h in headers) or any('period' in h for h in headers) or any('tenor' in h for h in headers):
-                print(f"Found potential FD rates table at index {idx}")
-
-                # Try to identify which column has the regular rate and which has senior rate
-                regular_col = None
-                senior_col = None
-
-                for i, h in enumerate(headers):
-                    if 'regular' in h or 'general' in h or 'public' in h or 'non senior' in h:
-                        regular_col = i
-                    elif 'senior' in h:
-                        senior_col = i
-
-                if regular_col is None and len(headers) >= 2:
-                    regular_col = 1
-
-                if senior_col is None and len(headers) >= 3:
-                    senior_col = 2
-
-                # Extract rows
-                rows = table.find_all('tr')[1:]  # Skip header row
-
-                for row in rows:
-                    cells = row.find_all(['td', 'th'])
-
-                    if len(cells) >= 2:
-                        tenure = cells[0].text.strip()
-                        print(f"Processing tenure: {tenure}")
-
-                        # Skip header or empty rows
-                        if len(tenure) < 3 or 'tenure' in tenure.lower() or 'tenors' in tenure.lower():
-                            continue
-
-                        regular_rate = None
-                        if regular_col is not None and regular_col < len(cells):
-                            regular_rate = clean_rate_text(cells[regular_col].text.strip())
-                            print(f"Regular rate: {regular_rate}")
-
-                        senior_rate = None
-                        if senior_col is not None and senior_col < len(cells):
-                            senior_rate = clean_rate_text(cells[senior_col].text.strip())
-                            print(f"Senior rate: {senior_rate}")
-
-                        # Extract min and max days from tenure
-                        tenure_days = extract_tenure_days(tenure)
-
-                        if tenure_days['min_days'] is not None and tenure_days['max_days'] is not None:
-                            fd_data = {
-                                'tenure_description': tenure,
-                                'min_days': tenure_days['min_days'],
-                                'max_days': tenure_days['max_days'],
-                                'regular_rate': regular_rate,
-                                'senior_rate': senior_rate,
-                                'category': 'General'
-                            }
-
-                            results.append(fd_data)
-
-        if not results:
-            print("Failed to scrape Kotak Mahindra Bank: Could not find FD rate data.")
-            return []
-
-        return results
+    # Send request with headers to mimic browser
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8'
+    }
 
-    except Exception as e:
-        print(f"Failed to scrape Kotak Mahindra Bank: {str(e)}")
-        return []
+    return scrape_static_urls('Kotak Mahindra Bank', urls, headers, extract_kotak_rates, timeout=20)
 
 def scrape_axis():
     """Scrape FD rates from Axis Bank"""
@@ -658,157 +489,11 @@ def scrape_axis():
         'Upgrade-Insecure-Requests': '1'
     }
 
-    for url in urls:
-        try:
-            print(f"Trying Axis Bank URL: {url}")
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()  # Raise HTTPError for bad responses
-
-            soup = BeautifulSoup(response.text, 'html.parser')
-
-            # Look for tables with FD rates
-            tables = soup.find_all('table')
-            print(f"Found {len(tables)} tables on Axis Bank page from {url}")
-
-            results = []
-
-            # Look for tables with relevant classes or ids
-            fd_keywords = ['fd', 'fixed', 'deposit', 'interest', 'rate']
-
-            # First pass: look for tables that have clear indicators of being FD rate tables
-            potential_tables = []
-            for idx, table in enumerate(tables):
-                # Check class and id attributes
-                table_class = ' '.join(table.get('class', [])).lower()
-                table_id = table.get('id', '').lower()
-
-                # Check if the table has a caption that mentions FD rates
-                caption = table.find('caption')
-                caption_text = caption.text.lower() if caption else ''
-
-                # Check the text content around the table for keywords
-                prev_elem = table.find_previous()
-                prev_text = prev_elem.text.lower() if prev_elem else ''
-
-                # Score the table based on how likely it is to contain FD rates
-                score = 0
-                for keyword in fd_keywords:
-                    if keyword in table_class or keyword in table_id:
-                        score += 3
-                    if keyword in caption_text:
-                        score += 2
-                    if keyword in prev_text:
-                        score += 1
-
-                # Additional check for Axis Bank - look for tables with specific headers
-                headers_text = ''
-                header_row = table.find('tr')
-                if header_row:
-                    headers = [th.text.strip().lower() for th in header_row.find_all(['th', 'td'])]
-                    headers_text = ' '.join(headers)
-                    if any(term in headers_text for term in ['tenure', 'period', 'duration', 'term']):
-                        score += 3
-                    if any(term in headers_text for term in ['rate', 'interest', '%']):
-                        score += 3
-
-                potential_tables.append((idx, table, score))
-
-            # Sort tables by score, highest first
-            potential_tables.sort(key=lambda x: x[2], reverse=True)
-
-            # Process tables in order of likely relevance
-            for idx, table, score in potential_tables:
-                if score < 1:  # Skip tables that don't seem relevant
-                    continue
-
-                print(f"Analyzing table {idx+1} (relevance score: {score})")
-
-                # Extract headers
-                headers = []
-                header_row = table.find('tr')
-                if header_row:
-                    headers = [th.text.strip().lower() for th in header_row.find_all(['th', 'td'])]
-                    print(f"Table {idx+1} headers: {headers}")
-
-                # Look for rows that might contain FD rate data
-                rows = table.find_all('tr')[1:]  # Skip header row
-
-                valid_data_found = False
-                for row in rows:
-                    cells = row.find_all(['td', 'th'])
-
-                    if len(cells) < 2:  # Need at least tenure and rate
-                        continue
-
-                    # Extract potential tenure from first column
-                    tenure = cells[0].text.strip()
-
-                    # Skip rows that don't look like data rows
-                    if len(tenure) < 3 or not any(c.isdigit() for c in tenure):
-                        continue
-
-                    print(f"Processing row with tenure: {tenure}")
-
-                    # Try to extract rates from other columns
-                    # For Axis, sometimes regular rate is 2nd col, sometimes it's in other columns
-                    regular_rate = None
-                    senior_rate = None
-
-                    # Check all columns for potential rates
-                    for i, cell in enumerate(cells[1:], 1):  # Start from index 1
-                        rate_text = cell.text.strip()
-                        rate_value = clean_rate_text(rate_text)
-
-                        if rate_value is not None:
-                            # If we haven't found a regular rate yet, this is it
-                            if regular_rate is None:
-                                regular_rate = rate_value
-                                print(f"Regular rate found in column {i+1}: {regular_rate}")
-                            # If we already have a regular rate and this is higher, it might be senior rate
-                            elif rate_value > regular_rate and senior_rate is None:
-                                senior_rate = rate_value
-                                print(f"Senior rate found in column {i+1}: {senior_rate}")
-
-                    # If we couldn't find rates, skip this row
-                    if regular_rate is None:
-                        continue
-
-                    # If we get here, we found some rate data
-                    valid_data_found = True
-
-                    # Extract min and max days from tenure
-                    tenure_days = extract_tenure_days(tenure)
-
-                    if tenure_days['min_days'] is not None and tenure_days['max_days'] is not None:
-                        fd_data = {
-                            'tenure_description': tenure,
-                            'min_days': tenure_days['min_days'],
-                            'max_days': tenure_days['max_days'],
-                            'regular_rate': regular_rate,
-                            'senior_rate': senior_rate,
-                            'category': 'General'
-                        }
-                        results.append(fd_data)
-
-                # If we found valid data in this table, we might be done
-                if valid_data_found:
-                    print(f"Found {len(results)} valid FD rates in table {idx+1}")
-                    if len(results) >= 3:  # If we found at least 3 rates, consider this a success
-                        return results
-
-            # If we found some results but not enough, return what we have
-            if results and len(results) >= 2:
-                print(f"Collected {len(results)} Axis Bank FD rates from tables")
-                return results
-
-        except requests.RequestException as e:
-            print(f"Error with Axis Bank URL {url}: {str(e)}")
-        except Exception as e:
-            print(f"Error processing Axis Bank URL {url}: {str(e)}")
+    return scrape_static_urls('Axis Bank', urls, headers, extract_axis_rates, timeout=30)
 
-    # If all URLs failed or no data found, return empty list
-    print("Failed to scrape Axis Bank: All URLs failed or no data found.")
-    return []
+# Div classes that commonly wrap FD rate tables on public sector bank sites
+FD_RATE_DIV_CLASSES = ['rates-table', 'interest-rates', 'fd-rates', 'depositRates',
+                       'rateTable', 'rate-table', 'fixed-deposit-rates']
 
 def scrape_bob():
     """Scrape FD rates from Bank of Baroda"""
@@ -821,124 +506,21 @@ def scrape_bob():
         "https://www.bankofbaroda.in/interest-rates/deposit-rates",
         "https://www.bankofbaroda.in/personal-banking/deposits/domestic-term-deposits"
     ]
-   
-    print("Starting Bank of Baroda scraping...")
-   
-    for url in urls:
-        try:
-            print(f"Trying Bank of Baroda URL: {url}")
-           
-            # Try with Selenium first
-            html_content = scrape_with_selenium(url, wait_for_element='table', wait_timeout=30)
-            if not html_content:
-                # If Selenium fails, try with direct request
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                    'Accept-Language': 'en-US,en;q=0.5',
-                    'Cache-Control': 'no-cache'
-                }
-                response = requests.get(url, headers=headers, timeout=30)
-                html_content = response.text
-           
-            soup = BeautifulSoup(html_content, 'html.parser')
-           
-            # Look for tables with specific Bank of Baroda patterns
-            tables = []
-           
-            # Direct table search
-            tables.extend(soup.find_all('table'))
-           
-            # Look for tables in specific div classes
-            for div in soup.find_all(['div', 'section'],
-                                   class_=['rates-table', 'interest-rates', 'fd-rates', 'depositRates',
-                                         'rateTable', 'rate-table', 'fixed-deposit-rates', 'table-responsive']):
-                tables.extend(div.find_all('table'))
-           
-            # Look near relevant headings
-            for heading in soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'],
-                                       string=re.compile(r'fixed deposit|fd|interest rate|deposit rate', re.I)):
-                next_table = heading.find_next('table')
-                if next_table:
-                    tables.append(next_table)
-
-            print(f"Found {len(tables)} potential tables")
-           
-            results = []
-           
-            for table in tables:
-                # Check if table contains rate information
-                headers = []
-                header_row = table.find('tr')
-                if header_row:
-                    headers = [th.text.strip().lower() for th in header_row.find_all(['th', 'td'])]
-               
-                if any(term in ' '.join(headers) for term in
-                      ['tenure', 'period', 'term', 'duration', 'days', 'months', 'years']):
-                   
-                    rows = table.find_all('tr')[1:]  # Skip header
-                   
-                    for row in rows:
-                        cells = row.find_all(['td', 'th'])
-                       
-                        if len(cells) >= 2:
-                            tenure = cells[0].text.strip()
-                           
-                            # Skip non-data rows
-                            if len(tenure) < 3 or not any(c.isdigit() for c in tenure):
-                                continue
-                           
-                            # Try to find rate columns
-                            regular_rate = None
-                            senior_rate = None
-                           
-                            # Look for rate columns based on headers
-                            rate_col = None
-                            senior_col = None
-                           
-                            for i, header in enumerate(headers):
-                                if any(term in header for term in ['regular', 'general', 'public', 'standard']):
-                                    rate_col = i
-                                elif 'senior' in header:
-                                    senior_col = i
-                           
-                            # If couldn't find specific columns, use default positions
-                            if rate_col is None and len(cells) >= 2:
-                                rate_col = 1
-                            if senior_col is None and len(cells) >= 3:
-                                senior_col = 2
-                           
-                            # Extract rates
-                            if rate_col is not None and rate_col < len(cells):
-                                regular_rate = clean_rate_text(cells[rate_col].text.strip())
-                           
-                            if senior_col is not None and senior_col < len(cells):
-                                senior_rate = clean_rate_text(cells[senior_col].text.strip())
-                           
-                            # Extract tenure days
-                            tenure_days = extract_tenure_days(tenure)
-                           
-                            if tenure_days['min_days'] is not None and tenure_days['max_days'] is not None:
-                                fd_data = {
-                                    'tenure_description': tenure,
-                                    'min_days': tenure_days['min_days'],
-                                    'max_days': tenure_days['max_days'],
-                                    'regular_rate': regular_rate,
-                                    'senior_rate': senior_rate,
-                                    'category': 'General'
-                                }
-                                results.append(fd_data)
-           
-            if results:
-                print(f"Successfully extracted {len(results)} FD rates from Bank of Baroda")
-                return results
-               
-        except Exception as e:
-            print(f"Error with Bank of Baroda URL {url}: {str(e)}")
-            continue
-   
-    print("Failed to scrape Bank of Baroda from all URLs")
-    return []
+
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.5',
+        'Cache-Control': 'no-cache'
+    }
+
+    extract = partial(extract_heading_tables,
+                      div_classes=FD_RATE_DIV_CLASSES + ['table-responsive'],
+                      regular_terms=['regular', 'general', 'public', 'standard'])
+
+    # Try with Selenium first, falling back to a direct request
+    return scrape_dynamic_urls('Bank of Baroda', urls, extract, wait_for_element='table',
+                               wait_timeout=30, fallback_headers=headers)
 
 def scrape_federal():
     """Scrape FD rates from Federal Bank"""
@@ -951,116 +533,13 @@ def scrape_federal():
         "https://www.federalbank.co.in/personal-banking/deposits/fixed-deposit-rates",
         "https://www.federalbank.co.in/personal-banking/deposits/term-deposit-rates"
     ]
-   
-    print("Starting Federal Bank scraping...")
-   
-    for url in urls:
-        try:
-            print(f"Trying Federal Bank URL: {url}")
-           
-            # Use Selenium for dynamic content
-            html_content = scrape_with_selenium(url, wait_for_element='table', wait_timeout=20)
-            if not html_content:
-                continue
-               
-            soup = BeautifulSoup(html_content, 'html.parser')
-           
-            # Look for tables with specific Federal Bank patterns
-            tables = []
-           
-            # Direct table search
-            tables.extend(soup.find_all('table'))
-           
-            # Look for tables in specific Federal Bank div classes
-            for div in soup.find_all(['div', 'section'],
-                                   class_=['rates-table', 'interest-rates', 'fd-rates', 'depositRates',
-                                         'rateTable', 'rate-table', 'fixed-deposit-rates']):
-                tables.extend(div.find_all('table'))
-           
-            # Look near relevant headings
-            for heading in soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'],
-                                       string=re.compile(r'fixed deposit|fd|interest rate|deposit rate', re.I)):
-                next_table = heading.find_next('table')
-                if next_table:
-                    tables.append(next_table)
-
-            print(f"Found {len(tables)} potential tables")
-           
-            results = []
-           
-            for table in tables:
-                # Check if table contains rate information
-                headers = []
-                header_row = table.find('tr')
-                if header_row:
-                    headers = [th.text.strip().lower() for th in header_row.find_all(['th', 'td'])]
-               
-                if any(term in ' '.join(headers) for term in
-                      ['tenure', 'period', 'term', 'duration', 'days', 'months', 'years']):
-                   
-                    rows = table.find_all('tr')[1:]  # Skip header
-                   
-                    for row in rows:
-                        cells = row.find_all(['td', 'th'])
-                       
-                        if len(cells) >= 2:
-                            tenure = cells[0].text.strip()
-                           
-                            # Skip non-data rows
-                            if len(tenure) < 3 or not any(c.isdigit() for c in tenure):
-                                continue
-                           
-                            # Try to find rate columns
-                            regular_rate = None
-                            senior_rate = None
-                           
-                            # Look for rate columns based on headers
-                            rate_col = None
-                            senior_col = None
-                           
-                            for i, header in enumerate(headers):
-                                if any(term in header for term in ['regular', 'general', 'public']):
-                                    rate_col = i
-                                elif 'senior' in header:
-                                    senior_col = i
-                           
-                            # If couldn't find specific columns, use default positions
-                            if rate_col is None and len(cells) >= 2:
-                                rate_col = 1
-                            if senior_col is None and len(cells) >= 3:
-                                senior_col = 2
-                           
-                            # Extract rates
-                            if rate_col is not None and rate_col < len(cells):
-                                regular_rate = clean_rate_text(cells[rate_col].text.strip())
-                           
-                            if senior_col is not None and senior_col < len(cells):
-                                senior_rate = clean_rate_text(cells[senior_col].text.strip())
-                           
-                            # Extract tenure days
-                            tenure_days = extract_tenure_days(tenure)
-                           
-                            if tenure_days['min_days'] is not None and tenure_days['max_days'] is not None:
-                                fd_data = {
-                                    'tenure_description': tenure,
-                                    'min_days': tenure_days['min_days'],
-                                    'max_days': tenure_days['max_days'],
-                                    'regular_rate': regular_rate,
-                                    'senior_rate': senior_rate,
-                                    'category': 'General'
-                                }
-                                results.append(fd_data)
-           
-            if results:
-                print(f"Successfully extracted {len(results)} FD rates from Federal Bank")
-                return results
-               
-        except Exception as e:
-            print(f"Error with Federal Bank URL {url}: {str(e)}")
-            continue
-   
-    print("Failed to scrape Federal Bank from all URLs")
-    return []
+
+    extract = partial(extract_heading_tables,
+                      div_classes=FD_RATE_DIV_CLASSES,
+                      regular_terms=['regular', 'general', 'public'])
+
+    # Use Selenium for dynamic content
+    return scrape_dynamic_urls('Federal Bank', urls, extract, wait_for_element='table', wait_timeout=20)
 
 def scrape_bank_of_india():
     """Scrape FD rates from Bank of India"""
@@ -1073,124 +552,21 @@ def scrape_bank_of_india():
         "https://www.bankofindia.co.in/domestic-term-deposits",
         "https://www.bankofindia.co.in/retail-term-deposits"
     ]
-   
-    print("Starting Bank of India scraping...")
-   
-    for url in urls:
-        try:
-            print(f"Trying Bank of India URL: {url}")
-           
-            # Try with Selenium first
-            html_content = scrape_with_selenium(url, wait_for_element='table', wait_timeout=30)
-            if not html_content:
-                # If Selenium fails, try with direct request
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                    'Accept-Language': 'en-US,en;q=0.5',
-                    'Cache-Control': 'no-cache'
-                }
-                response = requests.get(url, headers=headers, timeout=30)
-                html_content = response.text
-           
-            soup = BeautifulSoup(html_content, 'html.parser')
-           
-            # Look for tables with specific Bank of India patterns
-            tables = []
-           
-            # Direct table search
-            tables.extend(soup.find_all('table'))
-           
-            # Look for tables in specific div classes
-            for div in soup.find_all(['div', 'section'],
-                                   class_=['rates-table', 'interest-rates', 'fd-rates', 'depositRates',
-                                         'rateTable', 'rate-table', 'fixed-deposit-rates', 'table-responsive']):
-                tables.extend(div.find_all('table'))
-           
-            # Look near relevant headings
-            for heading in soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'],
-                                       string=re.compile(r'fixed deposit|fd|interest rate|deposit rate', re.I)):
-                next_table = heading.find_next('table')
-                if next_table:
-                    tables.append(next_table)
-
-            print(f"Found {len(tables)} potential tables")
-           
-            results = []
-           
-            for table in tables:
-                # Check if table contains rate information
-                headers = []
-                header_row = table.find('tr')
-                if header_row:
-                    headers = [th.text.strip().lower() for th in header_row.find_all(['th', 'td'])]
-               
-                if any(term in ' '.join(headers) for term in
-                      ['tenure', 'period', 'term', 'duration', 'days', 'months', 'years']):
-                   
-                    rows = table.find_all('tr')[1:]  # Skip header
-                   
-                    for row in rows:
-                        cells = row.find_all(['td', 'th'])
-                       
-                        if len(cells) >= 2:
-                            tenure = cells[0].text.strip()
-                           
-                            # Skip non-data rows
-                            if len(tenure) < 3 or not any(c.isdigit() for c in tenure):
-                                continue
-                           
-                            # Try to find rate columns
-                            regular_rate = None
-                            senior_rate = None
-                           
-                            # Look for rate columns based on headers
-                            rate_col = None
-                            senior_col = None
-                           
-                            for i, header in enumerate(headers):
-                                if any(term in header for term in ['regular', 'general', 'public', 'standard']):
-                                    rate_col = i
-                                elif 'senior' in header:
-                                    senior_col = i
-                           
-                            # If couldn't find specific columns, use default positions
-                            if rate_col is None and len(cells) >= 2:
-                                rate_col = 1
-                            if senior_col is None and len(cells) >= 3:
-                                senior_col = 2
-                           
-                            # Extract rates
-                            if rate_col is not None and rate_col < len(cells):
-                                regular_rate = clean_rate_text(cells[rate_col].text.strip())
-                           
-                            if senior_col is not None and senior_col < len(cells):
-                                senior_rate = clean_rate_text(cells[senior_col].text.strip())
-                           
-                            # Extract tenure days
-                            tenure_days = extract_tenure_days(tenure)
-                           
-                            if tenure_days['min_days'] is not None and tenure_days['max_days'] is not None:
-                                fd_data = {
-                                    'tenure_description': tenure,
-                                    'min_days': tenure_days['min_days'],
-                                    'max_days': tenure_days['max_days'],
-                                    'regular_rate': regular_rate,
-                                    'senior_rate': senior_rate,
-                                    'category': 'General'
-                                }
-                                results.append(fd_data)
-           
-            if results:
-                print(f"Successfully extracted {len(results)} FD rates from Bank of India")
-                return results
-               
-        except Exception as e:
-            print(f"Error with Bank of India URL {url}: {str(e)}")
-            continue
-   
-    print("Failed to scrape Bank of India from all URLs")
-    return []
+
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.5',
+        'Cache-Control': 'no-cache'
+    }
+
+    extract = partial(extract_heading_tables,
+                      div_classes=FD_RATE_DIV_CLASSES + ['table-responsive'],
+                      regular_terms=['regular', 'general', 'public', 'standard'])
+
+    # Try with Selenium first, falling back to a direct request
+    return scrape_dynamic_urls('Bank of India', urls, extract, wait_for_element='table',
+                               wait_timeout=30, fallback_headers=headers)
 
 def scrape_bank_of_maharashtra():
     """Scrape FD rates from Bank of Maharashtra"""
@@ -1198,31 +574,13 @@ def scrape_bank_of_maharashtra():
         "https://www.bankofmaharashtra.in/interest-rates",
         "https://www.bankofmaharashtra.in/fixed-deposits"
     ]
-   
+
     headers = {
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8'
     }
-   
-    results = []
-   
-    for url in urls:
-        try:
-            logger.info(f"Attempting to scrape Bank of Maharashtra URL: {url}")
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-           
-            soup = BeautifulSoup(response.text, 'html.parser')
-            tables = soup.find_all('table')
-           
-            for table in tables:
-                if process_bom_table(table, results):
-                    return results
-                   
-        except Exception as e:
-            logger.error(f"Error scraping Bank of Maharashtra: {str(e)}")
-           
-    return results
+
+    return scrape_static_urls('Bank of Maharashtra', urls, headers, extract_bom_rates, timeout=30)
 
 def scrape_canara_bank():
     """Scrape FD rates from Canara Bank"""
@@ -1235,123 +593,20 @@ def scrape_canara_bank():
         "https://www.canarabank.com/english/interest-rates",
         "https://www.canarabank.com/term-deposits"
     ]
-   
-    print("Starting Canara Bank scraping...")
-   
-    for url in urls:
-        try:
-            print(f"Trying Canara Bank URL: {url}")
-           
-            # Try with Selenium first
-            html_content = scrape_with_selenium(url, wait_for_element='table', wait_timeout=30)
-            if not html_content:
-                # If Selenium fails, try with direct request
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                    'Accept-Language': 'en-US,en;q=0.5'
-                }
-                response = requests.get(url, headers=headers, timeout=30)
-                html_content = response.text
-           
-            soup = BeautifulSoup(html_content, 'html.parser')
-           
-            # Look for tables with specific Canara Bank patterns
-            tables = []
-           
-            # Direct table search
-            tables.extend(soup.find_all('table'))
-           
-            # Look for tables in specific div classes
-            for div in soup.find_all(['div', 'section'],
-                                   class_=['rates-table', 'interest-rates', 'fd-rates', 'depositRates',
-                                         'rateTable', 'rate-table', 'fixed-deposit-rates', 'table-responsive']):
-                tables.extend(div.find_all('table'))
-           
-            # Look near relevant headings
-            for heading in soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'],
-                                       string=re.compile(r'fixed deposit|fd|interest rate|deposit rate', re.I)):
-                next_table = heading.find_next('table')
-                if next_table:
-                    tables.append(next_table)
-
-            print(f"Found {len(tables)} potential tables")
-           
-            results = []
-           
-            for table in tables:
-                # Check if table contains rate information
-                headers = []
-                header_row = table.find('tr')
-                if header_row:
-                    headers = [th.text.strip().lower() for th in header_row.find_all(['th', 'td'])]
-               
-                if any(term in ' '.join(headers) for term in
-                      ['tenure', 'period', 'term', 'duration', 'days', 'months', 'years']):
-                   
-                    rows = table.find_all('tr')[1:]  # Skip header
-                   
-                    for row in rows:
-                        cells = row.find_all(['td', 'th'])
-                       
-                        if len(cells) >= 2:
-                            tenure = cells[0].text.strip()
-                           
-                            # Skip non-data rows
-                            if len(tenure) < 3 or not any(c.isdigit() for c in tenure):
-                                continue
-                           
-                            # Try to find rate columns
-                            regular_rate = None
-                            senior_rate = None
-                           
-                            # Look for rate columns based on headers
-                            rate_col = None
-                            senior_col = None
-                           
-                            for i, header in enumerate(headers):
-                                if any(term in header for term in ['regular', 'general', 'public', 'standard']):
-                                    rate_col = i
-                                elif 'senior' in header:
-                                    senior_col = i
-                           
-                            # If couldn't find specific columns, use default positions
-                            if rate_col is None and len(cells) >= 2:
-                                rate_col = 1
-                            if senior_col is None and len(cells) >= 3:
-                                senior_col = 2
-                           
-                            # Extract rates
-                            if rate_col is not None and rate_col < len(cells):
-                                regular_rate = clean_rate_text(cells[rate_col].text.strip())
-                           
-                            if senior_col is not None and senior_col < len(cells):
-                                senior_rate = clean_rate_text(cells[senior_col].text.strip())
-                           
-                            # Extract tenure days
-                            tenure_days = extract_tenure_days(tenure)
-                           
-                            if tenure_days['min_days'] is not None and tenure_days['max_days'] is not None:
-                                fd_data = {
-                                    'tenure_description': tenure,
-                                    'min_days': tenure_days['min_days'],
-                                    'max_days': tenure_days['max_days'],
-                                    'regular_rate': regular_rate,
-                                    'senior_rate': senior_rate,
-                                    'category': 'General'
-                                }
-                                results.append(fd_data)
-           
-            if results:
-                print(f"Successfully extracted {len(results)} FD rates from Canara Bank")
-                return results
-               
-        except Exception as e:
-            print(f"Error with Canara Bank URL {url}: {str(e)}")
-            continue
-   
-    print("Failed to scrape Canara Bank from all URLs")
-    return []
+
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.5'
+    }
+
+    extract = partial(extract_heading_tables,
+                      div_classes=FD_RATE_DIV_CLASSES + ['table-responsive'],
+                      regular_terms=['regular', 'general', 'public', 'standard'])
+
+    # Try with Selenium first, falling back to a direct request
+    return scrape_dynamic_urls('Canara Bank', urls, extract, wait_for_element='table',
+                               wait_timeout=30, fallback_headers=headers)
 
 def scrape_central_bank():
     """Scrape FD rates from Central Bank of India"""
@@ -1364,116 +619,13 @@ def scrape_central_bank():
         "https://www.centralbankofindia.co.in/sites/default/files/interest-rate",
         "https://www.centralbankofindia.co.in/en/domestic-term-deposits"
     ]
-   
-    print("Starting Central Bank of India scraping...")
-   
-    for url in urls:
-        try:
-            print(f"Trying Central Bank URL: {url}")
-           
-            # Use Selenium for dynamic content
-            html_content = scrape_with_selenium(url, wait_for_element='table', wait_timeout=20)
-            if not html_content:
-                continue
-               
-            soup = BeautifulSoup(html_content, 'html.parser')
-           
-            # Look for tables with specific Central Bank patterns
-            tables = []
-           
-            # Direct table search
-            tables.extend(soup.find_all('table'))
-           
-            # Look for tables in specific Central Bank div classes
-            for div in soup.find_all(['div', 'section'],
-                                   class_=['rates-table', 'interest-rates', 'fd-rates', 'depositRates',
-                                         'rateTable', 'rate-table', 'fixed-deposit-rates', 'deposit-table']):
-                tables.extend(div.find_all('table'))
-           
-            # Look near relevant headings
-            for heading in soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'],
-                                       string=re.compile(r'fixed deposit|fd|interest rate|deposit rate', re.I)):
-                next_table = heading.find_next('table')
-                if next_table:
-                    tables.append(next_table)
-
-            print(f"Found {len(tables)} potential tables")
-           
-            results = []
-           
-            for table in tables:
-                # Check if table contains rate information
-                headers = []
-                header_row = table.find('tr')
-                if header_row:
-                    headers = [th.text.strip().lower() for th in header_row.find_all(['th', 'td'])]
-               
-                if any(term in ' '.join(headers) for term in
-                      ['tenure', 'period', 'term', 'duration', 'days', 'months', 'years']):
-                   
-                    rows = table.find_all('tr')[1:]  # Skip header
-                   
-                    for row in rows:
-                        cells = row.find_all(['td', 'th'])
-                       
-                        if len(cells) >= 2:
-                            tenure = cells[0].text.strip()
-                           
-                            # Skip non-data rows
-                            if len(tenure) < 3 or not any(c.isdigit() for c in tenure):
-                                continue
-                           
-                            # Try to find rate columns
-                            regular_rate = None
-                            senior_rate = None
-                           
-                            # Look for rate columns based on headers
-                            rate_col = None
-                            senior_col = None
-                           
-                            for i, header in enumerate(headers):
-                                if any(term in header for term in ['regular', 'general', 'public']):
-                                    rate_col = i
-                                elif 'senior' in header:
-                                    senior_col = i
-                           
-                            # If couldn't find specific columns, use default positions
-                            if rate_col is None and len(cells) >= 2:
-                                rate_col = 1
-                            if senior_col is None and len(cells) >= 3:
-                                senior_col = 2
-                           
-                            # Extract rates
-                            if rate_col is not None and rate_col < len(cells):
-                                regular_rate = clean_rate_text(cells[rate_col].text.strip())
-                           
-                            if senior_col is not None and senior_col < len(cells):
-                                senior_rate = clean_rate_text(cells[senior_col].text.strip())
-                           
-                            # Extract tenure days
-                            tenure_days = extract_tenure_days(tenure)
-                           
-                            if tenure_days['min_days'] is not None and tenure_days['max_days'] is not None:
-                                fd_data = {
-                                    'tenure_description': tenure,
-                                    'min_days': tenure_days['min_days'],
-                                    'max_days': tenure_days['max_days'],
-                                    'regular_rate': regular_rate,
-                                    'senior_rate': senior_rate,
-                                    'category': 'General'
-                                }
-                                results.append(fd_data)
-           
-            if results:
-                print(f"Successfully extracted {len(results)} FD rates from Central Bank")
-                return results
-               
-        except Exception as e:
-            print(f"Error with Central Bank URL {url}: {str(e)}")
-            continue
-   
-    print("Failed to scrape Central Bank from all URLs")
-    return []
+
+    extract = partial(extract_heading_tables,
+                      div_classes=FD_RATE_DIV_CLASSES + ['deposit-table'],
+                      regular_terms=['regular', 'general', 'public'])
+
+    # Use Selenium for dynamic content
+    return scrape_dynamic_urls('Central Bank of India', urls, extract, wait_for_element='table', wait_timeout=20)
 
 def scrape_indian_bank():
     """Scrape FD rates from Indian Bank"""
@@ -1481,237 +633,377 @@ def scrape_indian_bank():
         "https://www.indianbank.in/interest-rates/",
         "https://www.indianbank.in/departments/deposit-rates/"
     ]
-   
-    results = []
-   
-    for url in urls:
-        try:
-            logger.info(f"Attempting to scrape Indian Bank URL: {url}")
-            html_content = scrape_with_selenium(url)
-            soup = BeautifulSoup(html_content, 'html.parser')
-           
-            tables = find_relevant_tables(soup, ['deposit-rates', 'interest-table'])
-           
-            for table in tables:
-                if process_indian_bank_table(table, results):
-                    return results
-                   
-        except Exception as e:
-            logger.error(f"Error scraping Indian Bank: {str(e)}")
-           
-    return results
-
-
-
 
+    return scrape_dynamic_urls('Indian Bank', urls, extract_indian_bank_rates)
 
+# Column order of the CSV files and of each bank's frame
+RATE_COLUMNS = ['tenure_description', 'min_days', 'max_days', 'regular_rate', 'senior_rate',
+                'category', 'bank', 'scraped_date']
 
+# Columns of the per-run change file: what changed and the stored vs scraped values
+CHANGE_FILE_COLUMNS = ['change', 'bank', 'tenure_description', 'old_tenure_description'] + \
+    [f"{side}_{column}" for column in ['min_days', 'max_days', 'regular_rate', 'senior_rate', 'category']
+     for side in ('old', 'new')]
 
+def scrape_banks(deadline=None, bank_timeout=None, report=None):
+    """Run the bank scrapers in their tiers, yielding (bank, status, extraction, records) as each one ends"""
+    # Seconds for the whole run and for any one bank; 0 means no limit
+    if deadline is None:
+        deadline = SCRAPER_TIERS_CONFIG['deadline_seconds']
+    if bank_timeout is None:
+        bank_timeout = SCRAPER_TIERS_CONFIG['bank_timeout_seconds']
+   
+    # List of all scraper functions, their bank names and the worker tier they run in
+    scrapers = [
+        (scrape_icici, 'ICICI Bank', 'http'),
+        (scrape_sbi, 'SBI', 'http'),
+        (scrape_kotak, 'Kotak Mahindra Bank', 'http'),
+        (scrape_axis, 'Axis Bank', 'http'),
+        (scrape_bank_of_maharashtra, 'Bank of Maharashtra', 'http'),
+        (scrape_canara_bank, 'Canara Bank', 'browser'),
+        (scrape_central_bank, 'Central Bank of India', 'browser'),
+        (scrape_indian_bank, 'Indian Bank', 'browser')
+    ]
 
-# Table processing functions
-def process_boi_table(table, results):
-    """Process Bank of India table"""
-    return process_generic_table(table, results)
+    tier_times = {}  # tier -> seconds until its last bank finished or was abandoned
+    tier_pending = {}
+    for _, _, tier in scrapers:
+        tier_pending[tier] = tier_pending.get(tier, 0) + 1
+    finished = set()
+    start_time = time.perf_counter()
+    deadline_at = start_time + deadline if deadline else None
+    running = {}  # bank -> (thread id, start time) once its scraper has started
+
+    def run_watched(scraper, bank):
+        running[bank] = (threading.get_ident(), time.perf_counter())
+        _extraction_state.report = report
+        _clear_cancelled()
+        try:
+            return run_bank_scraper(scraper, bank)
+        finally:
+            _clear_cancelled()
+
+    def note_bank_time(bank):
+        # Phase timings are added to report by the bank threads; its wall time is noted here
+        if report and bank in running:
+            report.update(bank, seconds=round(time.perf_counter() - running[bank][1], 3))
+
+    def bank_ended(bank, tier):
+        finished.add(bank)
+        note_bank_time(bank)
+        tier_pending[tier] -= 1
+        if not tier_pending[tier]:
+            tier_times[tier] = time.perf_counter() - start_time
+   
+    # Browser scrapes hold a Chrome instance for up to a minute, so they get their own
+    # small pool and can't keep the cheap HTTP scrapes waiting
+    http_executor = ThreadPoolExecutor(max_workers=SCRAPER_TIERS_CONFIG['http_workers'], thread_name_prefix='scrape-http')
+    browser_executor = ThreadPoolExecutor(max_workers=SCRAPER_TIERS_CONFIG['browser_workers'], thread_name_prefix='scrape-browser')
+    executors = {'http': http_executor, 'browser': browser_executor}
 
-def process_bom_table(table, results):
-    """Process Bank of Maharashtra table"""
-    return process_generic_table(table, results)
+    try:
+        future_to_bank = {executors[tier].submit(run_watched, scraper, bank): (bank, tier)
+                          for scraper, bank, tier in scrapers}
+        pending = set(future_to_bank)
+
+        while pending:
+            # Wake up for the next completion, the run deadline or the earliest bank timeout
+            limits = [deadline_at] if deadline_at else []
+            if bank_timeout:
+                limits.extend(started + bank_timeout for bank, (_, started) in list(running.items())
+                              if bank not in finished)
+            timeout = max(0, min(limits) - time.perf_counter()) if limits else None
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                bank, tier = future_to_bank[future]
+                bank_ended(bank, tier)
+                try:
+                    records, extraction = future.result()
+                except Exception as e:
+                    print(f"❌ Failed to scrape {bank}: {str(e)}")
+                    yield bank, "failed", None, []
+                    continue
 
-def process_canara_tables(soup):
-    """Process Canara Bank tables"""
-    results = []
-    tables = soup.find_all('table')
-   
-    for table in tables:
-        process_generic_table(table, results)
-   
-    return results
+                # A bank ends as "success", "stale" (last-known-good records) or "failed";
+                # the watchdog below adds "timed_out" and "not_started" (still queued at the deadline)
+                if not records:
+                    print(f"❌ Failed to scrape {bank}: No data returned")
+                    yield bank, "failed", extraction, []
+                else:
+                    yield bank, "stale" if extraction == 'stale' else "success", extraction, records
+
+            # Watchdog: abandon banks that ran out of time, killing their browser and
+            # serving their last-known-good records if there are any
+            now = time.perf_counter()
+            for future in list(pending):
+                bank, tier = future_to_bank[future]
+                thread_id, started = running.get(bank, (None, None))
+                over_deadline = deadline_at is not None and now >= deadline_at
+                over_bank_timeout = bool(bank_timeout) and started is not None and now - started >= bank_timeout
+                if not (over_deadline or over_bank_timeout):
+                    continue
 
-def process_indian_bank_table(table, results):
-    """Process Indian Bank table"""
-    return process_generic_table(table, results)
+                pending.discard(future)
+                # A bank still queued never ran, so it gets no wall time or breaker failure
+                never_started = future.cancel()
+                bank_ended(bank, tier)
+                if thread_id is not None:
+                    # Flag the thread first so the killed browser isn't retried with a new one
+                    cancel_thread(thread_id)
+                if thread_id is not None and kill_thread_driver(thread_id):
+                    print(f"Killed the browser used by {bank}")
+                if never_started:
+                    print(f"⏱️ {bank} not started (run deadline reached)")
+                else:
+                    print(f"⏱️ {bank} timed out after {now - (started or start_time):.1f}s")
+
+                breaker = get_circuit_breaker()
+                stale_records = breaker.last_good(bank) if breaker else []
+                status = "not_started" if never_started else "timed_out"
+                yield bank, status, 'stale' if stale_records else None, stale_records
+    finally:
+        # Don't wait for abandoned scrapers; queued ones are cancelled
+        http_executor.shutdown(wait=False, cancel_futures=True)
+        browser_executor.shutdown(wait=False, cancel_futures=True)
+
+        tier_summary = ', '.join(f"{tier} tier {tier_times[tier]:.1f}s" if tier in tier_times else f"{tier} tier unfinished"
+                                 for tier in sorted(tier_pending))
+        print(f"Scraping took {time.perf_counter() - start_time:.1f}s wall time ({tier_summary})")
+
+def stream_scraped_rates(deadline=None, bank_timeout=None):
+    """Scrape all banks, persisting and yielding (bank, status, extraction, df) as each bank's scraper ends"""
+    # Create a timestamp for the saved files
+    today = datetime.today().strftime('%Y-%m-%d')
 
-def process_iob_table(table, results):
-    """Process Indian Overseas Bank table"""
-    return process_generic_table(table, results)
+    data_dir = "data"
+    os.makedirs(data_dir, exist_ok=True)
+    csv_path = os.path.join(data_dir, f"fd_rates_{today}.csv")
+    clean_csv_path = os.path.join(data_dir, f"fd_rates_clean_{today}.csv")
+    changes_csv_path = os.path.join(data_dir, f"fd_rate_changes_{today}.csv")
+    csv_started = False  # Today's files are replaced by the first bank and appended to after that
 
-def process_psb_table(table, results):
-    """Process Punjab & Sind Bank table"""
-    return process_generic_table(table, results)
+    try:
+        create_tables()
+        db_ready = True
+    except Exception as e:
+        print(f"Failed to prepare database: {str(e)}")
+        db_ready = False
 
-def process_uco_table(table, results):
-    """Process UCO Bank table"""
-    return process_generic_table(table, results)
+    # Pages fetched during the run are archived under its id for --reparse
+    archive = get_page_archive()
+    run_id = archive.begin_run() if archive else None
+    if run_id:
+        print(f"Archiving fetched pages as run {run_id}")
 
-def process_union_table(table, results):
-    """Process Union Bank table"""
-    return process_generic_table(table, results)
+    # Per-bank phase timings and counters, saved as today's run_report JSON file
+    report = RunReport()
 
-def process_generic_table(table, results):
-    """Generic table processing function"""
-    headers = [th.text.strip().lower() for th in table.find_all(['th', 'td'])]
-   
-    if any(term in ' '.join(headers) for term in ['tenure', 'period', 'rate']):
-        rows = table.find_all('tr')[1:]  # Skip header
-       
-        data_found = False
-        for row in rows:
-            cells = row.find_all(['td', 'th'])
-           
-            if len(cells) >= 2:
-                tenure = cells[0].text.strip()
-               
-                if len(tenure) < 3 or not any(c.isdigit() for c in tenure):
-                    continue
-               
-                regular_rate = clean_rate_text(cells[1].text.strip())
-                senior_rate = clean_rate_text(cells[2].text.strip()) if len(cells) > 2 else None
-               
-                tenure_days = extract_tenure_days(tenure)
-               
-                if tenure_days['min_days'] is not None and tenure_days['max_days'] is not None:
-                    results.append({
-                        'tenure_description': tenure,
-                        'min_days': tenure_days['min_days'],
-                        'max_days': tenure_days['max_days'],
-                        'regular_rate': regular_rate,
-                        'senior_rate': senior_rate,
-                        'category': 'General'
-                    })
-                    data_found = True
-       
-        return data_found
-    return False
+    # Only one bank's records are held at a time, and fresh rates are visible before the slow banks finish
+    try:
+        for bank, status, extraction, records in scrape_banks(deadline, bank_timeout, report):
+            report.update(bank, status=status, extraction=extraction)
+            if not records:
+                yield bank, status, extraction, pd.DataFrame(columns=RATE_COLUMNS)
+                continue
 
-def run_all_scrapers():
-    """Run all bank scrapers and combine the results"""
-    print("Starting FD rates scraping process...")
-   
-    # Create a timestamp for the saved files
-    today = datetime.today().strftime('%Y-%m-%d')
-   
-    # List of all scraper functions and their corresponding bank names
-    scrapers = [
-        (scrape_icici, 'ICICI Bank'),
-        (scrape_sbi, 'SBI'),
-        (scrape_kotak, 'Kotak Mahindra Bank'),
-        (scrape_axis, 'Axis Bank'),
-        (scrape_bank_of_maharashtra, 'Bank of Maharashtra'),
-        (scrape_canara_bank, 'Canara Bank'),
-        (scrape_central_bank, 'Central Bank of India'),
-        (scrape_indian_bank, 'Indian Bank')
-    ]
-   
-    results = []
-    success_status = {}
-   
-    with ThreadPoolExecutor(max_workers=5) as executor:
-        future_to_bank = {executor.submit(scraper): bank for scraper, bank in scrapers}
-       
-        for future in as_completed(future_to_bank):
-            bank = future_to_bank[future]
-            try:
-                bank_data = future.result()
-                if bank_data and len(bank_data) > 0:
-                    for record in bank_data:
-                        record['bank'] = bank
-                        record['scraped_date'] = today
-                   
-                    results.extend(bank_data)
-                    print(f"✅ Successfully scraped {bank} - Found {len(bank_data)} FD rates")
-                    success_status[bank] = "success"
-                else:
-                    print(f"❌ Failed to scrape {bank}: No data returned")
-                    success_status[bank] = "failed"
-            except Exception as e:
-                print(f"❌ Failed to scrape {bank}: {str(e)}")
-                success_status[bank] = "failed"
-   
-    # Save results to CSV
-    if results:
-        df = pd.DataFrame(results)
-       
-        # Save raw results
-        data_dir = "data"
-        os.makedirs(data_dir, exist_ok=True)
-        csv_path = os.path.join(data_dir, f"fd_rates_{today}.csv")
-        df.to_csv(csv_path, index=False)
-       
-        # Save clean version
-        clean_df = df.dropna(subset=['min_days', 'max_days', 'regular_rate'])
-        clean_csv_path = os.path.join(data_dir, f"fd_rates_clean_{today}.csv")
-        clean_df.to_csv(clean_csv_path, index=False)
-        
-        # Save directly to SQLite DB
-        try:
-            # Import sqlite3 here to avoid circular imports
-            import sqlite3
-            from pathlib import Path
-            
-            # Define the DB path
-            db_path = Path(__file__).parent / "fd_rates.db"
-            
-            # Connect to the database
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
-            
-            # Make sure table exists
-            cursor.execute('''
-            CREATE TABLE IF NOT EXISTS fd_rates (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                bank TEXT NOT NULL,
-                tenure_description TEXT NOT NULL,
-                min_days INTEGER NOT NULL,
-                max_days INTEGER NOT NULL,
-                regular_rate REAL NOT NULL,
-                senior_rate REAL,
-                category TEXT DEFAULT 'General',
-                scraped_date TEXT,
-                UNIQUE(bank, tenure_description)
-            )
-            ''')
-            
-            # Insert data into the database with conflict resolution
-            for _, row in clean_df.iterrows():
+            for record in records:
+                record['bank'] = bank
+                # Stale records keep the date they were last scraped
+                record.setdefault('scraped_date', today)
+
+            # Recompute tenure days and rates for the bank in one vectorized pass
+            df = normalize_frame(pd.DataFrame(records)).reindex(columns=RATE_COLUMNS)
+            clean_df = df.dropna(subset=['min_days', 'max_days', 'regular_rate'])
+            report.add(bank, rows_kept=len(clean_df), rows_dropped=len(df) - len(clean_df))
+
+            # Appended to today's CSV files as soon as the bank is done
+            mode = 'a' if csv_started else 'w'
+            df.to_csv(csv_path, mode=mode, header=not csv_started, index=False)
+            clean_df.to_csv(clean_csv_path, mode=mode, header=not csv_started, index=False)
+            csv_started = True
+
+            saved = "not saved"
+            changes = []
+            if db_ready:
                 try:
-                    cursor.execute('''
-                    INSERT OR REPLACE INTO fd_rates 
-                    (bank, tenure_description, min_days, max_days, regular_rate, senior_rate, category, scraped_date)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (
-                        row['bank'], 
-                        row['tenure_description'], 
-                        row['min_days'], 
-                        row['max_days'], 
-                        row['regular_rate'],
-                        row.get('senior_rate'),
-                        row.get('category', 'General'),
-                        row.get('scraped_date', today)
-                    ))
+                    # Only the added, changed and removed tenures are written to the database and
+                    # today's fd_rate_changes file. Only a complete, fresh scrape can tell that a
+                    # tenure was withdrawn
+                    change_set = diff_bank_rates(bank, clean_df, remove_missing=(status == "success"))
+                    apply_rate_changes(bank, change_set)
+                    changes = change_set['changes']
+                    counts = {change: sum(1 for c in changes if c['change'] == change) for change in ('added', 'changed', 'removed')}
+                    saved = f"{counts['added']} added, {counts['changed']} changed, {counts['removed']} removed"
+                    report.update(bank, changes=counts)
                 except Exception as e:
-                    print(f"Error inserting row into database: {str(e)}")
-            
-            # Commit changes and close connection
-            conn.commit()
-            conn.close()
-            print(f"Successfully saved {len(clean_df)} records to database")
-        except Exception as e:
-            print(f"Failed to save to database: {str(e)}")
-       
+                    print(f"Failed to save {bank} to database: {str(e)}")
+
+            if changes:
+                changes_df = pd.DataFrame(changes).reindex(columns=CHANGE_FILE_COLUMNS)
+                changes_df = changes_df.astype({column: 'Int64' for column in CHANGE_FILE_COLUMNS if column.endswith('_days')})
+                # Changes from every run of the day accumulate in one file
+                changes_df.to_csv(changes_csv_path, mode='a', header=not os.path.exists(changes_csv_path), index=False)
+            df.attrs['changes'] = changes
+
+            if extraction == 'stale':
+                print(f"⚠️ Using last-known-good data for {bank} - {len(df)} FD rates ({saved})")
+            else:
+                print(f"✅ Successfully scraped {bank} - Found {len(df)} FD rates ({saved})")
+            yield bank, status, extraction, df
+    finally:
+        if archive:
+            archive.end_run()
+        report.finish()
+        try:
+            print(f"Run report saved to {report.save(data_dir, today)}")
+        except OSError as e:
+            print(f"Failed to save run report: {str(e)}")
+
+def run_all_scrapers(deadline=None, bank_timeout=None, profile=None, combine=False):
+    """Run all bank scrapers and return a summary of the run (with the combined rates under 'df' when combine is set)"""
+    # With profile (default PROFILING_CONFIG['scraper']) the run is sampled into a profile file
+    if profile is None:
+        profile = PROFILING_CONFIG['scraper']
+    if profile:
+        with profiled('scraper', 'run_all_scrapers'):
+            return _run_all_scrapers(deadline, bank_timeout, combine)
+    return _run_all_scrapers(deadline, bank_timeout, combine)
+
+def _run_all_scrapers(deadline, bank_timeout, combine):
+    print("Starting FD rates scraping process...")
+    start_time = time.perf_counter()
+
+    # Banks are persisted one by one as they finish, so only their row counts are kept
+    # unless the caller wants the combined frame for reporting and plotting
+    frames = []
+    rows = 0
+    success_status = {}
+    extraction_status = {}
+    change_counts = {}
+
+    for bank, status, extraction, bank_df in stream_scraped_rates(deadline, bank_timeout):
+        success_status[bank] = status
+        for change in bank_df.attrs.get('changes', []):
+            counts = change_counts.setdefault(bank, {'added': 0, 'changed': 0, 'removed': 0})
+            counts[change['change']] += 1
+        if not bank_df.empty:
+            extraction_status[bank] = extraction
+            rows += len(bank_df)
+            if combine:
+                frames.append(bank_df)
+
+    wall_time = time.perf_counter() - start_time
+
+    if rows:
         # Print summary
         print("\nScraping Summary:")
         successful_banks = [bank for bank, status in success_status.items() if status == "success"]
         failed_banks = [bank for bank, status in success_status.items() if status == "failed"]
+        stale_banks = [bank for bank, status in success_status.items() if status == "stale"]
+        timed_out_banks = [bank for bank, status in success_status.items() if status == "timed_out"]
+        not_started_banks = [bank for bank, status in success_status.items() if status == "not_started"]
        
         if successful_banks:
             print(f"✅ Successfully scraped: {', '.join(successful_banks)}")
+        if stale_banks:
+            print(f"⚠️ Stale (last-known-good) data for: {', '.join(stale_banks)}")
         if failed_banks:
             print(f"❌ Failed to scrape: {', '.join(failed_banks)}")
-       
-        return df
+        if timed_out_banks:
+            print(f"⏱️ Timed out: {', '.join(timed_out_banks)}")
+        if not_started_banks:
+            print(f"⏱️ Not started (run deadline reached): {', '.join(not_started_banks)}")
+
+        print("Extraction by bank:")
+        for bank, extraction in extraction_status.items():
+            print(f"   {bank}: {extraction or 'unknown'}")
+        print(f"Total scrape wall time: {wall_time:.1f}s")
+        if change_counts:
+            print("Rate changes by bank:")
+            for bank, counts in change_counts.items():
+                print(f"   {bank}: {counts['added']} added, {counts['changed']} changed, {counts['removed']} removed")
+        else:
+            print("No rate changes since the last run")
     else:
         print("No data was scraped from any bank.")
-        return pd.DataFrame()
+
+    summary = {
+        'rows': rows,
+        'bank_status': success_status,
+        'extraction_status': extraction_status,
+        # Banks whose stored rates changed, for invalidating anything derived from them
+        'changes': change_counts,
+        'wall_time': wall_time
+    }
+    if combine:
+        summary['df'] = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=RATE_COLUMNS)
+    return summary
+
+def _reparse_page(archive, entry):
+    html_content = archive.load_page(entry['sha256'])
+    records, _, _ = run_parse(extract_records, extractor_from_spec(entry['extractor']), entry['url'], html_content)
+    return records
+
+def reparse_run(run_id, save=False):
+    """Extract an archived run's pages again with the current extractors, without fetching anything"""
+    # Banks served stale in the original run weren't fetched, so they aren't in the archive
+    archive = get_page_archive()
+    if archive is None:
+        raise RuntimeError("Page archive is disabled")
+    manifest = archive.manifest(run_id)
+    run_id = manifest['run_id']
+    pages = manifest['pages']
+    # An older run's rates would overwrite newer stored ones
+    if save and run_id != archive.runs()[-1]:
+        raise RuntimeError(f"--save only applies to the latest archived run, not {run_id}")
+    print(f"Re-extracting {len(pages)} archived pages from run {run_id}...")
+    start_time = time.perf_counter()
+
+    # Pages are re-extracted in parallel through the parser pool
+    with ThreadPoolExecutor(max_workers=max(1, PARSE_POOL_CONFIG['processes'])) as executor:
+        futures = [executor.submit(_reparse_page, archive, entry) for entry in pages]
+
+        # As in a scrape, each bank takes the records of the first of its pages that yields data
+        bank_records = {}
+        for entry, future in zip(pages, futures):
+            try:
+                records = future.result()
+            except Exception as e:
+                print(f"Error re-extracting {entry['bank']} page {entry['url']}: {str(e)}")
+                continue
+            if records and entry['bank'] not in bank_records:
+                bank_records[entry['bank']] = records
+
+    scraped_date = run_id[:10]
+    frames = []
+    for bank in dict.fromkeys(entry['bank'] for entry in pages):
+        records = bank_records.get(bank)
+        if not records:
+            print(f"❌ No data re-extracted for {bank}")
+            continue
+
+        for record in records:
+            record['bank'] = bank
+            record['scraped_date'] = scraped_date
+        df = normalize_frame(pd.DataFrame(records)).reindex(columns=RATE_COLUMNS)
+        old_count = max(entry['records'] for entry in pages if entry['bank'] == bank)
+        print(f"✅ {bank}: {len(df)} FD rates (run had {old_count})")
+        frames.append(df)
+
+        if save:
+            clean_df = df.dropna(subset=['min_days', 'max_days', 'regular_rate'])
+            # The run may have missed pages, so tenures it lacks aren't treated as withdrawn
+            change_set = diff_bank_rates(bank, clean_df, remove_missing=False)
+            apply_rate_changes(bank, change_set)
+            print(f"   {len(change_set['changes'])} changes saved to the database")
+
+    df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=RATE_COLUMNS)
+    os.makedirs("data", exist_ok=True)
+    csv_path = os.path.join("data", f"fd_rates_reparsed_{run_id}.csv")
+    df.to_csv(csv_path, index=False)
+    print(f"Re-extracted {len(df)} FD rates for {len(frames)} banks in {time.perf_counter() - start_time:.1f}s -> {csv_path}")
+    return df
 
 def plot_best_rates(df, n=8, for_seniors=False):
     """Plot the top N best FD rates across banks"""
@@ -1858,10 +1150,29 @@ def generate_summary_report(df):
     return summary_df
 
 if __name__ == "__main__":
-    # Run the scraper
-    df = run_all_scrapers()
+    parser = argparse.ArgumentParser(description='Scrape FD rates from all banks')
+    parser.add_argument('--reparse', metavar='RUN',
+                        help='re-extract an archived run ("latest" for the most recent) instead of scraping')
+    parser.add_argument('--save', action='store_true', help='with --reparse of the latest run, write the re-extracted rates to the database')
+    parser.add_argument('--list-runs', action='store_true', help='list the archived runs')
+    args = parser.parse_args()
+
+    if args.list_runs:
+        archive = get_page_archive()
+        for run_id in (archive.runs() if archive else []):
+            print(run_id)
+        sys.exit(0)
+    if args.reparse:
+        try:
+            reparse_run(args.reparse, save=args.save)
+        except (FileNotFoundError, RuntimeError) as e:
+            parser.error(str(e))
+        sys.exit(0)
+
+    # Run the scraper, keeping the combined rates for the report and plots
+    df = run_all_scrapers(combine=True)['df']
 
-    if df is not None:
+    if not df.empty:
         # Display detailed data by bank
         print("\nDetailed FD Rates by Bank:")
         for bank in df['bank'].unique():
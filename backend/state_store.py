@@ -0,0 +1,74 @@
+import atexit
+import json
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+def write_atomic(path, data):
+    """Write bytes to path through a temporary file, so readers never see a partial file"""
+    # Thread ids repeat across processes, and the API, the CLI and parser workers share these files
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+class JsonStateStore:
+    """A dict of state kept in memory and persisted whole to one JSON file.
+
+    Subclasses change self._data while holding self._lock and then call
+    _save(); a missing or unreadable file starts out empty.
+    """
+
+    # What the file holds, for log messages
+    description = 'state'
+    indent = None
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._data = self._read()
+
+    def _read(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self):
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            write_atomic(self.path, json.dumps(self._data, indent=self.indent).encode('utf-8'))
+        except OSError as e:
+            logger.warning(f"Failed to save {self.description}: {str(e)}")
+
+class ProcessSingleton:
+    """Creates an object on first use and hands the same one to every thread after that"""
+
+    def __init__(self, factory, close=None):
+        self._factory = factory
+        # Called with the object at interpreter exit
+        self._close = close
+        self._instance = None
+        self._lock = threading.Lock()
+
+    def get(self, *args):
+        """The object, created from factory(*args) on the first call"""
+        with self._lock:
+            if self._instance is None:
+                self._instance = self._factory(*args)
+                if self._close:
+                    atexit.register(self._close, self._instance)
+            return self._instance
+
+    def peek(self):
+        """The object if it was created, without creating it"""
+        return self._instance
+
+    def reset(self, instance):
+        """Drop instance (if it is still the current object) so the next get() creates a new one"""
+        with self._lock:
+            if self._instance is instance:
+                self._instance = None
@@ -0,0 +1,56 @@
+import hashlib
+from datetime import datetime
+from state_store import JsonStateStore, ProcessSingleton
+from config import TABLE_LOCATOR_CONFIG
+
+def table_fingerprint(matrix, header_row, tenure_column):
+    """Hash of a table's header rows and width, which stay put while the rates in it change.
+
+    A table without a header row is identified by the tenure in its first
+    row instead, so that not every table of the same width matches.
+    """
+    if header_row < 0:
+        first_row = matrix.rows[0] if matrix.rows else []
+        header_text = first_row[tenure_column] if tenure_column < len(first_row) else ''
+    else:
+        header_text = '|'.join(matrix.row_text[:header_row + 1])
+    width = max((len(row) for row in matrix.rows), default=0)
+    return hashlib.sha1(f"{width}|{header_text}".encode('utf-8')).hexdigest()
+
+class TableLocatorStore(JsonStateStore):
+    """Per-bank locator of where its FD rates were last found.
+
+    A locator always has the ``url`` that yielded data. When the records
+    came from a single table with fixed columns it also has ``table_index``,
+    ``fingerprint``, ``header_row``, the ``tenure_column``, ``regular_column``
+    and ``senior_column`` indices and ``require_rate``.
+    """
+
+    description = 'table locators'
+    indent = 2
+
+    def __init__(self, path=None):
+        super().__init__(path or TABLE_LOCATOR_CONFIG['path'])
+
+    def get(self, bank_name):
+        with self._lock:
+            locator = self._data.get(bank_name)
+        return dict(locator) if locator else None
+
+    def url(self, bank_name):
+        """URL that last yielded data for this bank, or None"""
+        locator = self.get(bank_name)
+        return locator['url'] if locator else None
+
+    def store(self, bank_name, locator):
+        with self._lock:
+            self._data[bank_name] = dict(locator, updated_at=datetime.utcnow().isoformat())
+            self._save()
+
+_store = ProcessSingleton(TableLocatorStore)
+
+def get_table_locator_store():
+    """Return the process-wide table locator store, or None when locators are disabled"""
+    if not TABLE_LOCATOR_CONFIG['enabled']:
+        return None
+    return _store.get()
@@ -0,0 +1,82 @@
+# Cap on rowspan/colspan so a malformed attribute can't blow up the grid
+MAX_SPAN = 100
+
+def _span(cell, attribute):
+    try:
+        span = int(str(cell.get(attribute, 1)).strip())
+    except ValueError:
+        return 1
+    return min(max(span, 1), MAX_SPAN)
+
+def _take_carried(values, carried, next_carried):
+    """Append cells carried down from rows above for as long as they fill the next column"""
+    while len(values) in carried:
+        rows_left, text = carried[len(values)]
+        if rows_left > 1:
+            next_carried[len(values)] = (rows_left - 1, text)
+        values.append(text)
+
+def table_to_matrix(table, header_cells=None):
+    """Turn a <table> into a list of rows of stripped cell text, expanding rowspan and colspan.
+
+    Every <tr> in the table produces one row (empty rows included) so row
+    indices line up with ``table.find_all('tr')``. If ``header_cells`` is a
+    list, the lowercased text of each <th> is appended to it on the way.
+    """
+    matrix = []
+    carried = {}  # column -> (rows left, text) for cells spanning down
+
+    for row in table.find_all('tr'):
+        values = []
+        next_carried = {}
+
+        for cell in row.find_all(['td', 'th'], recursive=False):
+            _take_carried(values, carried, next_carried)
+
+            text = cell.get_text().strip()
+            if header_cells is not None and cell.name == 'th':
+                header_cells.append(text.lower())
+            rowspan = _span(cell, 'rowspan')
+            for _ in range(_span(cell, 'colspan')):
+                if rowspan > 1:
+                    next_carried[len(values)] = (rowspan - 1, text)
+                values.append(text)
+
+        # Cells spanning into columns past the end of this row's own cells
+        if carried:
+            last_column = max(carried)
+            while len(values) <= last_column:
+                if len(values) in carried:
+                    _take_carried(values, carried, next_carried)
+                else:
+                    values.append('')
+
+        matrix.append(values)
+        carried = next_carried
+
+    return matrix
+
+class TableMatrix:
+    """Plain-text view of an HTML table built in a single walk over its rows.
+
+    ``rows`` holds the stripped cell text, ``lower`` the same lowercased and
+    ``row_text`` each lowercased row joined with spaces, so keyword checks
+    don't have to touch the soup or re-join strings.
+    """
+
+    def __init__(self, rows, header_cells=None):
+        self.rows = rows
+        self.lower = [[value.lower() for value in row] for row in rows]
+        self.row_text = [' '.join(row) for row in self.lower]
+        self.text = ' '.join(self.row_text)
+        # Lowercased text of the <th> cells only
+        self.header_cells = header_cells or []
+
+    @classmethod
+    def from_table(cls, table):
+        header_cells = []
+        rows = table_to_matrix(table, header_cells)
+        return cls(rows, header_cells)
+
+    def __len__(self):
+        return len(self.rows)
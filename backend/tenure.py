@@ -0,0 +1,225 @@
+import argparse
+import csv
+import glob
+import os
+import re
+import sys
+import time
+from functools import lru_cache
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+GOLDEN_PATH = os.path.join(BASE_DIR, 'data', 'tenure_golden.csv')
+GOLDEN_COLUMNS = ['tenure_description', 'min_days', 'max_days', 'source', 'legacy_min_days', 'legacy_max_days']
+
+# Days per unit used when converting tenure descriptions
+UNIT_DAYS = {'d': 1, 'm': 30, 'y': 365}
+
+# One alternation walked once per description. Longer phrases come before the
+# shorter ones they contain ("less than or equal to" before "less than",
+# "and above" before "and").
+TENURE_TOKEN_RE = re.compile(r'''
+    (?P<num>\d+(?:\.\d+)?)\s*(?:(?P<unit>days?|months?|mths?|years?|yrs?)\b)?
+  | (?P<le><=|≤|\bless\s+than\s+(?:or\s+)?equal\s+to\b|\bup\s*to\b|\btill\b|\bnot\s+exceeding\b)
+  | (?P<ge>>=|≥|\bgreater\s+than\s+or\s+equal\s+to\b|(?:\band|&)\s*above\b|\bor\s+more\b|\bonwards\b)
+  | (?P<lt><|\bless\s+than\b|\bbelow\b|\bunder\b)
+  | (?P<gt>>|\bmore\s+than\b|\bgreater\s+than\b|\babove\b|\bover\b|\bexceeding\b|\bbeyond\b)
+  | (?P<sep>\bto\b|\band\b|[-–—()])
+''', re.X)
+
+# A parenthesised part restates the tenure in other units: "15 months (456 days)"
+PAREN_RE = re.compile(r'\(([^()]*)\)')
+
+INTEGER_RE = re.compile(r'\d+')
+WHITESPACE_RE = re.compile(r'\s+')
+
+# Upper bound assumed for open-ended tenures such as "above 5 years"
+OPEN_ENDED_EXTRA_DAYS = 365
+
+def _tokenize(text):
+    """Group a normalized description into quantities.
+
+    Each quantity is a dict with ``value`` (days, or the bare number when
+    no unit was given), ``unit`` (days per unit of its first part, or None)
+    and ``cmp`` (the comparator that applies to it: lt, le, gt, ge or None).
+    """
+    quantities = []
+    pending = None       # Comparator waiting for the next quantity
+    extendable = False   # Whether another unit amount adds to the last quantity ("1 year 10 days")
+
+    for match in TENURE_TOKEN_RE.finditer(text):
+        kind = 'num' if match.group('num') else match.lastgroup
+
+        if kind == 'num':
+            value = float(match.group('num'))
+            unit = match.group('unit')
+            if unit and extendable:
+                quantities[-1]['value'] += value * UNIT_DAYS[unit[0]]
+            elif unit:
+                quantities.append({'value': value * UNIT_DAYS[unit[0]], 'unit': UNIT_DAYS[unit[0]], 'cmp': pending})
+                pending = None
+            else:
+                quantities.append({'value': value, 'unit': None, 'cmp': pending})
+                pending = None
+            extendable = bool(unit)
+        elif kind == 'ge' and quantities and pending is None:
+            # "181 days and above" qualifies the quantity before it
+            quantities[-1]['cmp'] = 'ge'
+            extendable = False
+        elif kind == 'sep':
+            extendable = False
+        else:
+            pending = kind
+            extendable = False
+
+    # "7 to 45 days": a bare number takes the unit of the quantity right after it
+    for i in range(len(quantities) - 2, -1, -1):
+        if quantities[i]['unit'] is None and quantities[i + 1]['unit'] is not None:
+            quantities[i]['unit'] = quantities[i + 1]['unit']
+            quantities[i]['value'] *= quantities[i]['unit']
+
+    return quantities
+
+def _quantities(text):
+    return [q for q in _tokenize(text) if q['unit'] is not None]
+
+@lru_cache(maxsize=8192)
+def parse_tenure(text):
+    """Parse a normalized tenure description into a (min_days, max_days) tuple"""
+    # The text outside parentheses and each parenthesised part are alternative forms of
+    # the same tenure, never amounts to add up; one given in days is exact, so it wins
+    outside = PAREN_RE.sub(' ', text)
+    forms = [quantities for quantities in map(_quantities, [outside] + PAREN_RE.findall(text)) if quantities]
+    quantities = next((form for form in forms if all(q['unit'] == 1 for q in form)), forms[0] if forms else [])
+
+    if not quantities:
+        # No recognisable unit: fall back to the first one or two numbers as days
+        numbers = INTEGER_RE.findall(outside) or INTEGER_RE.findall(text)
+        if len(numbers) >= 2:
+            return int(numbers[0]), int(numbers[1])
+        if numbers:
+            return int(numbers[0]), int(numbers[0])
+        return None, None
+
+    low = quantities[0]
+    low_days = int(round(low['value']))
+
+    if len(quantities) == 1:
+        if low['cmp'] == 'lt':
+            return 1, low_days - 1
+        if low['cmp'] == 'le':
+            return 1, low_days
+        if low['cmp'] == 'gt':
+            return low_days + 1, low_days + OPEN_ENDED_EXTRA_DAYS
+        if low['cmp'] == 'ge':
+            return low_days, low_days + OPEN_ENDED_EXTRA_DAYS
+        return low_days, low_days
+
+    high = quantities[1]
+    high_days = int(round(high['value']))
+    min_days = low_days + 1 if low['cmp'] == 'gt' else low_days
+    max_days = high_days - 1 if high['cmp'] == 'lt' else high_days
+    return min(min_days, max_days), max(min_days, max_days)
+
+def normalize_tenure(tenure_text):
+    return WHITESPACE_RE.sub(' ', tenure_text.lower()).strip()
+
+def extract_tenure_days(tenure_text):
+    """Extract minimum and maximum days from tenure description"""
+    if not tenure_text or not isinstance(tenure_text, str):
+        return {'min_days': None, 'max_days': None}
+
+    min_days, max_days = parse_tenure(normalize_tenure(tenure_text))
+    return {'min_days': min_days, 'max_days': max_days}
+
+def build_golden_corpus(csv_pattern=None):
+    """Unique tenure descriptions from the archived fd_rates CSVs with their legacy values"""
+    csv_pattern = csv_pattern or os.path.join(BASE_DIR, '..', 'data', 'fd_rates_*.csv')
+    corpus = {}
+    for path in sorted(glob.glob(csv_pattern)):
+        with open(path, newline='', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                tenure = row.get('tenure_description')
+                if tenure and tenure not in corpus:
+                    corpus[tenure] = (row.get('min_days'), row.get('max_days'))
+    return corpus
+
+def read_golden(path=GOLDEN_PATH):
+    try:
+        with open(path, newline='', encoding='utf-8') as f:
+            return list(csv.DictReader(f))
+    except OSError:
+        return []
+
+def write_golden(path=GOLDEN_PATH):
+    """Add the tenure descriptions of the archived CSVs that the golden corpus doesn't have yet.
+
+    Expected values never come from the current parser: a new description
+    starts from its legacy values (source "legacy"), and rows whose values
+    were checked and corrected by hand (source "manual") are kept as they are.
+    """
+    rows = read_golden(path)
+    known = {row['tenure_description'] for row in rows}
+    added = 0
+    for tenure, (legacy_min, legacy_max) in sorted(build_golden_corpus().items()):
+        if tenure not in known:
+            rows.append({'tenure_description': tenure, 'min_days': legacy_min, 'max_days': legacy_max,
+                         'source': 'legacy', 'legacy_min_days': legacy_min, 'legacy_max_days': legacy_max})
+            added += 1
+
+    rows.sort(key=lambda row: row['tenure_description'])
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=GOLDEN_COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
+    print(f"Added {added} tenure descriptions to {path}; review their legacy values by hand")
+
+def check_golden(path=GOLDEN_PATH):
+    """Compare the parser against the golden corpus, returning the number of mismatches"""
+    mismatches = 0
+    rows = read_golden(path)
+
+    for row in rows:
+        expected = (row['min_days'] or None, row['max_days'] or None)
+        result = extract_tenure_days(row['tenure_description'])
+        actual = tuple(str(v) if v is not None else None for v in (result['min_days'], result['max_days']))
+        if actual != expected:
+            mismatches += 1
+            print(f"MISMATCH {row['tenure_description']!r}: expected {expected}, got {actual}")
+
+    print(f"{len(rows) - mismatches}/{len(rows)} golden tenure descriptions match")
+    return mismatches
+
+def benchmark(repeat=200):
+    """Measure parses per second over the golden corpus, cold (cache cleared) and warm"""
+    tenures = list(build_golden_corpus()) or ['1 year to 2 years']
+    total = len(tenures) * repeat
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        parse_tenure.cache_clear()
+        for tenure in tenures:
+            extract_tenure_days(tenure)
+    cold = total / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for tenure in tenures:
+            extract_tenure_days(tenure)
+    warm = total / (time.perf_counter() - start)
+
+    print(f"{len(tenures)} descriptions x {repeat}: {cold:,.0f} parses/s uncached, {warm:,.0f} parses/s cached")
+    print(f"Cache: {parse_tenure.cache_info()}")
+    return cold, warm
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Tenure parser golden corpus and benchmark')
+    parser.add_argument('--write-golden', action='store_true', help='add new descriptions from the archived CSVs to the golden corpus')
+    parser.add_argument('--bench', action='store_true', help='run the throughput benchmark')
+    args = parser.parse_args()
+
+    if args.write_golden:
+        write_golden()
+    if args.bench:
+        benchmark()
+    if not args.write_golden and not args.bench:
+        sys.exit(1 if check_golden() else 0)